@@ -1,7 +1,9 @@
 from datetime import datetime
 from enum import Enum
-from typing import Any, Dict, Generic, List, Optional, TypeVar
+from typing import Any, Dict, Generic, List, Optional, Tuple, TypeVar
 
+from sqlalchemy import select, tuple_
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.orm import Session
 
 from Identifier_management.enums.base_change_reason_enum import BaseChangeReasonEnum
@@ -30,24 +32,23 @@ class GenericOperationsManager(Generic[TIdentifierType, TSecurityEntity]):
     def get_current_identifier(self, entity_id: int, identifier_type: TIdentifierType) -> Optional[str]:
         """Get current active identifier value for an entity"""
         entity_id_field = self._get_entity_id_field()
-        snapshot = self.session.query(self.snapshot_model).filter(
+        # Project the one value out of the snapshot JSON in SQL rather than loading the row and its whole document
+        return self.session.query(
+            self.snapshot_model.identifiers[identifier_type.value]['value'].astext
+        ).filter(
             getattr(self.snapshot_model, entity_id_field) == entity_id
-        ).first()
-
-        if snapshot and snapshot.identifiers:
-            id_data = snapshot.identifiers.get(identifier_type.value)
-            return id_data['value'] if id_data else None
-        return None
+        ).scalar()
 
     def get_all_current_identifiers(self, entity_id: int) -> Dict[str, str]:
         """Get all current active identifiers for an entity"""
         entity_id_field = self._get_entity_id_field()
-        snapshot = self.session.query(self.snapshot_model).filter(
-            getattr(self.snapshot_model, entity_id_field) == entity_id
-        ).first()
+        # Only the JSON column is selected, so no snapshot object is built or tracked by the session
+        identifiers = self.session.execute(
+            select(self.snapshot_model.identifiers).where(getattr(self.snapshot_model, entity_id_field) == entity_id)
+        ).scalar_one_or_none()
 
-        if snapshot and snapshot.identifiers:
-            return {k: v['value'] for k, v in snapshot.identifiers.items()}
+        if identifiers:
+            return {k: v['value'] for k, v in identifiers.items()}
         return {}
 
     def find_entity_by_identifier(self, identifier_type: TIdentifierType, value: str):
@@ -86,12 +87,48 @@ class GenericOperationsManager(Generic[TIdentifierType, TSecurityEntity]):
 
         return None
 
+    def find_entities_by_identifiers(self, pairs: List[Tuple[TIdentifierType, str]]) -> Dict[Tuple, Any]:
+        """
+        Resolve many (identifier type, value) pairs to entities with one query.
+
+        Matches current active identifiers in the history table with a single (type, value) IN filter joined to the
+        entity, instead of one find_entity_by_identifier round-trip per pair.
+
+        Args:
+            pairs: (identifier type, value) pairs; values are normalized as in find_entity_by_identifier
+
+        Returns:
+            Dictionary keyed by each requested pair, mapping to its entity or None if nothing matches
+        """
+        if not pairs:
+            return {}
+
+        normalized = {pair: (pair[0].value, pair[1].strip().upper()) for pair in pairs}
+        history_model = self.version_manager.history_model
+        entity_id_column = getattr(history_model, self.version_manager._get_entity_id_field())
+
+        rows = self.session.query(history_model.identifier_type, history_model.identifier_value,
+                                  self.entity_model).join(
+            self.entity_model, self.entity_model.id == entity_id_column
+        ).filter(
+            tuple_(history_model.identifier_type, history_model.identifier_value).in_(set(normalized.values())),
+            history_model.effective_to.is_(None),
+            history_model.status == BaseIdentifierStatusEnum.ACTIVE.value
+        ).all()
+
+        found = {(identifier_type, value): entity for identifier_type, value, entity in rows}
+        return {pair: found.get(key) for pair, key in normalized.items()}
+
     def search_identifiers(self, search_term: str,
                            identifier_types: Optional[List[TIdentifierType]] = None) -> List[Dict[str, Any]]:
         """Search for identifiers matching a term across multiple types"""
         search_term = search_term.strip().upper()
         results = []
 
+        # Stored type strings are matched against the requested members' values with one hashed lookup each
+        wanted_types = {identifier_type.value for identifier_type in identifier_types} if identifier_types else None
+        entity_id_field = self._get_entity_id_field()
+
         # Search in snapshots for current identifiers
         snapshots = self.session.query(self.snapshot_model).all()
 
@@ -99,18 +136,12 @@ class GenericOperationsManager(Generic[TIdentifierType, TSecurityEntity]):
             if not snapshot.identifiers:
                 continue
 
-            entity_id_field = self._get_entity_id_field()
             entity_id = getattr(snapshot, entity_id_field)
 
             for id_type, id_data in snapshot.identifiers.items():
                 # Filter by identifier types if specified
-                if identifier_types:
-                    try:
-                        enum_type = self.identifier_enum_class(id_type)
-                        if enum_type not in identifier_types:
-                            continue
-                    except ValueError:
-                        continue
+                if wanted_types is not None and id_type not in wanted_types:
+                    continue
 
                 if search_term in id_data['value'].upper():
                     results.append({
@@ -157,6 +188,104 @@ class GenericOperationsManager(Generic[TIdentifierType, TSecurityEntity]):
         self.rebuild_identifier_snapshot(entity_id)
         self.session.commit()
 
+    def bulk_add_identifiers_many(self, identifiers_by_entity: Dict[int, Dict[TIdentifierType, str]],
+                                  created_by: str, source: str = None, reason=None):
+        """
+        Add identifiers to many entities in a single transaction.
+
+        History rows for every entity go out in one bulk insert and the snapshots are written with one upsert,
+        instead of a query, insert and commit per entity. Identifiers an entity already has are skipped, as in
+        bulk_add_identifiers.
+
+        Args:
+            identifiers_by_entity: Identifiers to add, keyed by entity ID
+            created_by: User recorded as creator and approver of the new versions
+            source: Optional data source of the identifiers
+            reason: Change reason, defaults to INITIAL_ASSIGNMENT
+        """
+        if reason is None:
+            reason = BaseChangeReasonEnum.INITIAL_ASSIGNMENT
+
+        history_model = self.version_manager.history_model
+        history_entity_field = self.version_manager._get_entity_id_field()
+        entity_ids = [entity_id for entity_id, identifiers in identifiers_by_entity.items() if identifiers]
+        if not entity_ids:
+            return
+
+        # One query for the identifiers that already exist across all entities
+        existing = set(self.session.query(getattr(history_model, history_entity_field),
+                                          history_model.identifier_type).filter(
+            getattr(history_model, history_entity_field).in_(entity_ids),
+            history_model.effective_to.is_(None),
+            history_model.status == BaseIdentifierStatusEnum.ACTIVE.value
+        ))
+
+        now = datetime.now()
+        mappings = [
+            {
+                history_entity_field: entity_id,
+                'identifier_type': identifier_type.value,
+                'identifier_value': value.strip().upper(),
+                'version': 1,
+                'effective_from': now,
+                'status': BaseIdentifierStatusEnum.ACTIVE.value,
+                'change_reason': reason.value if hasattr(reason, 'value') else reason,
+                'change_description': f"Initial assignment of {identifier_type.value}",
+                'created_by': created_by,
+                'approved_by': created_by,
+                'approved_at': now,
+                'source': source
+            }
+            for entity_id in entity_ids
+            for identifier_type, value in identifiers_by_entity[entity_id].items()
+            if value and (entity_id, identifier_type.value) not in existing
+        ]
+        self.session.bulk_insert_mappings(history_model, mappings)
+
+        current_identifiers = self.session.query(history_model).filter(
+            getattr(history_model, history_entity_field).in_(entity_ids),
+            history_model.effective_to.is_(None),
+            history_model.status == BaseIdentifierStatusEnum.ACTIVE.value
+        ).all()
+
+        records_by_entity = {entity_id: [] for entity_id in entity_ids}
+        for record in current_identifiers:
+            records_by_entity[getattr(record, history_entity_field)].append(record)
+
+        entity_id_field = self._get_entity_id_field()
+        snapshot_rows = []
+        for entity_id, records in records_by_entity.items():
+            primary = self._primary_identifier(records)
+            snapshot_rows.append({
+                entity_id_field: entity_id,
+                'identifiers': self._snapshot_identifiers(records),
+                'primary_identifier_type': primary.identifier_type if primary else None,
+                'primary_identifier_value': primary.identifier_value if primary else None,
+                'snapshot_version': 1,
+                'last_updated': now
+            })
+
+        upsert = insert(self.snapshot_model).values(snapshot_rows)
+        self.session.execute(upsert.on_conflict_do_update(
+            index_elements=[entity_id_field],
+            set_={
+                'identifiers': upsert.excluded.identifiers,
+                'primary_identifier_type': upsert.excluded.primary_identifier_type,
+                'primary_identifier_value': upsert.excluded.primary_identifier_value,
+                'snapshot_version': self.snapshot_model.snapshot_version + 1,
+                'last_updated': upsert.excluded.last_updated
+            }
+        ))
+
+        # Update entity primary symbol cache if applicable
+        if hasattr(self.entity_model, 'primary_symbol'):
+            self.session.bulk_update_mappings(self.entity_model, [
+                {'id': row[entity_id_field], 'primary_symbol': row['primary_identifier_value']}
+                for row in snapshot_rows if row['primary_identifier_value']
+            ])
+
+        self.session.commit()
+
     def rebuild_identifier_snapshot(self, entity_id: int):
         """Rebuild snapshot from historical records for a specific entity"""
         entity_id_field = self._get_entity_id_field()
@@ -176,23 +305,9 @@ class GenericOperationsManager(Generic[TIdentifierType, TSecurityEntity]):
             self.version_manager.history_model.status == BaseIdentifierStatusEnum.ACTIVE.value
         ).all()
 
-        snapshot.identifiers = {
-            record.identifier_type: {
-                'value': record.identifier_value,
-                'version': record.version,
-                'effective_from': record.effective_from.isoformat(),
-                'source': getattr(record, 'source', None),
-                'exchange_mic': getattr(record, 'exchange_mic', None),
-                'currency': getattr(record, 'currency', None),
-                'confidence_level': getattr(record, 'confidence_level', None)
-            } for record in current_identifiers
-        }
-
-        # Set primary identifier (business logic can be customized)
-        primary = next((r for r in current_identifiers if r.identifier_type == 'TICKER'), None)
-        if not primary:
-            primary = next((r for r in current_identifiers if r.identifier_type == 'ISIN'), None)
+        snapshot.identifiers = self._snapshot_identifiers(current_identifiers)
 
+        primary = self._primary_identifier(current_identifiers)
         if primary:
             snapshot.primary_identifier_type = primary.identifier_type
             snapshot.primary_identifier_value = primary.identifier_value
@@ -303,6 +418,29 @@ class GenericOperationsManager(Generic[TIdentifierType, TSecurityEntity]):
         self.session.commit()
         return cleanup_stats
 
+    @staticmethod
+    def _snapshot_identifiers(records) -> Dict[str, Dict[str, Any]]:
+        """Snapshot JSON for an entity's current identifier records, keyed by identifier type"""
+        return {
+            record.identifier_type: {
+                'value': record.identifier_value,
+                'version': record.version,
+                'effective_from': record.effective_from.isoformat(),
+                'source': getattr(record, 'source', None),
+                'exchange_mic': getattr(record, 'exchange_mic', None),
+                'currency': getattr(record, 'currency', None),
+                'confidence_level': getattr(record, 'confidence_level', None)
+            } for record in records
+        }
+
+    @staticmethod
+    def _primary_identifier(records):
+        """Primary identifier record for the snapshot (business logic can be customized)"""
+        primary = next((r for r in records if r.identifier_type == 'TICKER'), None)
+        if not primary:
+            primary = next((r for r in records if r.identifier_type == 'ISIN'), None)
+        return primary
+
     def _get_entity_id_field(self) -> str:
         """Get the entity ID field name"""
         for attr_name in dir(self.snapshot_model):
@@ -1,7 +1,7 @@
 import uuid
 from datetime import datetime
 from enum import Enum
-from typing import Any, Dict, Generic, List, Optional, TypeVar
+from typing import Any, Dict, Generic, List, Optional, Tuple, TypeVar
 
 from sqlalchemy.orm import Session
 
@@ -55,6 +55,10 @@ class GenericIdentifierManager(Generic[TIdentifierType, TSecurityEntity, TChange
         """Find entity by identifier value"""
         return self.operations_manager.find_entity_by_identifier(identifier_type, value)
 
+    def find_entities_by_identifiers(self, pairs: List[Tuple[TIdentifierType, str]]) -> Dict[Tuple, Any]:
+        """Resolve many (identifier type, value) pairs to entities in one query"""
+        return self.operations_manager.find_entities_by_identifiers(pairs)
+
     def get_identifier_history(self, entity_id: int, identifier_type: TIdentifierType) -> List:
         """Get full identifier history"""
         return self.version_manager.get_identifier_history(entity_id, identifier_type)
@@ -103,6 +107,13 @@ class GenericIdentifierManager(Generic[TIdentifierType, TSecurityEntity, TChange
             entity_id, identifiers, created_by, source, reason
         )
 
+    def bulk_add_identifiers_many(self, identifiers_by_entity: Dict[int, Dict[TIdentifierType, str]],
+                                  created_by: str, source: str = None, reason=None):
+        """Add identifiers to many entities in a single transaction"""
+        return self.operations_manager.bulk_add_identifiers_many(
+            identifiers_by_entity, created_by, source, reason
+        )
+
     def get_pending_change_requests(self, entity_id: Optional[int] = None,
                                     identifier_type: Optional[TIdentifierType] = None) -> List:
         """Get pending change requests"""
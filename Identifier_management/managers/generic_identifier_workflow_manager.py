@@ -75,12 +75,11 @@ class GenericWorkflowManager(Generic[TIdentifierType, TSecurityEntity, TChangeRe
         identifier_type = self.identifier_enum_class(change_request.identifier_type)
         change_reason = None
 
-        # Try to convert change reason to enum
+        # Try to convert change reason to enum, keeping the raw string if it is not a member
         if self.change_reason_enum_class:
-            try:
-                change_reason = self.change_reason_enum_class(change_request.change_reason)
-            except ValueError:
-                change_reason = change_request.change_reason
+            change_reason = self.change_reason_enum_class._value2member_map_.get(
+                change_request.change_reason, change_request.change_reason
+            )
         else:
             change_reason = change_request.change_reason
 
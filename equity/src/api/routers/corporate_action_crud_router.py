@@ -284,7 +284,7 @@ class CorporateActionGenericRouter(Generic[ModelType, CreateSchemaType, Response
             )
         try:
             # Extract data from the request model (only fields that were set)
-            update_data = updated_item.model_dump(mode="json", exclude_unset=True, exclude_defaults=True)
+            update_data = updated_item.model_dump(mode="json", exclude_unset=True)
 
             # Separate and update base fields and specific fields
             base_data, specific_data = self._separate_fields(update_data)
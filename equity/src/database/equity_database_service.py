@@ -238,7 +238,7 @@ class EquityDatabaseService(Generic[ModelType, CreateSchemaType, ResponseSchemaT
                 )
 
             # Update only provided fields
-            update_dict = update_data.model_dump(exclude_unset=True, exclude_defaults=True)
+            update_dict = update_data.model_dump(exclude_unset=True)
             for key, value in update_dict.items():
                 if hasattr(item, key):
                     setattr(item, key, value)
@@ -52,8 +52,10 @@ class BondGenericRouter(Generic[ModelType, CreateSchemaType, ResponseSchemaType]
         self.bond_base_fields = _get_model_fields(self.bond_base_model)
         self.specific_fields = self._get_specific_fields()
 
-        async def create_item_endpoint(db: db_dependency, item: create_schema):
-            return await self.create_item(db, item)
+        # Handlers are plain (sync) functions on purpose: the session is blocking
+        # psycopg2, so FastAPI must run them in its threadpool, not on the event loop.
+        def create_item_endpoint(db: db_dependency, item: create_schema):
+            return self.create_item(db, item)
 
         # Define routes
         self.router.post(
@@ -84,8 +86,8 @@ class BondGenericRouter(Generic[ModelType, CreateSchemaType, ResponseSchemaType]
             tags=self.tags,
         )(self.read_by_column)
 
-        async def update_item_endpoint(item_id: str, updated_item: create_schema, db: db_dependency):
-            return await self.update_item(item_id, updated_item, db)
+        def update_item_endpoint(item_id: str, updated_item: create_schema, db: db_dependency):
+            return self.update_item(item_id, updated_item, db)
 
         self.router.put(
             f"/{self.base_path}/{{item_id}}",
@@ -94,8 +96,8 @@ class BondGenericRouter(Generic[ModelType, CreateSchemaType, ResponseSchemaType]
             tags=self.tags,
         )(update_item_endpoint)
 
-        async def partial_update_item_endpoint(item_id: str, updated_item: create_schema, db: db_dependency):
-            return await self.partial_update_item(item_id, updated_item, db)
+        def partial_update_item_endpoint(item_id: str, updated_item: create_schema, db: db_dependency):
+            return self.partial_update_item(item_id, updated_item, db)
 
         self.router.patch(
             f"/{self.base_path}/{{item_id}}",
@@ -147,7 +149,7 @@ class BondGenericRouter(Generic[ModelType, CreateSchemaType, ResponseSchemaType]
 
         return bond_base_data, specific_data
 
-    async def create_item(self, db: db_dependency, item: CreateSchemaType):
+    def create_item(self, db: db_dependency, item: CreateSchemaType):
         try:
             # Extract all data from the request model
             item_data = item.model_dump(mode="json", exclude_unset=True)
@@ -189,7 +191,7 @@ class BondGenericRouter(Generic[ModelType, CreateSchemaType, ResponseSchemaType]
                 detail=f"An unexpected error occurred while creating the item: {str(e)}",
             )
 
-    async def read_items(
+    def read_items(
             self,
             db: db_dependency,
             skip: int = 0,
@@ -198,7 +200,7 @@ class BondGenericRouter(Generic[ModelType, CreateSchemaType, ResponseSchemaType]
         items = db.query(self.model).offset(skip).limit(limit).all()
         return [self.response_schema.model_validate(item, from_attributes=True) for item in items]
 
-    async def read_item(self, item_id: str, db: db_dependency):
+    def read_item(self, item_id: str, db: db_dependency):
         parsed_id = self._parse_item_id(item_id)
         item = db.query(self.model).filter(getattr(self.model, self.pk_name) == parsed_id).first()
         if not item:
@@ -208,7 +210,7 @@ class BondGenericRouter(Generic[ModelType, CreateSchemaType, ResponseSchemaType]
             )
         return self.response_schema.model_validate(item, from_attributes=True)
 
-    async def read_by_column(
+    def read_by_column(
             self,
             column_name: str,
             value: str,
@@ -242,7 +244,7 @@ class BondGenericRouter(Generic[ModelType, CreateSchemaType, ResponseSchemaType]
         )
         return [self.response_schema.model_validate(item, from_attributes=True) for item in items]
 
-    async def update_item(self, item_id: str, updated_item: CreateSchemaType, db: db_dependency):
+    def update_item(self, item_id: str, updated_item: CreateSchemaType, db: db_dependency):
         parsed_id = self._parse_item_id(item_id)
         item = db.query(self.model).filter(getattr(self.model, self.pk_name) == parsed_id).first()
         if not item:
@@ -280,7 +282,7 @@ class BondGenericRouter(Generic[ModelType, CreateSchemaType, ResponseSchemaType]
             )
         return self.response_schema.model_validate(item)
 
-    async def partial_update_item(self, item_id: str, updated_item: CreateSchemaType, db: db_dependency):
+    def partial_update_item(self, item_id: str, updated_item: CreateSchemaType, db: db_dependency):
         parsed_id = self._parse_item_id(item_id)
         item = db.query(self.model).filter(getattr(self.model, self.pk_name) == parsed_id).first()
         if not item:
@@ -290,7 +292,7 @@ class BondGenericRouter(Generic[ModelType, CreateSchemaType, ResponseSchemaType]
             )
         try:
             # Extract data from the request model (only fields that were set)
-            update_data = updated_item.model_dump(mode="json", exclude_unset=True, exclude_defaults=True)
+            update_data = updated_item.model_dump(mode="json", exclude_unset=True)
 
             # Separate and update base fields and specific fields
             bond_base_data, specific_data = self._separate_fields(update_data)
@@ -317,7 +319,7 @@ class BondGenericRouter(Generic[ModelType, CreateSchemaType, ResponseSchemaType]
                 detail=f"Could not update item: {str(e)}")
         return self.response_schema.model_validate(item)
 
-    async def delete_item(self, item_id: str, db: db_dependency):
+    def delete_item(self, item_id: str, db: db_dependency):
         parsed_id = self._parse_item_id(item_id)
         item = db.query(self.model).filter(getattr(self.model, self.pk_name) == parsed_id).first()
         if not item:
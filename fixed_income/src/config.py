@@ -18,6 +18,12 @@ class Settings:
     DB_PASSWORD = os.getenv("FIXED_INCOME_DB_PASSWORD", "HippO1290")
     DATABASE_URL = f"postgresql+psycopg2://{DB_USER}:{DB_PASSWORD}@{DB_HOST}:{DB_PORT}/{DB_NAME}"
 
+    # Connection Pool Settings
+    DB_POOL_SIZE = int(os.getenv("FIXED_INCOME_DB_POOL_SIZE", "20"))
+    DB_MAX_OVERFLOW = int(os.getenv("FIXED_INCOME_DB_MAX_OVERFLOW", "10"))
+    DB_POOL_TIMEOUT = int(os.getenv("FIXED_INCOME_DB_POOL_TIMEOUT", "30"))
+    DB_POOL_RECYCLE = int(os.getenv("FIXED_INCOME_DB_POOL_RECYCLE", "1800"))
+
     # Service-specific Redis Configuration
     REDIS_HOST = os.getenv("FIXED_INCOME_REDIS_HOST", "localhost")
     REDIS_PORT = int(os.getenv("FIXED_INCOME_REDIS_PORT", "6379"))
@@ -31,6 +37,15 @@ class Settings:
     API_HOST = os.getenv("FIXED_INCOME_API_HOST", "0.0.0.0")
     API_PORT = int(os.getenv("FIXED_INCOME_API_PORT", "8002"))
     DEBUG = os.getenv("DEBUG", "False").lower() == "true"
+    BULK_GET_MAX_ITEMS = int(os.getenv("FIXED_INCOME_BULK_GET_MAX_ITEMS", "1000"))
+
+    # Identifier Cache Configuration
+    IDENTIFIER_CACHE_MAXSIZE = int(os.getenv("FIXED_INCOME_IDENTIFIER_CACHE_MAXSIZE", "100000"))
+    IDENTIFIER_CACHE_TTL = float(os.getenv("FIXED_INCOME_IDENTIFIER_CACHE_TTL", "60"))  # Seconds
+
+    # In-process current price cache, in front of Redis
+    HOT_PRICE_CACHE_MAXSIZE = int(os.getenv("FIXED_INCOME_HOT_PRICE_CACHE_MAXSIZE", "10000"))
+    HOT_PRICE_CACHE_TTL = float(os.getenv("FIXED_INCOME_HOT_PRICE_CACHE_TTL", "5"))  # Seconds
 
     # Service Discovery
     SERVICE_HOST = os.getenv("FIXED_INCOME_SERVICE_NAME", "fixed-income-service")
@@ -46,10 +61,6 @@ class Settings:
     # # Cache Configuration
     # CACHE_TTL = int(os.getenv("FIXED_INCOME_CACHE_TTL", "300"))  # 5 minutes default
     #
-    # # Connection Pool Settings
-    # DB_POOL_SIZE = int(os.getenv("FIXED_INCOME_DB_POOL_SIZE", "10"))
-    # DB_MAX_OVERFLOW = int(os.getenv("FIXED_INCOME_DB_MAX_OVERFLOW", "20"))
-    #
     # # Rate Limiting
     # RATE_LIMIT_REQUESTS = int(os.getenv("FIXED_INCOME_RATE_LIMIT_REQUESTS", "100"))
     # RATE_LIMIT_WINDOW = int(os.getenv("FIXED_INCOME_RATE_LIMIT_WINDOW", "60"))
@@ -3,6 +3,10 @@ from datetime import datetime
 from decimal import Decimal
 from typing import Any, Dict, List, Optional, Tuple
 
+from fastapi import Depends
+from sqlalchemy.orm import Session
+
+from fixed_income.src.database import get_db
 from fixed_income.src.model.enums import BondTypeEnum
 from fixed_income.src.model.enums.bond_identifier_type_enum import BondIdentifierTypeEnum
 from fixed_income.src.services.bond_identifer_service import BondIdentifierService, get_bond_identifier_service
@@ -26,12 +30,12 @@ class FixedIncomeController:
     Can be extended in the future for complex orchestration as needed.
     """
 
-    def __init__(self):
-        # Initialize all services
-        self.bond_read_service: BondReadOnlyService = get_bond_read_service()
-        self.bond_write_service: BondWriteService = get_bond_write_service()
-        self.price_read_service: BondPriceReadOnlyService = get_bond_price_read_service()
-        self.price_write_service: BondPriceWriteService = get_bond_price_write_service()
+    def __init__(self, db: Session):
+        # Initialize all services with the request-scoped session
+        self.bond_read_service: BondReadOnlyService = get_bond_read_service(db)
+        self.bond_write_service: BondWriteService = get_bond_write_service(db)
+        self.price_read_service: BondPriceReadOnlyService = get_bond_price_read_service(db)
+        self.price_write_service: BondPriceWriteService = get_bond_price_write_service(db)
         self.bond_identifier_service: BondIdentifierService = get_bond_identifier_service()
 
         logger.info("FixedIncomeController initialized with all services")
@@ -136,7 +140,7 @@ class FixedIncomeController:
         """Delete multiple bonds in bulk for specific bond type."""
         return await self.bond_write_service.bulk_delete_bonds(bond_ids, bond_type, user_token)
 
-    async def bulk_create_mixed_bonds(self, bond_requests: List[Tuple[str, Any]], user_token: str = None):
+    async def bulk_create_mixed_bonds(self, bond_requests: Dict[BondTypeEnum, List[Any]], user_token: str = None):
         """Create multiple bonds of different types in bulk."""
         return await self.bond_write_service.bulk_create_mixed_bonds(bond_requests, user_token)
 
@@ -351,7 +355,7 @@ class FixedIncomeController:
             bond_type_counts = {}
             for bond_type in supported_types:
                 try:
-                    count = await self.bond_read_service.count_bonds(bond_type)
+                    count = await self.bond_read_service.count_bonds(bond_type, estimate=True)
                     bond_type_counts[bond_type] = count
                 except Exception as e:
                     logger.warning(f"Health check failed for {bond_type}: {str(e)}")
@@ -379,6 +383,6 @@ class FixedIncomeController:
 
 
 # Factory function
-def get_fixed_income_controller() -> FixedIncomeController:
-    """Factory function for dependency injection"""
-    return FixedIncomeController()
+def get_fixed_income_controller(db: Session = Depends(get_db)) -> FixedIncomeController:
+    """Factory function for dependency injection (one session per request via get_db)"""
+    return FixedIncomeController(db)
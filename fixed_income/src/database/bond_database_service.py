@@ -1,12 +1,14 @@
 import logging
 from datetime import datetime
-from typing import Annotated, Any, Dict, Generic, List, Optional, Type, TypeVar, Union
+from itertools import islice
+from typing import Annotated, Any, Dict, Generic, Iterable, List, Optional, Tuple, Type, TypeVar, Union
 
 from fastapi import Depends, HTTPException, status
-from pydantic import BaseModel
-from sqlalchemy import inspect, or_, text
+from pydantic import BaseModel, TypeAdapter
+from sqlalchemy import JSON, any_, bindparam, func, inspect, literal, or_, select, text, update
+from sqlalchemy.dialects.postgresql import ARRAY
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, load_only
 
 from fixed_income.src.celery.tasks.analytics import compute_bond_analytics
 from fixed_income.src.database.session import get_db
@@ -22,6 +24,9 @@ ResponseSchemaType = TypeVar("ResponseSchemaType", bound=BaseModel)
 
 db_dependency = Annotated[Session, Depends(get_db)]
 
+# Rows fetched per server-side cursor round-trip when streaming large reads
+STREAM_BATCH_SIZE = 1000
+
 
 class DatabaseError(Exception):
     """Custom database operation error"""
@@ -37,6 +42,13 @@ def _get_model_fields(model_class) -> List[str]:
     return [column.name for column in inspect(model_class).columns]
 
 
+def _chunked(iterable, size):
+    """Yield successive chunks from an iterable"""
+    it = iter(iterable)
+    while chunk := list(islice(it, size)):
+        yield chunk
+
+
 class BondDatabaseService(Generic[ModelType, CreateSchemaType, ResponseSchemaType]):
     """
     Generic Database Service for Bond Operations
@@ -52,20 +64,30 @@ class BondDatabaseService(Generic[ModelType, CreateSchemaType, ResponseSchemaTyp
             model: Type[ModelType],
             create_schema: Type[CreateSchemaType],
             response_schema: Type[ResponseSchemaType],
-            update_schema: Optional[Type[UpdateSchemaType]] = None,
-            db: Optional[Session] = None
+            update_schema: Optional[Type[UpdateSchemaType]] = None
     ):
         self.bond_base_model = bond_base_model
         self.model = model
         self.create_schema = create_schema
         self.update_schema = update_schema or create_schema
         self.response_schema = response_schema
+        self._response_list_adapter = TypeAdapter(List[response_schema])
         self.pk_name, self.pk_type = self._get_primary_key_info()
-        self.db = db or get_db()
+        self.pk_attr = getattr(self.model, self.pk_name)
+        self.model_columns = {column.name: column for column in inspect(self.model).columns}
+
+        # Only hydrate the columns the response schema actually exposes on list reads
+        response_columns = [
+            getattr(self.model, name) for name in self.response_schema.model_fields if name in self.model_columns
+        ]
+        self.read_options = (load_only(*response_columns),) if response_columns else ()
 
         # Get common fields from BondBase and specific fields from the model
         self.bond_base_fields = _get_model_fields(self.bond_base_model)
         self.specific_fields = self._get_specific_fields()
+        self.json_fields = {column.name for column in inspect(self.model).columns if isinstance(column.type, JSON)}
+        self.has_updated_at = 'updated_at' in self.bond_base_fields or 'updated_at' in self.specific_fields
+        self._search_conditions = {}  # Cache for compiled search conditions by column tuple
 
     def _get_specific_fields(self) -> List[str]:
         """Get fields that are specific to the bond type (not in BondBase)"""
@@ -101,6 +123,18 @@ class BondDatabaseService(Generic[ModelType, CreateSchemaType, ResponseSchemaTyp
                 detail=f"Invalid ID format. Expected {self.pk_type.__name__}, got {type(item_id).__name__}."
             )
 
+    def _dump_for_write(self, item_data: BaseModel, **dump_kwargs) -> Dict:
+        """Dump a request schema to native Python values for column binding.
+
+        Only JSON columns (schedules) are dumped in JSON mode, since their nested
+        dates must already be serializable when the driver encodes them.
+        """
+        item_dict = item_data.model_dump(**dump_kwargs)
+        json_fields = self.json_fields.intersection(item_dict)
+        if json_fields:
+            item_dict.update(item_data.model_dump(mode="json", include=json_fields, **dump_kwargs))
+        return item_dict
+
     def _separate_fields(self, data: Dict) -> tuple[Dict, Dict]:
         """Separate fields into BondBase fields and specific bond type fields"""
         bond_base_data = {}
@@ -124,6 +158,50 @@ class BondDatabaseService(Generic[ModelType, CreateSchemaType, ResponseSchemaTyp
         for key, value in specific_data.items():
             setattr(item, key, value)
 
+    def _update_by_pk(self, db: Session, parsed_id: Any, update_dict: Dict) -> Optional[Dict]:
+        """
+        Update a bond row in place, returning the updated column values.
+
+        Emits one UPDATE ... RETURNING per table of the joined BondBase hierarchy
+        (no preliminary SELECT or refresh). The bond-type table goes first so an ID
+        belonging to another bond type is reported as missing before BondBase is touched.
+        Returns None if no row with that ID exists.
+        """
+        bond_base_data, specific_data = self._separate_fields(update_dict)
+        specific_data = {key: value for key, value in specific_data.items() if key in self.specific_fields}
+
+        row = {}
+        for table, values in ((self.model.__table__, specific_data), (self.bond_base_model.__table__, bond_base_data)):
+            pk_column = table.primary_key.columns[0]
+            if values:
+                stmt = update(table).where(pk_column == parsed_id).values(**values).returning(*table.c)
+            else:
+                stmt = select(*table.c).where(pk_column == parsed_id)
+
+            table_row = db.execute(stmt).mappings().first()
+            if table_row is None:
+                return None
+            row.update(table_row)
+
+        return row
+
+    def _get_search_condition(self, search_columns: Tuple[str, ...]):
+        """Get or build the OR-ed ilike condition for a set of search columns.
+
+        The pattern is a bind parameter, so the same clause (and its compiled SQL)
+        is reused across requests; the search term is supplied via query params.
+        """
+        if search_columns not in self._search_conditions:
+            pattern = bindparam("search_pattern")
+            search_conditions = [
+                getattr(self.model, column_name).ilike(pattern)
+                for column_name in search_columns
+                if hasattr(self.model, column_name)
+            ]
+            self._search_conditions[search_columns] = or_(*search_conditions) if search_conditions else None
+
+        return self._search_conditions[search_columns]
+
     def _trigger_analytics(self, item):
         """Trigger analytics computation for a bond item"""
         if hasattr(item, 'id') and hasattr(item, 'bond_type'):
@@ -137,21 +215,27 @@ class BondDatabaseService(Generic[ModelType, CreateSchemaType, ResponseSchemaTyp
             logger.error(f"Error converting {self.model.__name__} to response schema: {str(e)}")
             raise DatabaseError(f"Failed to convert {self.model.__name__} to response format", e)
 
-    def _convert_to_response_list(self, db_items: List[ModelType]) -> List[ResponseSchemaType]:
-        """Convert list of database model instances to response schemas"""
+    def _convert_to_response_list(self, db_items: Iterable[ModelType]) -> List[ResponseSchemaType]:
+        """Convert database model instances to response schemas, one batch at a time"""
         try:
-            return [self._convert_to_response(item) for item in db_items]
+            responses = []
+            for chunk in _chunked(db_items, STREAM_BATCH_SIZE):
+                responses.extend(self._response_list_adapter.validate_python(chunk, from_attributes=True))
+            return responses
         except Exception as e:
             logger.error(f"Error converting {self.model.__name__} list to response schemas: {str(e)}")
             raise DatabaseError(f"Failed to convert {self.model.__name__} list to response format", e)
 
     # Core CRUD Operations
+    # Every query method blocks on the driver, so they are plain functions; async callers run them through
+    # run_in_threadpool to keep the event loop free
 
-    async def create(self, item_data: CreateSchemaType) -> ResponseSchemaType:
+    def create(self, db: Session, item_data: CreateSchemaType) -> ResponseSchemaType:
         """
         Create a new bond item in the database
 
         Args:
+            db: Request-scoped database session
             item_data: Data for creating the bond item
 
         Returns:
@@ -163,7 +247,7 @@ class BondDatabaseService(Generic[ModelType, CreateSchemaType, ResponseSchemaTyp
         """
         try:
             # Extract all data from the request model
-            item_dict = item_data.model_dump(mode="json", exclude_unset=True)
+            item_dict = self._dump_for_write(item_data, exclude_unset=True)
 
             # Create a new instance of the specific bond model
             db_item = self.model()
@@ -173,9 +257,9 @@ class BondDatabaseService(Generic[ModelType, CreateSchemaType, ResponseSchemaTyp
             self._apply_field_updates(db_item, bond_base_data, specific_data)
 
             # Add to database
-            self.db.add(db_item)
-            self.db.commit()
-            self.db.refresh(db_item)
+            db.add(db_item)
+            db.commit()
+            db.refresh(db_item)
 
             # Trigger analytics computation
             # self._trigger_analytics(db_item)
@@ -184,26 +268,27 @@ class BondDatabaseService(Generic[ModelType, CreateSchemaType, ResponseSchemaTyp
             return self._convert_to_response(db_item)
 
         except IntegrityError as e:
-            self.db.rollback()
+            db.rollback()
             logger.warning(f"Integrity constraint violation creating {self.model.__name__}: {str(e)}")
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail=f"{self.model.__name__} violates database constraints. Possible duplicate or invalid reference."
             )
         except SQLAlchemyError as e:
-            self.db.rollback()
+            db.rollback()
             logger.error(f"Database error creating {self.model.__name__}: {str(e)}")
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail=f"Database error occurred while creating {self.model.__name__}"
             )
         except Exception as e:
-            self.db.rollback()
+            db.rollback()
             logger.error(f"Unexpected error creating {self.model.__name__}: {str(e)}")
             raise DatabaseError(f"Failed to create {self.model.__name__}", e)
 
-    async def update(
+    def update(
             self,
+            db: Session,
             item_id: Union[str, int],
             update_data: Union[UpdateSchemaType, CreateSchemaType]
     ) -> ResponseSchemaType:
@@ -211,6 +296,7 @@ class BondDatabaseService(Generic[ModelType, CreateSchemaType, ResponseSchemaTyp
         Update an existing bond item
 
         Args:
+            db: Request-scoped database session
             item_id: ID of the item to update
             update_data: Data to update the item with
 
@@ -222,29 +308,24 @@ class BondDatabaseService(Generic[ModelType, CreateSchemaType, ResponseSchemaTyp
         """
         try:
             parsed_id = self._parse_item_id(item_id)
-            item = self.db.query(self.model).filter(
-                getattr(self.model, self.pk_name) == parsed_id
-            ).first()
 
-            if not item:
+            # Extract data from the request model
+            update_dict = self._dump_for_write(update_data)
+
+            # Update timestamp if model has updated_at field
+            if self.has_updated_at:
+                update_dict['updated_at'] = datetime.now()
+
+            item = self._update_by_pk(db, parsed_id, update_dict)
+            if item is None:
+                # Close the transaction the UPDATE opened instead of leaving it on the request session
+                db.rollback()
                 raise HTTPException(
                     status_code=status.HTTP_404_NOT_FOUND,
                     detail=f"{self.model.__name__} with ID {item_id} not found"
                 )
 
-            # Extract data from the request model
-            update_dict = update_data.model_dump(mode="json")
-
-            # Separate and update base fields and specific fields
-            bond_base_data, specific_data = self._separate_fields(update_dict)
-            self._apply_field_updates(item, bond_base_data, specific_data)
-
-            # Update timestamp if model has updated_at field
-            if hasattr(item, 'updated_at'):
-                setattr(item, 'updated_at', datetime.now())
-
-            self.db.commit()
-            self.db.refresh(item)
+            db.commit()
 
             # Trigger analytics computation
             # self._trigger_analytics(item)
@@ -255,26 +336,27 @@ class BondDatabaseService(Generic[ModelType, CreateSchemaType, ResponseSchemaTyp
         except HTTPException:
             raise
         except IntegrityError as e:
-            self.db.rollback()
+            db.rollback()
             logger.warning(f"Integrity constraint violation updating {self.model.__name__}: {str(e)}")
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Update violates database constraints"
             )
         except SQLAlchemyError as e:
-            self.db.rollback()
+            db.rollback()
             logger.error(f"Database error updating {self.model.__name__}: {str(e)}")
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail="Database error occurred during update"
             )
         except Exception as e:
-            self.db.rollback()
+            db.rollback()
             logger.error(f"Unexpected error updating {self.model.__name__}: {str(e)}")
             raise DatabaseError(f"Failed to update {self.model.__name__}", e)
 
-    async def partial_update(
+    def partial_update(
             self,
+            db: Session,
             item_id: Union[str, int],
             update_data: Union[UpdateSchemaType, CreateSchemaType]
     ) -> ResponseSchemaType:
@@ -282,6 +364,7 @@ class BondDatabaseService(Generic[ModelType, CreateSchemaType, ResponseSchemaTyp
         Partially update an existing bond item (only provided fields)
 
         Args:
+            db: Request-scoped database session
             item_id: ID of the item to update
             update_data: Partial data to update the item with
 
@@ -290,29 +373,23 @@ class BondDatabaseService(Generic[ModelType, CreateSchemaType, ResponseSchemaTyp
         """
         try:
             parsed_id = self._parse_item_id(item_id)
-            item = self.db.query(self.model).filter(
-                getattr(self.model, self.pk_name) == parsed_id
-            ).first()
 
-            if not item:
+            # Extract data from the request model (only fields that were set)
+            update_dict = self._dump_for_write(update_data, exclude_unset=True)
+
+            # Update timestamp if model has updated_at field
+            if self.has_updated_at:
+                update_dict['updated_at'] = datetime.now()
+
+            item = self._update_by_pk(db, parsed_id, update_dict)
+            if item is None:
+                db.rollback()
                 raise HTTPException(
                     status_code=status.HTTP_404_NOT_FOUND,
                     detail=f"{self.model.__name__} with ID {item_id} not found"
                 )
 
-            # Extract data from the request model (only fields that were set)
-            update_dict = update_data.model_dump(mode="json", exclude_unset=True, exclude_defaults=True)
-
-            # Separate and update base fields and specific fields
-            bond_base_data, specific_data = self._separate_fields(update_dict)
-            self._apply_field_updates(item, bond_base_data, specific_data)
-
-            # Update timestamp if model has updated_at field
-            if hasattr(item, 'updated_at'):
-                setattr(item, 'updated_at', datetime.now())
-
-            self.db.commit()
-            self.db.refresh(item)
+            db.commit()
 
             # Trigger analytics computation
             # self._trigger_analytics(item)
@@ -323,15 +400,16 @@ class BondDatabaseService(Generic[ModelType, CreateSchemaType, ResponseSchemaTyp
         except HTTPException:
             raise
         except Exception as e:
-            self.db.rollback()
+            db.rollback()
             logger.error(f"Error partially updating {self.model.__name__}: {str(e)}")
             raise DatabaseError(f"Failed to partially update {self.model.__name__}", e)
 
-    async def delete(self, item_id: Union[str, int]) -> bool:
+    def delete(self, db: Session, item_id: Union[str, int]) -> bool:
         """
         Delete a bond item by ID
 
         Args:
+            db: Request-scoped database session
             item_id: ID of the item to delete
 
         Returns:
@@ -342,18 +420,19 @@ class BondDatabaseService(Generic[ModelType, CreateSchemaType, ResponseSchemaTyp
         """
         try:
             parsed_id = self._parse_item_id(item_id)
-            item = self.db.query(self.model).filter(
-                getattr(self.model, self.pk_name) == parsed_id
+            item = db.query(self.model).filter(
+                self.pk_attr == parsed_id
             ).first()
 
             if not item:
+                db.rollback()
                 raise HTTPException(
                     status_code=status.HTTP_404_NOT_FOUND,
                     detail=f"{self.model.__name__} with ID {item_id} not found"
                 )
 
-            self.db.delete(item)
-            self.db.commit()
+            db.delete(item)
+            db.commit()
 
             logger.info(f"Deleted {self.model.__name__} with ID: {item_id}")
             return True
@@ -361,29 +440,30 @@ class BondDatabaseService(Generic[ModelType, CreateSchemaType, ResponseSchemaTyp
         except HTTPException:
             raise
         except IntegrityError as e:
-            self.db.rollback()
+            db.rollback()
             logger.warning(f"Integrity constraint violation deleting {self.model.__name__}: {str(e)}")
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail=f"Cannot delete {self.model.__name__} due to foreign key constraints"
             )
         except SQLAlchemyError as e:
-            self.db.rollback()
+            db.rollback()
             logger.error(f"Database error deleting {self.model.__name__}: {str(e)}")
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail="Database error occurred during deletion"
             )
         except Exception as e:
-            self.db.rollback()
+            db.rollback()
             logger.error(f"Unexpected error deleting {self.model.__name__}: {str(e)}")
             raise DatabaseError(f"Failed to delete {self.model.__name__}", e)
 
-    async def get_by_id(self, item_id: Union[str, int]) -> Optional[ResponseSchemaType]:
+    def get_by_id(self, db: Session, item_id: Union[str, int]) -> Optional[ResponseSchemaType]:
         """
         Get bond item by ID
 
         Args:
+            db: Request-scoped database session
             item_id: ID of the item to retrieve
 
         Returns:
@@ -391,8 +471,8 @@ class BondDatabaseService(Generic[ModelType, CreateSchemaType, ResponseSchemaTyp
         """
         try:
             parsed_id = self._parse_item_id(item_id)
-            item = self.db.query(self.model).filter(
-                getattr(self.model, self.pk_name) == parsed_id
+            item = db.query(self.model).filter(
+                self.pk_attr == parsed_id
             ).first()
 
             return self._convert_to_response(item) if item else None
@@ -403,8 +483,9 @@ class BondDatabaseService(Generic[ModelType, CreateSchemaType, ResponseSchemaTyp
             logger.error(f"Error getting {self.model.__name__} by ID {item_id}: {str(e)}")
             raise DatabaseError(f"Failed to retrieve {self.model.__name__}", e)
 
-    async def get_all(
+    def get_all(
             self,
+            db: Session,
             order_by: Optional[str] = None,
             desc: bool = False
     ) -> List[ResponseSchemaType]:
@@ -412,7 +493,7 @@ class BondDatabaseService(Generic[ModelType, CreateSchemaType, ResponseSchemaTyp
         Get all bond items with pagination and optional ordering
 
         Args:
-
+            db: Request-scoped database session
             order_by: Column name to order by
             desc: Whether to order in descending order
 
@@ -420,24 +501,26 @@ class BondDatabaseService(Generic[ModelType, CreateSchemaType, ResponseSchemaTyp
             List of items as response schemas
         """
         try:
-            query = self.db.query(self.model)
+            query = db.query(self.model).options(*self.read_options)
 
             # Apply ordering if specified
             if order_by:
-                if hasattr(self.model, order_by):
-                    order_column = getattr(self.model, order_by)
+                if order_by in self.model_columns:
+                    order_column = self.model_columns[order_by]
                     query = query.order_by(order_column.desc() if desc else order_column.asc())
                 else:
                     logger.warning(f"Column {order_by} not found in {self.model.__name__}, skipping ordering")
 
-            return self._convert_to_response_list(query)
+            # Stream through a server-side cursor instead of materialising the full result set
+            return self._convert_to_response_list(query.yield_per(STREAM_BATCH_SIZE))
 
         except Exception as e:
             logger.error(f"Error getting all {self.model.__name__}: {str(e)}")
             raise DatabaseError(f"Failed to retrieve {self.model.__name__} list", e)
 
-    async def get_by_column(
+    def get_by_column(
             self,
+            db: Session,
             column_name: str,
             value: Any
     ) -> List[ResponseSchemaType]:
@@ -445,6 +528,7 @@ class BondDatabaseService(Generic[ModelType, CreateSchemaType, ResponseSchemaTyp
         Get bond items by column value
 
         Args:
+            db: Request-scoped database session
             column_name: Name of the column to filter by
             value: Value to filter by
 
@@ -453,15 +537,14 @@ class BondDatabaseService(Generic[ModelType, CreateSchemaType, ResponseSchemaTyp
         """
         try:
             # Validate column exists
-            model_columns = {column.name: column for column in inspect(self.model).columns}
-            if column_name not in model_columns:
+            if column_name not in self.model_columns:
                 raise HTTPException(
                     status_code=status.HTTP_400_BAD_REQUEST,
                     detail=f"Column '{column_name}' does not exist in {self.model.__name__}"
                 )
 
             # Parse value to correct type
-            column = model_columns[column_name]
+            column = self.model_columns[column_name]
             col_type = column.type.python_type
             try:
                 parsed_value = col_type(value)
@@ -473,8 +556,8 @@ class BondDatabaseService(Generic[ModelType, CreateSchemaType, ResponseSchemaTyp
 
             # Query items
             items = (
-                self.db.query(self.model)
-                .filter(getattr(self.model, column_name) == parsed_value)
+                db.query(self.model).options(*self.read_options)
+                .filter(column == parsed_value)
                 .all()
             )
 
@@ -486,22 +569,79 @@ class BondDatabaseService(Generic[ModelType, CreateSchemaType, ResponseSchemaTyp
             logger.error(f"Error getting {self.model.__name__} by {column_name}={value}: {str(e)}")
             raise DatabaseError(f"Failed to retrieve {self.model.__name__} by column", e)
 
+    def get_by_column_values(
+            self,
+            db: Session,
+            column_name: str,
+            values: List[Any]
+    ) -> List[ResponseSchemaType]:
+        """
+        Get bond items whose column matches any of the given values, in a single query
+
+        Args:
+            db: Request-scoped database session
+            column_name: Name of the column to filter by
+            values: Values to match
+
+        Returns:
+            List of items as response schemas
+        """
+        try:
+            if column_name not in self.model_columns:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail=f"Column '{column_name}' does not exist in {self.model.__name__}"
+                )
+
+            column = self.model_columns[column_name]
+            col_type = column.type.python_type
+            try:
+                parsed_values = list({col_type(value) for value in values})
+            except (ValueError, TypeError):
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail=f"Invalid value format for column '{column_name}'. Expected {col_type.__name__}"
+                )
+            if not parsed_values:
+                return []
+
+            # Same single array bind as get_by_ids: column = ANY(:values)
+            items = (
+                db.query(self.model).options(*self.read_options)
+                .filter(column == any_(literal(parsed_values, ARRAY(column.type))))
+                .all()
+            )
+
+            return self._convert_to_response_list(items)
+
+        except HTTPException:
+            raise
+        except Exception as e:
+            logger.error(f"Error getting {self.model.__name__} by {column_name} values: {str(e)}")
+            raise DatabaseError(f"Failed to retrieve {self.model.__name__} by column values", e)
+
     # Advanced Query Operations
 
-    async def get_by_ids(self, item_ids: List[Union[str, int]]) -> List[ResponseSchemaType]:
+    def get_by_ids(self, db: Session, item_ids: List[Union[str, int]]) -> List[ResponseSchemaType]:
         """
         Get multiple bond items by their IDs
 
         Args:
+            db: Request-scoped database session
             item_ids: List of IDs to retrieve
 
         Returns:
             List of items as response schemas
         """
         try:
-            parsed_ids = [self._parse_item_id(item_id) for item_id in item_ids]
-            items = self.db.query(self.model).filter(
-                getattr(self.model, self.pk_name).in_(parsed_ids)
+            # Dedupe before querying so repeated IDs are neither parsed nor fetched twice
+            parsed_ids = list({self._parse_item_id(item_id) for item_id in set(item_ids)})
+            if not parsed_ids:
+                return []
+
+            # Bind the IDs as a single array parameter (pk = ANY(:ids)) rather than one bind per ID
+            items = db.query(self.model).options(*self.read_options).filter(
+                self.pk_attr == any_(literal(parsed_ids, ARRAY(self.pk_attr.type)))
             ).all()
 
             return self._convert_to_response_list(items)
@@ -510,35 +650,49 @@ class BondDatabaseService(Generic[ModelType, CreateSchemaType, ResponseSchemaTyp
             logger.error(f"Error getting {self.model.__name__} by IDs: {str(e)}")
             raise DatabaseError(f"Failed to retrieve {self.model.__name__} by IDs", e)
 
-    async def count(self, **filters) -> int:
+    def count(self, db: Session, estimate: bool = False, **filters) -> int:
         """
         Count bond items with optional filters
 
         Args:
+            db: Request-scoped database session
+            estimate: For unfiltered counts, return the planner's row estimate
+                (pg_class.reltuples) instead of scanning the table
             **filters: Column filters as keyword arguments
 
         Returns:
             Count of matching items
         """
         try:
-            query = self.db.query(self.model)
+            if estimate and not filters:
+                estimated = db.execute(
+                    text("SELECT reltuples::bigint FROM pg_class WHERE relname = :table_name"),
+                    {"table_name": self.model.__tablename__}
+                ).scalar()
+                # reltuples is -1 until the table has been vacuumed/analyzed
+                if estimated is not None and estimated >= 0:
+                    return estimated
+
+            # Count primary keys directly rather than wrapping the full row select in a subquery
+            query = db.query(func.count(self.pk_attr)).select_from(self.model)
 
             # Apply filters
             for column_name, value in filters.items():
-                if hasattr(self.model, column_name):
-                    query = query.filter(getattr(self.model, column_name) == value)
+                if column_name in self.model_columns:
+                    query = query.filter(self.model_columns[column_name] == value)
 
-            return query.count()
+            return query.scalar()
 
         except Exception as e:
             logger.error(f"Error counting {self.model.__name__}: {str(e)}")
             raise DatabaseError(f"Failed to count {self.model.__name__}", e)
 
-    async def exists(self, item_id: Union[str, int]) -> bool:
+    def exists(self, db: Session, item_id: Union[str, int]) -> bool:
         """
         Check if a bond item exists by ID
 
         Args:
+            db: Request-scoped database session
             item_id: ID to check
 
         Returns:
@@ -546,19 +700,20 @@ class BondDatabaseService(Generic[ModelType, CreateSchemaType, ResponseSchemaTyp
         """
         try:
             parsed_id = self._parse_item_id(item_id)
-            return self.db.query(self.model).filter(
-                getattr(self.model, self.pk_name) == parsed_id
+            return db.query(self.model).filter(
+                self.pk_attr == parsed_id
             ).first() is not None
 
         except Exception as e:
             logger.error(f"Error checking {self.model.__name__} existence: {str(e)}")
             return False
 
-    async def bulk_create(self, items_data: List[CreateSchemaType]) -> List[ResponseSchemaType]:
+    def bulk_create(self, db: Session, items_data: List[CreateSchemaType]) -> List[ResponseSchemaType]:
         """
         Create multiple bond items in bulk
 
         Args:
+            db: Request-scoped database session
             items_data: List of data for creating items
 
         Returns:
@@ -567,7 +722,7 @@ class BondDatabaseService(Generic[ModelType, CreateSchemaType, ResponseSchemaTyp
         try:
             db_items = []
             for item_data in items_data:
-                item_dict = item_data.model_dump(exclude_unset=True)
+                item_dict = self._dump_for_write(item_data, exclude_unset=True)
 
                 # Create a new instance of the specific bond model
                 db_item = self.model()
@@ -578,31 +733,32 @@ class BondDatabaseService(Generic[ModelType, CreateSchemaType, ResponseSchemaTyp
 
                 db_items.append(db_item)
 
-            self.db.add_all(db_items)
-            self.db.commit()
+            db.add_all(db_items)
+            db.commit()
 
             # Refresh all items and trigger analytics
             for db_item in db_items:
-                self.db.refresh(db_item)
+                db.refresh(db_item)
                 # self._trigger_analytics(db_item)
 
             logger.info(f"Bulk created {len(db_items)} {self.model.__name__} items")
             return self._convert_to_response_list(db_items)
 
         except IntegrityError as e:
-            self.db.rollback()
+            db.rollback()
             logger.warning(f"Integrity constraint violation in bulk create: {str(e)}")
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="One or more items violate database constraints"
             )
         except Exception as e:
-            self.db.rollback()
+            db.rollback()
             logger.error(f"Error in bulk create {self.model.__name__}: {str(e)}")
             raise DatabaseError(f"Failed to bulk create {self.model.__name__}", e)
 
-    async def search(
+    def search(
             self,
+            db: Session,
             search_term: str,
             search_columns: List[str]
     ) -> List[ResponseSchemaType]:
@@ -610,6 +766,7 @@ class BondDatabaseService(Generic[ModelType, CreateSchemaType, ResponseSchemaTyp
         Search bond items across multiple columns
 
         Args:
+            db: Request-scoped database session
             search_term: Term to search for
             search_columns: List of column names to search in
 
@@ -617,24 +774,14 @@ class BondDatabaseService(Generic[ModelType, CreateSchemaType, ResponseSchemaTyp
             List of matching items as response schemas
         """
         try:
-            query = self.db.query(self.model)
-
-            # Build search conditions
-            search_conditions = []
-            for column_name in search_columns:
-                if hasattr(self.model, column_name):
-                    column = getattr(self.model, column_name)
-                    # Use ilike for case-insensitive search (PostgreSQL)
-                    # Use like for other databases
-                    try:
-                        search_conditions.append(column.ilike(f"%{search_term}%"))
-                    except AttributeError:
-                        search_conditions.append(column.like(f"%{search_term}%"))
+            query = db.query(self.model).options(*self.read_options)
 
-            if search_conditions:
-                query = query.filter(or_(*search_conditions))
+            # Case-insensitive search (PostgreSQL ilike) using the cached condition
+            search_condition = self._get_search_condition(tuple(search_columns))
+            if search_condition is not None:
+                query = query.filter(search_condition).params(search_pattern=f"%{search_term}%")
 
-            return self._convert_to_response_list(query)
+            return self._convert_to_response_list(query.yield_per(STREAM_BATCH_SIZE))
 
         except Exception as e:
             logger.error(f"Error searching {self.model.__name__}: {str(e)}")
@@ -642,11 +789,12 @@ class BondDatabaseService(Generic[ModelType, CreateSchemaType, ResponseSchemaTyp
 
     # Raw SQL Support
 
-    async def execute_raw_query(self, query: str, params: Dict[str, Any] = None) -> List[Dict[str, Any]]:
+    def execute_raw_query(self, db: Session, query: str, params: Dict[str, Any] = None) -> List[Dict[str, Any]]:
         """
         Execute raw SQL query and return results
 
         Args:
+            db: Request-scoped database session
             query: Raw SQL query
             params: Query parameters
 
@@ -654,8 +802,8 @@ class BondDatabaseService(Generic[ModelType, CreateSchemaType, ResponseSchemaTyp
             List of result dictionaries
         """
         try:
-            result = self.db.execute(text(query), params or {})
-            return [dict(row) for row in result]
+            result = db.execute(text(query), params or {})
+            return [dict(row) for row in result.mappings()]
 
         except Exception as e:
             logger.error(f"Error executing raw query: {str(e)}")
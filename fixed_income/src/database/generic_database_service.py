@@ -1,11 +1,14 @@
 import logging
+import operator
 from datetime import datetime
-from typing import Any, Dict, Generic, List, Optional, Type, TypeVar, Union
+from typing import Any, Dict, Generic, List, Optional, Sequence, Tuple, Type, TypeVar, Union
 
 from fastapi import HTTPException, status
 from pydantic import BaseModel
-from sqlalchemy import inspect
+from sqlalchemy import func, inspect, literal, true
+from sqlalchemy.dialects.postgresql import ARRAY
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
+from sqlalchemy.orm import aliased
 from sqlalchemy.sql import text
 
 from equity.src.database import get_db
@@ -18,6 +21,17 @@ CreateSchemaType = TypeVar("CreateSchemaType", bound=BaseModel)
 UpdateSchemaType = TypeVar("UpdateSchemaType", bound=BaseModel)
 ResponseSchemaType = TypeVar("ResponseSchemaType", bound=BaseModel)
 
+# Comparison operators accepted in query() filters
+_FILTER_OPERATORS = {
+    "=": operator.eq,
+    "!=": operator.ne,
+    "<": operator.lt,
+    "<=": operator.le,
+    ">": operator.gt,
+    ">=": operator.ge,
+    "in": lambda column, values: column.in_(values),
+}
+
 
 class DatabaseError(Exception):
     """Custom database operation error"""
@@ -96,8 +110,10 @@ class GenericDatabaseService(Generic[ModelType, CreateSchemaType, ResponseSchema
             raise DatabaseError(f"Failed to convert {self.model.__name__} list to response format", e)
 
     # Core CRUD Operations
+    # Every query method blocks on the driver, so they are plain functions; async callers run them through
+    # run_in_threadpool to keep the event loop free
 
-    async def create(self, item_data: CreateSchemaType) -> ResponseSchemaType:
+    def create(self, item_data: CreateSchemaType) -> ResponseSchemaType:
         """
         Create a new item in the database
 
@@ -143,7 +159,7 @@ class GenericDatabaseService(Generic[ModelType, CreateSchemaType, ResponseSchema
             logger.error(f"Unexpected error creating {self.model.__name__}: {str(e)}")
             raise DatabaseError(f"Failed to create {self.model.__name__}", e)
 
-    async def update(
+    def update(
             self,
             item_id: Union[str, int],
             update_data: Union[UpdateSchemaType, CreateSchemaType]
@@ -168,6 +184,8 @@ class GenericDatabaseService(Generic[ModelType, CreateSchemaType, ResponseSchema
             ).first()
 
             if not item:
+                # Close the transaction the lookup opened instead of leaving it on the session
+                self.db.rollback()
                 raise HTTPException(
                     status_code=status.HTTP_404_NOT_FOUND,
                     detail=f"{self.model.__name__} with ID {item_id} not found"
@@ -210,7 +228,7 @@ class GenericDatabaseService(Generic[ModelType, CreateSchemaType, ResponseSchema
             logger.error(f"Unexpected error updating {self.model.__name__}: {str(e)}")
             raise DatabaseError(f"Failed to update {self.model.__name__}", e)
 
-    async def partial_update(
+    def partial_update(
             self,
             item_id: Union[str, int],
             update_data: Union[UpdateSchemaType, CreateSchemaType]
@@ -232,13 +250,14 @@ class GenericDatabaseService(Generic[ModelType, CreateSchemaType, ResponseSchema
             ).first()
 
             if not item:
+                self.db.rollback()
                 raise HTTPException(
                     status_code=status.HTTP_404_NOT_FOUND,
                     detail=f"{self.model.__name__} with ID {item_id} not found"
                 )
 
             # Update only provided fields
-            update_dict = update_data.model_dump(exclude_unset=True, exclude_defaults=True)
+            update_dict = update_data.model_dump(exclude_unset=True)
             for key, value in update_dict.items():
                 if hasattr(item, key):
                     setattr(item, key, value)
@@ -260,7 +279,7 @@ class GenericDatabaseService(Generic[ModelType, CreateSchemaType, ResponseSchema
             logger.error(f"Error partially updating {self.model.__name__}: {str(e)}")
             raise DatabaseError(f"Failed to partially update {self.model.__name__}", e)
 
-    async def delete(self, item_id: Union[str, int]) -> bool:
+    def delete(self, item_id: Union[str, int]) -> bool:
         """
         Delete an item by ID
 
@@ -280,6 +299,7 @@ class GenericDatabaseService(Generic[ModelType, CreateSchemaType, ResponseSchema
             ).first()
 
             if not item:
+                self.db.rollback()
                 raise HTTPException(
                     status_code=status.HTTP_404_NOT_FOUND,
                     detail=f"{self.model.__name__} with ID {item_id} not found"
@@ -312,7 +332,7 @@ class GenericDatabaseService(Generic[ModelType, CreateSchemaType, ResponseSchema
             logger.error(f"Unexpected error deleting {self.model.__name__}: {str(e)}")
             raise DatabaseError(f"Failed to delete {self.model.__name__}", e)
 
-    async def get_by_id(self, item_id: int) -> Optional[ResponseSchemaType]:
+    def get_by_id(self, item_id: int) -> Optional[ResponseSchemaType]:
         """
         Get item by ID
 
@@ -336,7 +356,7 @@ class GenericDatabaseService(Generic[ModelType, CreateSchemaType, ResponseSchema
             logger.error(f"Error getting {self.model.__name__} by ID {item_id}: {str(e)}")
             raise DatabaseError(f"Failed to retrieve {self.model.__name__}", e)
 
-    async def get_all(
+    def get_all(
             self,
             order_by: Optional[str] = None,
             desc: bool = False
@@ -368,7 +388,7 @@ class GenericDatabaseService(Generic[ModelType, CreateSchemaType, ResponseSchema
             logger.error(f"Error getting all {self.model.__name__}: {str(e)}")
             raise DatabaseError(f"Failed to retrieve {self.model.__name__} list", e)
 
-    async def get_by_column(
+    def get_by_column(
             self,
             column_name: str,
             value: Any
@@ -420,7 +440,213 @@ class GenericDatabaseService(Generic[ModelType, CreateSchemaType, ResponseSchema
 
     # Advanced Query Operations
 
-    async def get_by_ids(self, item_ids: List[Union[str, int]]) -> List[ResponseSchemaType]:
+    def query(
+            self,
+            filters: Sequence[Tuple[str, str, Any]] = (),
+            order_by: Sequence[Tuple[str, str]] = (),
+            limit: Optional[int] = None
+    ) -> List[ResponseSchemaType]:
+        """
+        Get items matching all filters, ordered and limited in the database
+
+        Args:
+            filters: (column name, operator, value) triples combined with AND; operators are =, !=, <, <=, >, >= and in
+            order_by: (column name, "asc" or "desc") pairs, applied in order
+            limit: Maximum number of items to return
+
+        Returns:
+            List of items as response schemas
+
+        Raises:
+            HTTPException: 400 for unknown columns or operators
+        """
+        try:
+            query = self._filtered_query(filters, [name for name, _ in order_by])
+
+            for column_name, direction in order_by:
+                order_column = getattr(self.model, column_name)
+                query = query.order_by(order_column.desc() if direction == "desc" else order_column.asc())
+
+            if limit is not None:
+                query = query.limit(limit)
+
+            return self._convert_to_response_list(query.all())
+
+        except HTTPException:
+            raise
+        except Exception as e:
+            logger.error(f"Error querying {self.model.__name__}: {str(e)}")
+            raise DatabaseError(f"Failed to query {self.model.__name__}", e)
+
+    def get_latest_per_group(
+            self,
+            group_by: str,
+            latest_by: str,
+            filters: Sequence[Tuple[str, str, Any]] = ()
+    ) -> List[ResponseSchemaType]:
+        """
+        Get the latest item for each distinct value of a column, in a single query
+
+        Args:
+            group_by: Column whose distinct values each get one item, e.g. a foreign key
+            latest_by: Column deciding which item of a group is latest, e.g. a timestamp
+            filters: (column name, operator, value) triples as in query()
+
+        Returns:
+            List of items as response schemas, one per group
+        """
+        try:
+            query = self._filtered_query(filters, [group_by, latest_by])
+            group_column = getattr(self.model, group_by)
+            latest_column = getattr(self.model, latest_by)
+
+            # PostgreSQL DISTINCT ON keeps the first row of each group under this ordering
+            items = query.distinct(group_column).order_by(group_column, latest_column.desc()).all()
+
+            return self._convert_to_response_list(items)
+
+        except HTTPException:
+            raise
+        except Exception as e:
+            logger.error(f"Error getting latest {self.model.__name__} per {group_by}: {str(e)}")
+            raise DatabaseError(f"Failed to retrieve latest {self.model.__name__} per {group_by}", e)
+
+    def get_latest_as_of(
+            self,
+            group_by: str,
+            group_values: Sequence[Any],
+            latest_by: str,
+            as_of_values: Sequence[Any],
+            filters: Sequence[Tuple[str, str, Any]] = ()
+    ) -> Dict[Tuple[Any, Any], ResponseSchemaType]:
+        """
+        Get, for every group value and as-of point, the latest item on or before that point, in a single query
+
+        Args:
+            group_by: Column identifying a group, e.g. a foreign key
+            group_values: Groups to look up
+            latest_by: Ordered column the as-of points refer to, e.g. a timestamp
+            as_of_values: As-of points to look up for every group
+            filters: (column name, operator, value) triples as in query()
+
+        Returns:
+            Dictionary keyed by (group value, as-of value) as passed in; pairs with no item on or before the point
+            are left out
+        """
+        try:
+            if not group_values or not as_of_values:
+                return {}
+
+            inner = self._filtered_query(filters, [group_by, latest_by])
+            group_column = getattr(self.model, group_by)
+            latest_column = getattr(self.model, latest_by)
+
+            groups = func.unnest(literal(list(group_values), ARRAY(group_column.type))).table_valued(
+                "group_value").alias("groups")
+            points = func.unnest(literal(list(as_of_values), ARRAY(latest_column.type))).table_valued(
+                "as_of", with_ordinality="position").alias("points")
+
+            # groups x points, each joined LATERAL to its newest row on or before the point (one index probe each)
+            latest = inner.filter(
+                group_column == groups.c.group_value,
+                latest_column <= points.c.as_of
+            ).order_by(latest_column.desc()).limit(1).statement.lateral("latest")
+            latest_item = aliased(self.model, latest)
+
+            rows = (
+                self.db.query(groups.c.group_value, points.c.position, latest_item)
+                .select_from(groups)
+                .join(points, true())
+                .join(latest_item, true())
+                .all()
+            )
+
+            # Key by the caller's own as-of values, which need not survive a database round-trip unchanged
+            return {
+                (group_value, as_of_values[position - 1]): self._convert_to_response(item)
+                for group_value, position, item in rows
+            }
+
+        except HTTPException:
+            raise
+        except Exception as e:
+            logger.error(f"Error getting {self.model.__name__} as of {latest_by} per {group_by}: {str(e)}")
+            raise DatabaseError(f"Failed to retrieve {self.model.__name__} as of {latest_by}", e)
+
+    def get_latest_per_related(
+            self,
+            related_model: Type,
+            foreign_key: str,
+            related_by: str,
+            related_values: Sequence[Any],
+            latest_by: str,
+            filters: Sequence[Tuple[str, str, Any]] = ()
+    ) -> Dict[Any, ResponseSchemaType]:
+        """
+        Get the latest item for each related row matched by a column of that row, resolved in a single join
+
+        Args:
+            related_model: Model the foreign key points at, e.g. a bond for a price
+            foreign_key: Column of this model holding the related row's primary key
+            related_by: Column of the related model to look rows up by, e.g. a symbol
+            related_values: Values of related_by to look up
+            latest_by: Column deciding which item of a related row is latest, e.g. a timestamp
+            filters: (column name, operator, value) triples on this model as in query()
+
+        Returns:
+            Dictionary keyed by related_by value; values with no related row or no item are left out
+        """
+        try:
+            if not related_values:
+                return {}
+
+            query = self._filtered_query(filters, [foreign_key, latest_by])
+            related_column = getattr(related_model, related_by)
+            related_pk = inspect(related_model).primary_key[0]
+            latest_column = getattr(self.model, latest_by)
+
+            # PostgreSQL DISTINCT ON keeps the newest joined row per related value
+            rows = (
+                query.add_columns(related_column)
+                .join(related_model, getattr(self.model, foreign_key) == related_pk)
+                .filter(related_column.in_(list(related_values)))
+                .distinct(related_column)
+                .order_by(related_column, latest_column.desc())
+                .all()
+            )
+
+            return {related_value: self._convert_to_response(item) for item, related_value in rows}
+
+        except HTTPException:
+            raise
+        except Exception as e:
+            logger.error(f"Error getting latest {self.model.__name__} per {related_model.__name__}.{related_by}: "
+                         f"{str(e)}")
+            raise DatabaseError(f"Failed to retrieve latest {self.model.__name__} per {related_by}", e)
+
+    def _filtered_query(self, filters: Sequence[Tuple[str, str, Any]], other_columns: Sequence[str] = ()):
+        """Query with the filters applied, after checking every filter and other referenced column exists"""
+        model_columns = {column.name: column for column in inspect(self.model).columns}
+        unknown = [name for name in (*(f[0] for f in filters), *other_columns) if name not in model_columns]
+        if unknown:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Column(s) {', '.join(unknown)} do not exist in {self.model.__name__}"
+            )
+
+        query = self.db.query(self.model)
+
+        for column_name, op, value in filters:
+            if op not in _FILTER_OPERATORS:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail=f"Unsupported filter operator '{op}'"
+                )
+            query = query.filter(_FILTER_OPERATORS[op](getattr(self.model, column_name), value))
+
+        return query
+
+    def get_by_ids(self, item_ids: List[Union[str, int]]) -> List[ResponseSchemaType]:
         """
         Get multiple items by their IDs
 
@@ -442,7 +668,7 @@ class GenericDatabaseService(Generic[ModelType, CreateSchemaType, ResponseSchema
             logger.error(f"Error getting {self.model.__name__} by IDs: {str(e)}")
             raise DatabaseError(f"Failed to retrieve {self.model.__name__} by IDs", e)
 
-    async def count(self, **filters) -> int:
+    def count(self, **filters) -> int:
         """
         Count items with optional filters
 
@@ -466,7 +692,7 @@ class GenericDatabaseService(Generic[ModelType, CreateSchemaType, ResponseSchema
             logger.error(f"Error counting {self.model.__name__}: {str(e)}")
             raise DatabaseError(f"Failed to count {self.model.__name__}", e)
 
-    async def exists(self, item_id: Union[str, int]) -> bool:
+    def exists(self, item_id: Union[str, int]) -> bool:
         """
         Check if an item exists by ID
 
@@ -486,7 +712,7 @@ class GenericDatabaseService(Generic[ModelType, CreateSchemaType, ResponseSchema
             logger.error(f"Error checking {self.model.__name__} existence: {str(e)}")
             return False
 
-    async def bulk_create(self, items_data: List[CreateSchemaType]) -> List[ResponseSchemaType]:
+    def bulk_create(self, items_data: List[CreateSchemaType]) -> List[ResponseSchemaType]:
         """
         Create multiple items in bulk
 
@@ -525,7 +751,7 @@ class GenericDatabaseService(Generic[ModelType, CreateSchemaType, ResponseSchema
             logger.error(f"Error in bulk create {self.model.__name__}: {str(e)}")
             raise DatabaseError(f"Failed to bulk create {self.model.__name__}", e)
 
-    async def search(
+    def search(
             self,
             search_term: str,
             search_columns: List[str]
@@ -567,7 +793,7 @@ class GenericDatabaseService(Generic[ModelType, CreateSchemaType, ResponseSchema
 
     # Raw SQL Support
 
-    async def execute_raw_query(self, query: str, params: Dict[str, Any] = None) -> List[Dict[str, Any]]:
+    def execute_raw_query(self, query: str, params: Dict[str, Any] = None) -> List[Dict[str, Any]]:
         """
         Execute raw SQL query and return results
 
@@ -580,7 +806,7 @@ class GenericDatabaseService(Generic[ModelType, CreateSchemaType, ResponseSchema
         """
         try:
             result = self.db.execute(text(query), params or {})
-            return [dict(row) for row in result]
+            return [dict(row) for row in result.mappings()]
 
         except Exception as e:
             logger.error(f"Error executing raw query: {str(e)}")
@@ -10,8 +10,10 @@ from fixed_income.src.config import settings
 engine = create_engine(
     settings.DATABASE_URL,
     pool_pre_ping=True,  # Checks connection health before use
-    pool_size=20,  # Number of connections to keep open
-    max_overflow=10  # Number of connections to create beyond pool_size
+    pool_size=settings.DB_POOL_SIZE,  # Number of connections to keep open
+    max_overflow=settings.DB_MAX_OVERFLOW,  # Number of connections to create beyond pool_size
+    pool_timeout=settings.DB_POOL_TIMEOUT,  # Seconds to wait for a free connection
+    pool_recycle=settings.DB_POOL_RECYCLE  # Recycle connections before server/proxy idle timeouts
 )
 
 # Session factory
@@ -1,20 +1,31 @@
+import atexit
 import logging
+import queue
+import time
+from collections import defaultdict
 from datetime import datetime
 from decimal import Decimal
-from typing import Any, Dict, List, Optional, Type
-
-from fastapi import Body, Depends, FastAPI, HTTPException, Path, Query, status
+from functools import lru_cache
+from logging.handlers import QueueHandler, QueueListener
+from typing import Annotated, Any, Dict, List, Optional, Tuple, Type
+
+import orjson
+from fastapi import Body, Depends, FastAPI, HTTPException, Path, Query, Request, Response, status
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import ORJSONResponse
 from fastapi.security import OAuth2PasswordBearer
 from fixed_income.src.api.bond_schema.BondPriceSchema import (
     BondPriceRequest,
     BondPriceResponse
 )
-from pydantic import BaseModel
+from pydantic import BaseModel, BeforeValidator, ConfigDict, TypeAdapter, ValidationError, create_model
+from pydantic.fields import FieldInfo
 
 # Import all bond schemas using your existing imports
+from fixed_income.src.config import settings
 from fixed_income.src.controller.fixed_income_controller import FixedIncomeController, get_fixed_income_controller
 from fixed_income.src.model.enums import BondTypeEnum
-from fixed_income.src.utils.model_mappers import bond_model_factory, bond_schema_factory
+from fixed_income.src.utils.model_mappers import SUPPORTED_BOND_TYPES, bond_model_factory, bond_schema_factory
 
 logger = logging.getLogger(__name__)
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="token")
@@ -25,105 +36,197 @@ fixed_income_router = FastAPI(
     version="2.0.0",
     description="Microservice for bond and fixed income instrument management with dynamic schema loading",
     docs_url="/api/docs",
-    redoc_url="/api/redoc"
+    redoc_url="/api/redoc",
+    default_response_class=ORJSONResponse
 )
 
 
 # === Helper Functions ===
 
-def validate_bond_type(bond_type: str) -> BondTypeEnum:
-    """Validate and return bond type enum"""
-    bond_type_upper = bond_type.upper()
-    try:
-        return BondTypeEnum(bond_type_upper)
-    except ValueError:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Unsupported bond type: {bond_type}. Supported types: {[e.value for e in BondTypeEnum]}"
-        )
+async def _common_deps(
+        controller: FixedIncomeController = Depends(get_fixed_income_controller),
+        token: str = Depends(oauth2_scheme)
+) -> Tuple[FixedIncomeController, str]:
+    """Resolve the controller and bearer token shared by every bond endpoint"""
+    return controller, token
 
 
-def get_bond_schemas(bond_type: BondTypeEnum) -> Dict[str, Type[BaseModel]]:
-    """Get request and response schemas for a bond type using factory"""
-    try:
-        return bond_schema_factory(bond_type.value)
-    except ValueError as e:
+# Single dependency for the (controller, token) pair; FastAPI resolves it once per request
+CommonDeps = Annotated[Tuple[FixedIncomeController, str], Depends(_common_deps)]
+
+
+def _normalize_bond_type(value: Any) -> Any:
+    """Accept bond types in any casing; enum values are uppercase"""
+    return value.upper() if isinstance(value, str) else value
+
+
+# Path parameter validated against BondTypeEnum during request parsing (422 on unknown types)
+BondTypePath = Annotated[BondTypeEnum, BeforeValidator(_normalize_bond_type), Path(description="Bond type")]
+
+
+@lru_cache(maxsize=64)
+def _resolve(bond_type: str) -> Tuple[BondTypeEnum, Type[BaseModel], Type[BaseModel], Type]:
+    """Resolve a raw bond type string to (enum, request schema, response schema, model)"""
+    bond_type_upper = bond_type.upper()
+    if bond_type_upper not in SUPPORTED_BOND_TYPES:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail=str(e)
+            detail=f"Unsupported bond type: {bond_type}. Supported types: {[e.value for e in BondTypeEnum]}"
         )
+    request_schema, response_schema = bond_schema_factory(bond_type_upper)
+    return BondTypeEnum(bond_type_upper), request_schema, response_schema, bond_model_factory(bond_type_upper)
 
 
 def get_request_schema(bond_type: BondTypeEnum) -> Type[BaseModel]:
     """Get request schema for a bond type"""
-    return get_bond_schemas(bond_type)["request"]
-
-
-def get_response_schema(bond_type: BondTypeEnum) -> Type[BaseModel]:
-    """Get response schema for a bond type"""
-    return get_bond_schemas(bond_type)["response"]
+    return _resolve(bond_type)[1]
 
 
 def get_bond_model(bond_type: BondTypeEnum):
     """Get bond model class for a bond type"""
+    return _resolve(bond_type)[3]
+
+
+def _build_partial_schema(request_schema: Type[BaseModel]) -> Type[BaseModel]:
+    """Build a PATCH schema: every request field optional (default None), constraints kept.
+
+    Cross-field model validators are not inherited, since they assume a complete bond.
+    """
+    fields = {
+        name: (Optional[field.annotation], FieldInfo.merge_field_infos(field, default=None))
+        for name, field in request_schema.model_fields.items()
+    }
+    return create_model(
+        f"Partial{request_schema.__name__}",
+        __config__=ConfigDict(extra="forbid"),
+        **fields
+    )
+
+
+# Bond type and schema introspection output is static, so build and serialize it once
+_BOND_TYPE_VALUES: List[str] = [bond_type.value for bond_type in BondTypeEnum]
+_BOND_TYPES_BYTES: bytes = orjson.dumps(_BOND_TYPE_VALUES)
+_SCHEMA_JSON: Dict[str, bytes] = {}
+_SCHEMA_REGISTRY_STATUS: Dict[str, Dict[str, Any]] = {}
+# Validates a whole bulk payload in one pydantic-core pass
+_LIST_ADAPTERS: Dict[str, TypeAdapter] = {}
+# Serializes bond listings straight to JSON bytes, bypassing jsonable_encoder
+_RESPONSE_LIST_ADAPTERS: Dict[str, TypeAdapter] = {}
+# Validates PATCH payloads field by field against the request schema's constraints
+_PARTIAL_ADAPTERS: Dict[str, TypeAdapter] = {}
+for _bond_type in _BOND_TYPE_VALUES:
+    _request_schema, _response_schema = bond_schema_factory(_bond_type)
+    _model_class = bond_model_factory(_bond_type)
+    _LIST_ADAPTERS[_bond_type] = TypeAdapter(List[_request_schema])
+    _RESPONSE_LIST_ADAPTERS[_bond_type] = TypeAdapter(List[_response_schema])
+    _PARTIAL_ADAPTERS[_bond_type] = TypeAdapter(_build_partial_schema(_request_schema))
+    _SCHEMA_JSON[_bond_type] = orjson.dumps({
+        "bond_type": _bond_type,
+        "request_schema": _request_schema.model_json_schema(),
+        "response_schema": _response_schema.model_json_schema(),
+        "model_class": _model_class.__name__,
+        "schema_title": f"{_bond_type} Bond Schema"
+    })
+    _SCHEMA_REGISTRY_STATUS[_bond_type] = {
+        "schemas_loaded": True,
+        "model_loaded": True,
+        "request_schema": _request_schema.__name__,
+        "response_schema": _response_schema.__name__,
+        "model_class": _model_class.__name__
+    }
+
+
+_ts_cache = [0, ""]  # [epoch second, isoformat string]
+
+
+def _cached_iso_now() -> str:
+    """Current local time as an ISO string, formatted at most once per second"""
+    now = int(time.time())
+    if now != _ts_cache[0]:
+        _ts_cache[:] = [now, datetime.fromtimestamp(now).isoformat()]
+    return _ts_cache[1]
+
+
+# Bulk-get bodies are parsed and validated straight from the raw JSON bytes in one pydantic-core pass
+_IDS_ADAPTER = TypeAdapter(List[int])
+_SYMBOLS_ADAPTER = TypeAdapter(List[str])
+
+
+def _json_body_openapi(adapter: TypeAdapter) -> Dict[str, Any]:
+    """OpenAPI request body for endpoints that read and validate the raw body themselves"""
+    return {
+        "requestBody": {
+            "required": True,
+            "content": {"application/json": {"schema": adapter.json_schema()}}
+        }
+    }
+
+
+def _parse_json_body(adapter: TypeAdapter, body: bytes):
+    """Parse and validate a raw JSON request body against a prebuilt adapter"""
     try:
-        return bond_model_factory(bond_type.value)
-    except ValueError as e:
+        return adapter.validate_json(body)
+    except ValidationError as e:
         raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=str(e)
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=f"Invalid request body: {str(e)}"
+        )
+
+
+def _check_bulk_get_size(size: int):
+    """Reject bulk-get requests above the single-query limit"""
+    if size > settings.BULK_GET_MAX_ITEMS:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"Bulk get accepts at most {settings.BULK_GET_MAX_ITEMS} items, got {size}"
         )
 
 
+def _bond_list_response(bond_type: BondTypeEnum, bonds: List[BaseModel]) -> Response:
+    """Serialize a list of bond response schemas to a JSON response in one pydantic-core pass"""
+    return Response(
+        content=_RESPONSE_LIST_ADAPTERS[bond_type.value].dump_json(bonds),
+        media_type="application/json"
+    )
+
+
 # === Bond Type Management ===
 @fixed_income_router.get("/bond-types", response_model=List[str])
 async def get_supported_bond_types(
-        controller: FixedIncomeController = Depends(get_fixed_income_controller),
-        token: str = Depends(oauth2_scheme)
+        deps: CommonDeps
 ):
     """Get list of supported bond types."""
-    return [bond_type.value for bond_type in BondTypeEnum]
+    return Response(content=_BOND_TYPES_BYTES, media_type="application/json")
 
 
 @fixed_income_router.get("/bond-types/summary", response_model=Dict[str, Any])
 async def get_all_bond_types_summary(
-        controller: FixedIncomeController = Depends(get_fixed_income_controller),
-        token: str = Depends(oauth2_scheme)
+        deps: CommonDeps
 ):
     """Get summary statistics for all bond types."""
+    controller, _ = deps
     return await controller.get_all_bond_types_summary()
 
 
 @fixed_income_router.get("/bond-types/{bond_type}/schema")
 async def get_bond_type_schema(
-        bond_type: str = Path(..., description="Bond type"),
+        bond_type: BondTypePath,
         token: str = Depends(oauth2_scheme)
 ):
     """Get schema information for a specific bond type."""
-    bond_type_enum = validate_bond_type(bond_type)
-    schemas = get_bond_schemas(bond_type_enum)
-    model_class = get_bond_model(bond_type_enum)
-
-    return {
-        "bond_type": bond_type_enum.value,
-        "request_schema": schemas["request"].model_json_schema(),
-        "response_schema": schemas["response"].model_json_schema(),
-        "model_class": model_class.__name__,
-        "schema_title": f"{bond_type_enum.value} Bond Schema"
-    }
+    return Response(content=_SCHEMA_JSON[bond_type.value], media_type="application/json")
 
 
 @fixed_income_router.get("/bond-types/{bond_type}/model-info")
 async def get_bond_type_model_info(
-        bond_type: str = Path(..., description="Bond type"),
+        bond_type: BondTypePath,
         token: str = Depends(oauth2_scheme)
 ):
     """Get model information for a specific bond type."""
-    bond_type_enum = validate_bond_type(bond_type)
-    model_class = get_bond_model(bond_type_enum)
+    model_class = get_bond_model(bond_type)
 
     return {
-        "bond_type": bond_type_enum.value,
+        "bond_type": bond_type.value,
         "model_class": model_class.__name__,
         "model_module": model_class.__module__,
         "model_fields": list(model_class.__annotations__.keys()) if hasattr(model_class, '__annotations__') else [],
@@ -134,29 +237,26 @@ async def get_bond_type_model_info(
 # === Core Bond CRUD Operations with Dynamic Schemas ===
 @fixed_income_router.post("/{bond_type}/bonds", status_code=status.HTTP_201_CREATED)
 async def create_bond_dynamic(
-        bond_type: str = Path(..., description="Bond type"),
-        request: Dict[str, Any] = Body(..., description="Bond data"),
-        controller: FixedIncomeController = Depends(get_fixed_income_controller),
-        token: str = Depends(oauth2_scheme)
+        bond_type: BondTypePath,
+        deps: CommonDeps,
+        request: Dict[str, Any] = Body(..., description="Bond data")
 ):
     """Create a new bond instrument of specified type with dynamic schema validation."""
-    bond_type_enum = validate_bond_type(bond_type)
-
-    # Get the appropriate schema and validate the request
-    request_schema = get_request_schema(bond_type_enum)
+    controller, token = deps
+    request_schema = get_request_schema(bond_type)
 
     try:
         # Validate request data against the appropriate schema
-        validated_request = request_schema(**request)
+        validated_request = request_schema.model_validate(request)
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-            detail=f"Invalid {bond_type_enum.value} bond data: {str(e)}"
+            detail=f"Invalid {bond_type.value} bond data: {str(e)}"
         )
 
     result = await controller.create_bond(
         bond_data=validated_request,
-        bond_type=bond_type_enum,
+        bond_type=bond_type,
         user_token=token
     )
 
@@ -165,19 +265,17 @@ async def create_bond_dynamic(
 
 @fixed_income_router.get("/{bond_type}/bonds/{bond_id}")
 async def get_bond_dynamic(
-        bond_type: str = Path(..., description="Bond type"),
-        bond_id: int = Path(..., description="Bond ID"),
-        controller: FixedIncomeController = Depends(get_fixed_income_controller),
-        token: str = Depends(oauth2_scheme)
+        bond_type: BondTypePath,
+        deps: CommonDeps,
+        bond_id: int = Path(..., description="Bond ID")
 ):
     """Get a single bond instrument by ID and type with dynamic response schema."""
-    bond_type_enum = validate_bond_type(bond_type)
-
-    bond = await controller.get_bond_by_id(bond_id, bond_type_enum)
+    controller, _ = deps
+    bond = await controller.get_bond_by_id(bond_id, bond_type)
     if not bond:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"{bond_type_enum.value} bond {bond_id} not found"
+            detail=f"{bond_type.value} bond {bond_id} not found"
         )
 
     return bond
@@ -185,19 +283,17 @@ async def get_bond_dynamic(
 
 @fixed_income_router.get("/{bond_type}/bonds/symbol/{symbol}")
 async def get_bond_by_symbol_dynamic(
-        bond_type: str = Path(..., description="Bond type"),
-        symbol: str = Path(..., description="Bond symbol"),
-        controller: FixedIncomeController = Depends(get_fixed_income_controller),
-        token: str = Depends(oauth2_scheme)
+        bond_type: BondTypePath,
+        deps: CommonDeps,
+        symbol: str = Path(..., description="Bond symbol")
 ):
     """Get bond instrument by symbol and type with dynamic response schema."""
-    bond_type_enum = validate_bond_type(bond_type)
-
-    bond = await controller.get_bond_by_symbol(symbol, bond_type_enum)
+    controller, _ = deps
+    bond = await controller.get_bond_by_symbol(symbol, bond_type)
     if not bond:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"{bond_type_enum.value} bond with symbol {symbol} not found"
+            detail=f"{bond_type.value} bond with symbol {symbol} not found"
         )
 
     return bond
@@ -205,119 +301,100 @@ async def get_bond_by_symbol_dynamic(
 
 @fixed_income_router.put("/{bond_type}/bonds/{bond_id}")
 async def update_bond_dynamic(
-        bond_type: str = Path(..., description="Bond type"),
+        bond_type: BondTypePath,
+        deps: CommonDeps,
         bond_id: int = Path(..., description="Bond ID"),
-        request: Dict[str, Any] = Body(..., description="Bond data"),
-        controller: FixedIncomeController = Depends(get_fixed_income_controller),
-        token: str = Depends(oauth2_scheme)
+        request: Dict[str, Any] = Body(..., description="Bond data")
 ):
     """Update an existing bond instrument with dynamic schema validation."""
-    bond_type_enum = validate_bond_type(bond_type)
-
-    # Get the appropriate schema and validate the request
-    request_schema = get_request_schema(bond_type_enum)
+    controller, token = deps
+    request_schema = get_request_schema(bond_type)
 
     try:
         # Validate request data against the appropriate schema
-        validated_request = request_schema(**request)
+        validated_request = request_schema.model_validate(request)
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-            detail=f"Invalid {bond_type_enum.value} bond data: {str(e)}"
+            detail=f"Invalid {bond_type.value} bond data: {str(e)}"
         )
 
     return await controller.update_bond(
         bond_id=bond_id,
         bond_data=validated_request,
-        bond_type=bond_type_enum,
+        bond_type=bond_type,
         user_token=token
     )
 
 
 @fixed_income_router.patch("/{bond_type}/bonds/{bond_id}")
 async def partial_update_bond_dynamic(
-        bond_type: str = Path(..., description="Bond type"),
+        bond_type: BondTypePath,
+        deps: CommonDeps,
         bond_id: int = Path(..., description="Bond ID"),
-        request: Dict[str, Any] = Body(..., description="Partial bond data"),
-        controller: FixedIncomeController = Depends(get_fixed_income_controller),
-        token: str = Depends(oauth2_scheme)
+        request: Dict[str, Any] = Body(..., description="Partial bond data")
 ):
     """Partially update an existing bond instrument with dynamic schema validation."""
-    bond_type_enum = validate_bond_type(bond_type)
-
-    # For partial updates, we validate only the provided fields
-    # You might want to create a custom partial validation function
+    controller, token = deps
+    try:
+        # Only the provided fields are set, so exclude_unset downstream updates just those
+        validated_request = _PARTIAL_ADAPTERS[bond_type.value].validate_python(request)
+    except ValidationError as e:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=f"Invalid {bond_type.value} bond data: {str(e)}"
+        )
 
     return await controller.partial_update_bond(
         bond_id=bond_id,
-        bond_data=request,  # Pass raw dict for partial updates
-        bond_type=bond_type_enum,
+        bond_data=validated_request,
+        bond_type=bond_type,
         user_token=token
     )
 
 
 @fixed_income_router.delete("/{bond_type}/bonds/{bond_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_bond_dynamic(
-        bond_type: str = Path(..., description="Bond type"),
-        bond_id: int = Path(..., description="Bond ID"),
-        controller: FixedIncomeController = Depends(get_fixed_income_controller),
-        token: str = Depends(oauth2_scheme)
+        bond_type: BondTypePath,
+        deps: CommonDeps,
+        bond_id: int = Path(..., description="Bond ID")
 ):
     """Delete a bond instrument with dynamic type validation."""
-    bond_type_enum = validate_bond_type(bond_type)
-
+    controller, token = deps
     success = await controller.delete_bond(
         bond_id=bond_id,
-        bond_type=bond_type_enum,
+        bond_type=bond_type,
         user_token=token
     )
     if not success:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"{bond_type_enum.value} bond {bond_id} not found"
+            detail=f"{bond_type.value} bond {bond_id} not found"
         )
 
 
 # === Bond Bulk Operations with Dynamic Schemas ===
-@fixed_income_router.post("/{bond_type}/bonds/bulk/create")
-async def bulk_create_bonds_dynamic(
-        bond_type: str = Path(..., description="Bond type"),
-        bulk_request: List[Dict[str, Any]] = Body(..., description="List of bond data"),
-        controller: FixedIncomeController = Depends(get_fixed_income_controller),
-        token: str = Depends(oauth2_scheme)
-):
-    """Create multiple bond instruments in bulk for a specific type with dynamic schema validation."""
-    bond_type_enum = validate_bond_type(bond_type)
+# Bulk payloads above this size are validated in the threadpool so the event loop stays free
+_THREADED_VALIDATION_THRESHOLD = 256
 
-    # Get the appropriate schema and validate all requests
-    request_schema = get_request_schema(bond_type_enum)
-    validated_requests = []
 
-    for i, bond_data in enumerate(bulk_request):
-        try:
-            validated_request = request_schema(**bond_data)
-            validated_requests.append(validated_request)
-        except Exception as e:
-            raise HTTPException(
-                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-                detail=f"Invalid {bond_type_enum.value} bond data at index {i}: {str(e)}"
-            )
-
-    return await controller.bulk_create_bonds(
-        bulk_request=validated_requests,
-        bond_type=bond_type_enum,
-        user_token=token
-    )
+def _validate_bulk(bond_type: BondTypeEnum, bulk_request: List[Dict[str, Any]]):
+    """Validate a single-type bulk payload against the bond type's request schema"""
+    try:
+        return _LIST_ADAPTERS[bond_type.value].validate_python(bulk_request)
+    except ValidationError as e:
+        index = e.errors()[0]["loc"][0]
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=f"Invalid {bond_type.value} bond data at index {index}: {str(e)}"
+        )
 
 
-@fixed_income_router.post("/bonds/bulk/create-mixed")
-async def bulk_create_mixed_bonds_dynamic(
-        bond_requests: List[Dict[str, Any]] = Body(..., description="List of {bond_type, bond_data} objects"),
-        controller: FixedIncomeController = Depends(get_fixed_income_controller),
-        token: str = Depends(oauth2_scheme)
-):
-    """Create multiple bonds of different types in bulk with dynamic schema validation."""
-    validated_requests = []
+def _validate_mixed_bulk(bond_requests: List[Dict[str, Any]]):
+    """Validate a mixed-type bulk payload, grouping the results by bond type"""
+    # Grouped by bond type so each type is inserted as one batch downstream
+    grouped_requests: Dict[BondTypeEnum, List[BaseModel]] = defaultdict(list)
+    schemas_by_type = {}
 
     for i, bond_request in enumerate(bond_requests):
         if "bond_type" not in bond_request or "bond_data" not in bond_request:
@@ -326,54 +403,94 @@ async def bulk_create_mixed_bonds_dynamic(
                 detail=f"Missing bond_type or bond_data at index {i}"
             )
 
-        bond_type_enum = validate_bond_type(bond_request["bond_type"])
+        raw_bond_type = bond_request["bond_type"]
         bond_data = bond_request["bond_data"]
 
-        # Get the appropriate schema and validate
-        request_schema = get_request_schema(bond_type_enum)
+        # Resolve each bond type's schema once per request
+        if raw_bond_type not in schemas_by_type:
+            schemas_by_type[raw_bond_type] = _resolve(raw_bond_type)[:2]
+        bond_type, request_schema = schemas_by_type[raw_bond_type]
 
         try:
-            validated_request = request_schema(**bond_data)
-            validated_requests.append((bond_type_enum, validated_request))
+            validated_request = request_schema.model_validate(bond_data)
+            grouped_requests[bond_type].append(validated_request)
         except Exception as e:
             raise HTTPException(
                 status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-                detail=f"Invalid {bond_type_enum.value} bond data at index {i}: {str(e)}"
+                detail=f"Invalid {bond_type.value} bond data at index {i}: {str(e)}"
             )
 
-    return await controller.bulk_create_mixed_bonds(validated_requests, token)
+    return grouped_requests
 
 
-@fixed_income_router.post("/{bond_type}/bonds/bulk/get")
+@fixed_income_router.post("/{bond_type}/bonds/bulk/create")
+async def bulk_create_bonds_dynamic(
+        bond_type: BondTypePath,
+        deps: CommonDeps,
+        bulk_request: List[Dict[str, Any]] = Body(..., description="List of bond data")
+):
+    """Create multiple bond instruments in bulk for a specific type with dynamic schema validation."""
+    controller, token = deps
+    if len(bulk_request) > _THREADED_VALIDATION_THRESHOLD:
+        validated_requests = await run_in_threadpool(_validate_bulk, bond_type, bulk_request)
+    else:
+        validated_requests = _validate_bulk(bond_type, bulk_request)
+
+    return await controller.bulk_create_bonds(
+        bulk_request=validated_requests,
+        bond_type=bond_type,
+        user_token=token
+    )
+
+
+@fixed_income_router.post("/bonds/bulk/create-mixed")
+async def bulk_create_mixed_bonds_dynamic(
+        deps: CommonDeps,
+        bond_requests: List[Dict[str, Any]] = Body(..., description="List of {bond_type, bond_data} objects")
+):
+    """Create multiple bonds of different types in bulk with dynamic schema validation."""
+    controller, token = deps
+    if len(bond_requests) > _THREADED_VALIDATION_THRESHOLD:
+        grouped_requests = await run_in_threadpool(_validate_mixed_bulk, bond_requests)
+    else:
+        grouped_requests = _validate_mixed_bulk(bond_requests)
+
+    return await controller.bulk_create_mixed_bonds(grouped_requests, token)
+
+
+@fixed_income_router.post("/{bond_type}/bonds/bulk/get", openapi_extra=_json_body_openapi(_IDS_ADAPTER))
 async def bulk_get_bonds_dynamic(
-        bond_type: str = Path(..., description="Bond type"),
-        bond_ids: List[int] = Body(..., description="List of bond IDs"),
-        controller: FixedIncomeController = Depends(get_fixed_income_controller),
-        token: str = Depends(oauth2_scheme)
+        bond_type: BondTypePath,
+        deps: CommonDeps,
+        request: Request
 ):
-    """Get multiple bond instruments by IDs for a specific type."""
-    bond_type_enum = validate_bond_type(bond_type)
-    return await controller.get_bonds_bulk(bond_ids, bond_type_enum)
+    """Get multiple bond instruments by IDs for a specific type, fetched in a single query."""
+    controller, _ = deps
+    bond_ids = _parse_json_body(_IDS_ADAPTER, await request.body())
+    _check_bulk_get_size(len(bond_ids))
+    bonds = await controller.get_bonds_bulk(bond_ids, bond_type)
+    return _bond_list_response(bond_type, bonds)
 
 
-@fixed_income_router.post("/{bond_type}/bonds/bulk/get-by-symbols")
+@fixed_income_router.post("/{bond_type}/bonds/bulk/get-by-symbols", openapi_extra=_json_body_openapi(_SYMBOLS_ADAPTER))
 async def bulk_get_bonds_by_symbols_dynamic(
-        bond_type: str = Path(..., description="Bond type"),
-        symbols: List[str] = Body(..., description="List of bond symbols"),
-        controller: FixedIncomeController = Depends(get_fixed_income_controller),
-        token: str = Depends(oauth2_scheme)
+        bond_type: BondTypePath,
+        deps: CommonDeps,
+        request: Request
 ):
-    """Get multiple bond instruments by symbols for a specific type."""
-    bond_type_enum = validate_bond_type(bond_type)
-    return await controller.get_bonds_by_symbols_bulk(symbols, bond_type_enum)
+    """Get multiple bond instruments by symbols for a specific type, fetched in a single query."""
+    controller, _ = deps
+    symbols = _parse_json_body(_SYMBOLS_ADAPTER, await request.body())
+    _check_bulk_get_size(len(symbols))
+    bonds = await controller.get_bonds_by_symbols_bulk(symbols, bond_type)
+    return _bond_list_response(bond_type, bonds)
 
 
 # === Bond Listing and Search ===
 @fixed_income_router.get("/{bond_type}/bonds")
 async def get_bonds_dynamic(
-        bond_type: str = Path(..., description="Bond type"),
-        controller: FixedIncomeController = Depends(get_fixed_income_controller),
-        token: str = Depends(oauth2_scheme),
+        bond_type: BondTypePath,
+        deps: CommonDeps,
         issuer: Optional[str] = Query(None, description="Filter by issuer"),
         currency: Optional[str] = Query(None, description="Filter by currency"),
         active_only: bool = Query(False, description="Get only active bonds"),
@@ -383,100 +500,97 @@ async def get_bonds_dynamic(
         end_date: Optional[datetime] = Query(None, description="Maturity end date filter")
 ):
     """Get list of bond instruments with optional filtering for a specific type."""
-    bond_type_enum = validate_bond_type(bond_type)
-
+    controller, _ = deps
     if issuer:
-        return await controller.get_bonds_by_issuer(issuer, bond_type_enum)
+        bonds = await controller.get_bonds_by_issuer(issuer, bond_type)
     elif currency:
-        return await controller.get_bonds_by_currency(currency, bond_type_enum)
+        bonds = await controller.get_bonds_by_currency(currency, bond_type)
     elif start_date and end_date:
-        return await controller.get_bonds_by_maturity_range(start_date, end_date, bond_type_enum)
+        # Raw row mappings, not response schemas; left to the default response class
+        return await controller.get_bonds_by_maturity_range(start_date, end_date, bond_type)
     elif active_only:
-        return await controller.get_active_bonds(bond_type_enum)
+        bonds = await controller.get_active_bonds(bond_type)
     else:
-        return await controller.get_all_bonds(bond_type_enum, order_by, desc)
+        bonds = await controller.get_all_bonds(bond_type, order_by, desc)
+
+    # Listings can be large; serialize them in pydantic-core rather than via jsonable_encoder
+    return _bond_list_response(bond_type, bonds)
 
 
 @fixed_income_router.get("/{bond_type}/bonds/search/{search_term}")
 async def search_bonds_dynamic(
-        bond_type: str = Path(..., description="Bond type"),
-        search_term: str = Path(..., description="Search term"),
-        controller: FixedIncomeController = Depends(get_fixed_income_controller),
-        token: str = Depends(oauth2_scheme)
+        bond_type: BondTypePath,
+        deps: CommonDeps,
+        search_term: str = Path(..., description="Search term")
 ):
     """Search bond instruments across multiple fields for a specific type."""
-    bond_type_enum = validate_bond_type(bond_type)
-    return await controller.search_bonds(search_term, bond_type_enum)
+    controller, _ = deps
+    bonds = await controller.search_bonds(search_term, bond_type)
+    return _bond_list_response(bond_type, bonds)
 
 
 # === Bond Validation ===
 @fixed_income_router.post("/{bond_type}/bonds/validate/exists", response_model=Dict[int, bool])
 async def validate_bonds_exist_dynamic(
-        bond_type: str = Path(..., description="Bond type"),
-        bond_ids: List[int] = Body(..., description="List of bond IDs to validate"),
-        controller: FixedIncomeController = Depends(get_fixed_income_controller),
-        token: str = Depends(oauth2_scheme)
+        bond_type: BondTypePath,
+        deps: CommonDeps,
+        bond_ids: List[int] = Body(..., description="List of bond IDs to validate")
 ):
     """Validate that multiple bonds exist for a specific type."""
-    bond_type_enum = validate_bond_type(bond_type)
-    return await controller.validate_bonds_exist(bond_ids, bond_type_enum)
+    controller, _ = deps
+    return await controller.validate_bonds_exist(bond_ids, bond_type)
 
 
 @fixed_income_router.get("/{bond_type}/bonds/validate/{bond_id}/exists")
 async def validate_bond_exists_dynamic(
-        bond_type: str = Path(..., description="Bond type"),
-        bond_id: int = Path(..., description="Bond ID"),
-        controller: FixedIncomeController = Depends(get_fixed_income_controller),
-        token: str = Depends(oauth2_scheme)
+        bond_type: BondTypePath,
+        deps: CommonDeps,
+        bond_id: int = Path(..., description="Bond ID")
 ):
     """Validate that a single bond exists for a specific type."""
-    bond_type_enum = validate_bond_type(bond_type)
-    exists = await controller.validate_bond_exists(bond_id, bond_type_enum)
+    controller, _ = deps
+    exists = await controller.validate_bond_exists(bond_id, bond_type)
     return {
         "bond_id": bond_id,
-        "bond_type": bond_type_enum.value,
+        "bond_type": bond_type.value,
         "exists": exists,
-        "validated_at": datetime.now().isoformat()
+        "validated_at": _cached_iso_now()
     }
 
 
 # === Price Operations ===
 @fixed_income_router.get("/{bond_type}/bonds/{bond_id}/price/current", response_model=BondPriceResponse)
 async def get_current_price_dynamic(
-        bond_type: str = Path(..., description="Bond type"),
-        bond_id: int = Path(..., description="Bond ID"),
-        controller: FixedIncomeController = Depends(get_fixed_income_controller),
-        token: str = Depends(oauth2_scheme)
+        bond_type: BondTypePath,
+        deps: CommonDeps,
+        bond_id: int = Path(..., description="Bond ID")
 ):
     """Get current price for a specific bond."""
-    bond_type_enum = validate_bond_type(bond_type)
-
-    price = await controller.get_current_price(bond_id, bond_type_enum)
+    controller, _ = deps
+    price = await controller.get_current_price(bond_id, bond_type)
     if not price:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"No current price available for {bond_type_enum.value} bond {bond_id}"
+            detail=f"No current price available for {bond_type.value} bond {bond_id}"
         )
     return price
 
 
 @fixed_income_router.post("/{bond_type}/bonds/{bond_id}/price/update", response_model=BondPriceResponse)
 async def update_price_dynamic(
-        bond_type: str = Path(..., description="Bond type"),
+        bond_type: BondTypePath,
+        deps: CommonDeps,
         bond_id: int = Path(..., description="Bond ID"),
         price: Decimal = Body(..., description="New price"),
         timestamp: Optional[datetime] = Body(None, description="Price timestamp"),
         source: str = Body("manual", description="Price source"),
-        price_type: str = Body("clean", description="Price type (clean, dirty, yield)"),
-        controller: FixedIncomeController = Depends(get_fixed_income_controller),
-        token: str = Depends(oauth2_scheme)
+        price_type: str = Body("clean", description="Price type (clean, dirty, yield)")
 ):
     """Update price for a specific bond."""
-    bond_type_enum = validate_bond_type(bond_type)
-
+    controller, token = deps
     return await controller.update_price(
         bond_id=bond_id,
-        bond_type=bond_type_enum,
+        bond_type=bond_type,
         price=price,
         timestamp=timestamp,
         source=source,
@@ -486,36 +600,56 @@ async def update_price_dynamic(
 
 
 # === Advanced Typed Endpoints Generation ===
+# The bond type is bound by these factories rather than a default argument, so it is not
+# part of the endpoint signature FastAPI inspects (a default would surface as a query param).
+def _make_create_typed_bond(bond_type: BondTypeEnum, request_schema: Type[BaseModel]):
+    async def create_typed_bond(
+            request_data: request_schema,
+            deps: CommonDeps
+    ):
+        controller, token = deps
+        return await controller.create_bond(
+            bond_data=request_data,
+            bond_type=bond_type,
+            user_token=token
+        )
+
+    return create_typed_bond
+
+
+def _make_get_typed_bond(bond_type: BondTypeEnum):
+    async def get_typed_bond(
+            bond_id: int,
+            deps: CommonDeps
+    ):
+        controller, _ = deps
+        bond = await controller.get_bond_by_id(bond_id, bond_type)
+        if not bond:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"{bond_type.value} bond {bond_id} not found"
+            )
+        # The read service already returns a validated response_schema instance; returning
+        # a Response skips FastAPI re-validating it against response_model (kept for docs)
+        return Response(content=bond.model_dump_json(), media_type="application/json")
+
+    return get_typed_bond
+
+
 def create_typed_endpoints():
     """Create type-specific endpoints with proper schemas for better API documentation"""
 
     for bond_type in BondTypeEnum:
         try:
-            schemas = bond_schema_factory(bond_type.value)
-            request_schema = schemas["request"]
-            response_schema = schemas["response"]
-            model_class = bond_model_factory(bond_type.value)
+            request_schema, response_schema = bond_schema_factory(bond_type.value)
 
             # Create a route tag for this bond type
             tag_name = f"{bond_type.value.lower().replace('_', '-')}-typed"
 
-            # Create typed endpoint for bond creation
-            async def create_typed_bond(
-                    request_data: request_schema,
-                    controller: FixedIncomeController = Depends(get_fixed_income_controller),
-                    token: str = Depends(oauth2_scheme),
-                    _bond_type: BondTypeEnum = bond_type  # Capture in closure
-            ):
-                return await controller.create_bond(
-                    bond_data=request_data,
-                    bond_type=_bond_type,
-                    user_token=token
-                )
-
             # Register the typed endpoint
             fixed_income_router.add_api_route(
                 path=f"/typed/{bond_type.value.lower()}/bonds",
-                endpoint=create_typed_bond,
+                endpoint=_make_create_typed_bond(bond_type, request_schema),
                 methods=["POST"],
                 response_model=response_schema,
                 status_code=status.HTTP_201_CREATED,
@@ -524,25 +658,10 @@ def create_typed_endpoints():
                 description=f"Create a new {bond_type.value} bond with strongly typed schema validation"
             )
 
-            # Create typed endpoint for bond retrieval
-            async def get_typed_bond(
-                    bond_id: int,
-                    controller: FixedIncomeController = Depends(get_fixed_income_controller),
-                    token: str = Depends(oauth2_scheme),
-                    _bond_type: BondTypeEnum = bond_type  # Capture in closure
-            ):
-                bond = await controller.get_bond_by_id(bond_id, _bond_type)
-                if not bond:
-                    raise HTTPException(
-                        status_code=status.HTTP_404_NOT_FOUND,
-                        detail=f"{_bond_type.value} bond {bond_id} not found"
-                    )
-                return bond
-
             # Register the typed retrieval endpoint
             fixed_income_router.add_api_route(
                 path=f"/typed/{bond_type.value.lower()}/bonds/{{bond_id}}",
-                endpoint=get_typed_bond,
+                endpoint=_make_get_typed_bond(bond_type),
                 methods=["GET"],
                 response_model=response_schema,
                 tags=[tag_name],
@@ -551,7 +670,8 @@ def create_typed_endpoints():
             )
 
         except Exception as e:
-            logger.error(f"Failed to create typed endpoints for {bond_type.value}: {str(e)}")
+            # Lazy %-args: the message is only built if ERROR is enabled; exc_info keeps the traceback
+            logger.error("Failed to create typed endpoints for %s", bond_type.value, exc_info=e)
 
 
 # Initialize typed endpoints
@@ -566,29 +686,10 @@ async def health_check(
     """Health check for the fixed income service with schema registry status."""
     health_result = await controller.health_check()
 
-    # Add schema registry health information
-    schema_registry_status = {}
-    for bond_type in BondTypeEnum:
-        try:
-            schemas = bond_schema_factory(bond_type.value)
-            model = bond_model_factory(bond_type.value)
-            schema_registry_status[bond_type.value] = {
-                "schemas_loaded": True,
-                "model_loaded": True,
-                "request_schema": schemas["request"].__name__,
-                "response_schema": schemas["response"].__name__,
-                "model_class": model.__name__
-            }
-        except Exception as e:
-            schema_registry_status[bond_type.value] = {
-                "schemas_loaded": False,
-                "model_loaded": False,
-                "error": str(e)
-            }
-
+    # Schema registry status is resolved once at import; a factory failure fails startup
     health_result.update({
-        "supported_bond_types": [bond_type.value for bond_type in BondTypeEnum],
-        "schema_registry_status": schema_registry_status,
+        "supported_bond_types": _BOND_TYPE_VALUES,
+        "schema_registry_status": _SCHEMA_REGISTRY_STATUS,
         "factory_functions": {
             "bond_schema_factory": "active",
             "bond_model_factory": "active"
@@ -599,10 +700,18 @@ async def health_check(
 
 
 # Configure logging
+# Handlers run on a QueueListener thread so request handlers only enqueue records
+# instead of blocking on stream/file writes.
+log_queue = queue.Queue(-1)
+log_handler = logging.StreamHandler()
+log_handler.setFormatter(logging.Formatter(settings.LOG_FORMAT))
+log_listener = QueueListener(log_queue, log_handler, respect_handler_level=True)
 logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+    level=settings.LOG_LEVEL,
+    handlers=[QueueHandler(log_queue)]
 )
+log_listener.start()
+atexit.register(log_listener.stop)
 
 # Example API Usage:
 #
@@ -1,22 +1,49 @@
+import copy
+import weakref
+from typing import Dict, Tuple, Type
+
+from sqlalchemy import inspect
+
 from fixed_income.src.model.analytics.formulation import BondAnalyticsBase, CallableBondAnalytics, \
     FixedRateBondAnalytics, FloatingRateBondAnalytics, PutableBondAnalytics, SinkingFundBondAnalytics, \
     ZeroCouponBondAnalytics
 from fixed_income.src.model.bonds import BondBase
 from fixed_income.src.model.enums import BondTypeEnum
 
+_ANALYTICS_DISPATCH: Dict[BondTypeEnum, Type[BondAnalyticsBase]] = {
+    BondTypeEnum.ZERO_COUPON: ZeroCouponBondAnalytics,
+    BondTypeEnum.FIXED_COUPON: FixedRateBondAnalytics,
+    BondTypeEnum.CALLABLE: CallableBondAnalytics,
+    BondTypeEnum.PUTABLE: PutableBondAnalytics,
+    BondTypeEnum.FLOATING: FloatingRateBondAnalytics,
+    BondTypeEnum.SINKING_FUND: SinkingFundBondAnalytics,
+}
+
+
+# Analytics objects snapshot the bond's fields in __init__, so one instance per live bond
+# is reused across calls. Keyed weakly on the bond itself, an entry goes away with its bond.
+# Each entry keeps the column values it was built from and is rebuilt once the bond's differ,
+# so updating a bond never serves analytics priced from its old terms.
+_ANALYTICS_CACHE: "weakref.WeakKeyDictionary[BondBase, Tuple[tuple, BondAnalyticsBase]]" = \
+    weakref.WeakKeyDictionary()
+
+
+def _bond_state(bond: BondBase) -> tuple:
+    """Current column values of a bond, compared against the values its analytics were built from"""
+    return tuple(getattr(bond, attr.key) for attr in inspect(bond).mapper.column_attrs)
+
 
 def bond_analytics_factory(bond: BondBase) -> BondAnalyticsBase:
-    if bond.bond_type == BondTypeEnum.ZERO_COUPON:
-        return ZeroCouponBondAnalytics(bond)
-    elif bond.bond_type == BondTypeEnum.FIXED_COUPON:
-        return FixedRateBondAnalytics(bond)
-    elif bond.bond_type == BondTypeEnum.CALLABLE:
-        return CallableBondAnalytics(bond)
-    elif bond.bond_type == BondTypeEnum.PUTABLE:
-        return PutableBondAnalytics(bond)
-    elif bond.bond_type == BondTypeEnum.FLOATING:
-        return FloatingRateBondAnalytics(bond)
-    elif bond.bond_type == BondTypeEnum.SINKING_FUND:
-        return SinkingFundBondAnalytics(bond)
-    else:
+    state = _bond_state(bond)
+    cached = _ANALYTICS_CACHE.get(bond)
+    if cached is not None and cached[0] == state:
+        return cached[1]
+
+    try:
+        analytics_class = _ANALYTICS_DISPATCH[bond.bond_type]
+    except KeyError:
         raise ValueError(f"Unsupported bond type: {bond.bond_type}")
+    analytics = analytics_class(bond)
+    # Deep-copied so in-place edits to JSON columns (schedules) also count as a change
+    _ANALYTICS_CACHE[bond] = (copy.deepcopy(state), analytics)
+    return analytics
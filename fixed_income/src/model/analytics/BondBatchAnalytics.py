@@ -0,0 +1,72 @@
+from typing import Dict, Sequence
+
+import numpy as np
+from QuantLib import Days
+
+from fixed_income.src.model.analytics._kernels import COMPOUNDED, MAX_REGULAR_FREQUENCY, _price_fixed_batch, \
+    _yield_fixed_batch
+from fixed_income.src.model.bonds import FixedRateBondModel
+from fixed_income.src.utils.quantlib_mapper import to_ql_business_day_convention, to_ql_calendar, \
+    to_ql_compounding, to_ql_date, to_ql_day_count, to_ql_frequency
+
+
+def _fixed_rate_arrays(bonds: Sequence[FixedRateBondModel]) -> Dict[str, np.ndarray]:
+    """Flatten bond rows into contiguous per-field arrays (structure of arrays) for the batch kernels"""
+    columns = {name: np.empty(len(bonds)) for name in
+               ("face", "coupon", "coupon_frequency", "maturity", "clean_price", "yield_frequency")}
+
+    for i, bond in enumerate(bonds):
+        calendar = to_ql_calendar(bond.calendar)
+        convention = to_ql_business_day_convention(bond.business_day_convention)
+        evaluation_date = calendar.adjust(to_ql_date(bond.evaluation_date), convention)
+        settlement_date = calendar.adjust(calendar.advance(evaluation_date, bond.settlement_days, Days), convention)
+        maturity_date = calendar.adjust(to_ql_date(bond.maturity_date), convention)
+
+        yield_frequency = to_ql_frequency(bond.frequency)
+        if to_ql_compounding(bond.compounding) != COMPOUNDED or not 0 < yield_frequency <= MAX_REGULAR_FREQUENCY:
+            yield_frequency = np.nan  # Only periodically compounded yields have a batch closed form
+
+        columns["face"][i] = bond.face_value
+        columns["coupon"][i] = bond.coupon_rate
+        columns["coupon_frequency"][i] = to_ql_frequency(bond.coupon_frequency)
+        columns["maturity"][i] = to_ql_day_count(bond.day_count_convention).yearFraction(settlement_date,
+                                                                                         maturity_date)
+        columns["clean_price"][i] = np.nan if bond.market_price is None else bond.market_price
+        columns["yield_frequency"][i] = yield_frequency
+
+    return columns
+
+
+def fixed_rate_batch_analytics(bonds: Sequence[FixedRateBondModel]) -> Dict[str, np.ndarray]:
+    """
+    Yield to maturity, modified duration and convexity for many fixed-rate bonds in one compiled pass.
+
+    Coupons are placed on a regular grid back from maturity, so results approximate the schedule-exact
+    FixedRateBondAnalytics, which remains the reference for a single bond. Bonds without a market price,
+    without a regular coupon or yield frequency, whose yield is not periodically compounded, or whose yield
+    does not converge come back as NaN.
+
+    Args:
+        bonds: Fixed-rate bond rows, e.g. straight from an ORM query
+
+    Returns:
+        Dictionary of arrays aligned with bonds: yield_to_maturity, clean_price (repriced at that yield),
+        modified_duration and convexity
+    """
+    columns = _fixed_rate_arrays(bonds)
+    batch = (columns["face"], columns["coupon"], columns["coupon_frequency"], columns["maturity"])
+
+    ytm = np.empty(len(bonds))
+    _yield_fixed_batch(*batch, columns["clean_price"], columns["yield_frequency"], ytm)
+
+    clean_price = np.empty(len(bonds))
+    modified_duration = np.empty(len(bonds))
+    convexity = np.empty(len(bonds))
+    _price_fixed_batch(*batch, ytm, columns["yield_frequency"], clean_price, modified_duration, convexity)
+
+    return {
+        "yield_to_maturity": ytm,
+        "clean_price": clean_price,
+        "modified_duration": modified_duration,
+        "convexity": convexity,
+    }
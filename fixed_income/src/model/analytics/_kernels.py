@@ -0,0 +1,253 @@
+import logging
+import math
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+except ImportError:  # numba is optional; the kernels then run as plain Python/NumPy
+    njit = None
+    prange = range
+
+NUMBA_AVAILABLE = njit is not None
+
+# QuantLib Compounding values the zero-coupon closed forms support
+SIMPLE = 0
+COMPOUNDED = 1
+CONTINUOUS = 2
+
+# QuantLib's Frequency runs from Annual (1) to Daily (365); NoFrequency (-1), Once (0) and OtherFrequency (999)
+# have no regular coupon grid
+MAX_REGULAR_FREQUENCY = 365
+
+
+def _first_call_dates(short_rates, weights, b, call_prices):
+    """Index of the first call date exercised on each path, or -1 if the bond survives every call"""
+    num_paths, num_calls = short_rates.shape
+    num_cashflows = weights.shape[1]
+    first_call = np.empty(num_paths, dtype=np.int64)
+
+    for p in prange(num_paths):
+        first_call[p] = -1
+        for i in range(num_calls):
+            r = short_rates[p, i]
+            value = 0.0
+            for j in range(num_cashflows):
+                if weights[i, j] != 0.0:
+                    value += weights[i, j] * math.exp(-b[i, j] * r)
+            if value >= call_prices[i]:
+                first_call[p] = i
+                break
+
+    return first_call
+
+
+def _bond_value_hw(x, cf_amounts, gamma, lam):
+    """Hull-White value of the remaining cashflows given the simulated state x at the valuation date"""
+    return (cf_amounts * np.exp(-x * gamma - lam)).sum()
+
+
+def _zcb_discount(y, t, compounding, frequency):
+    """Discount factor of a single payment t years out at yield y"""
+    if compounding == SIMPLE:
+        return 1.0 / (1.0 + y * t)
+    if compounding == CONTINUOUS:
+        return math.exp(-y * t)
+    return (1.0 + y / frequency) ** (-frequency * t)
+
+
+def _zcb_yield(price, t, compounding, frequency):
+    """Yield of a single redemption of 100 paid t years out and bought at price (per 100)"""
+    growth = 100.0 / price
+    if compounding == SIMPLE:
+        return (growth - 1.0) / t
+    if compounding == CONTINUOUS:
+        return math.log(growth) / t
+    return frequency * (growth ** (1.0 / (frequency * t)) - 1.0)
+
+
+def _zcb_modified_duration(y, t, compounding, frequency):
+    """-(dP/dy) / P for a single payment t years out"""
+    if compounding == SIMPLE:
+        return t / (1.0 + y * t)
+    if compounding == CONTINUOUS:
+        return t
+    return t / (1.0 + y / frequency)
+
+
+def _zcb_convexity(y, t, compounding, frequency):
+    """(d2P/dy2) / P for a single payment t years out"""
+    if compounding == SIMPLE:
+        return 2.0 * t * t / (1.0 + y * t) ** 2
+    if compounding == CONTINUOUS:
+        return t * t
+    return t * (t + 1.0 / frequency) / (1.0 + y / frequency) ** 2
+
+
+def _cashflow_yield(times, amounts, dirty_price, guess, compounding, frequency):
+    """
+    Yield that discounts the cashflows (amounts paid at times, in years) back to dirty_price, by Newton's method.
+
+    Like QuantLib's bondYield, a SIMPLE yield discounts period by period: each cashflow's factor is the product
+    of 1 / (1 + y * dt) over the periods before it. Returns NaN if the iteration does not converge, so callers
+    can fall back to a bracketing solver.
+    """
+    y = guess
+    for _ in range(100):
+        value = 0.0
+        slope = 0.0
+        last_t = 0.0
+        df = 1.0
+        log_slope = 0.0  # -d(log df)/dy, accumulated across the simple periods
+        for k in range(times.shape[0]):
+            t = times[k]
+            if compounding == SIMPLE:
+                dt = t - last_t
+                last_t = t
+                df /= 1.0 + y * dt
+                log_slope += dt / (1.0 + y * dt)
+                d_df = -log_slope * df
+            elif compounding == CONTINUOUS:
+                df = math.exp(-y * t)
+                d_df = -t * df
+            else:
+                df = (1.0 + y / frequency) ** (-frequency * t)
+                d_df = -t * df / (1.0 + y / frequency)
+            value += amounts[k] * df
+            slope += amounts[k] * d_df
+
+        if slope == 0.0:
+            return np.nan
+        step = (value - dirty_price) / slope
+        y -= step
+        if not math.isfinite(y):
+            return np.nan
+        if abs(step) < 1e-12:
+            return y
+    return np.nan
+
+
+def _fixed_rate_sums(face, coupon, coupon_frequency, maturity, y, yield_frequency):
+    """
+    Present-value sums for a fixed-rate bond whose coupons fall on a regular grid back from maturity.
+
+    Returns (dirty price, sum of t * PV, sum of t * (t + 1/f) * PV, accrued interest), all per the bond's face.
+    """
+    coupon_amount = face * coupon / coupon_frequency
+    periods = int(math.ceil(maturity * coupon_frequency - 1e-9))
+    first = maturity - (periods - 1) / coupon_frequency
+    growth = 1.0 + y / yield_frequency
+
+    dirty = 0.0
+    weighted = 0.0
+    curvature = 0.0
+    for k in range(periods):
+        t = first + k / coupon_frequency
+        cashflow = coupon_amount + face if k == periods - 1 else coupon_amount
+        pv = cashflow * growth ** (-yield_frequency * t)
+        dirty += pv
+        weighted += t * pv
+        curvature += t * (t + 1.0 / yield_frequency) * pv
+
+    accrued = coupon_amount * (1.0 - first * coupon_frequency)
+    return dirty, weighted, curvature, accrued
+
+
+def _regular_frequency(frequency):
+    """Whether a QuantLib frequency, carried as a float, is a regular number of payments per year"""
+    return 0.0 < frequency <= MAX_REGULAR_FREQUENCY
+
+
+def _price_fixed_batch(face, coupon, coupon_frequency, maturity, y, yield_frequency,
+                       out_price, out_duration, out_convexity):
+    """Clean price, modified duration and convexity of each bond at its yield, written into the out arrays"""
+    for i in prange(face.shape[0]):
+        if maturity[i] <= 0.0 or math.isnan(y[i]) or not _regular_frequency(coupon_frequency[i]) \
+                or not _regular_frequency(yield_frequency[i]) or not 1.0 + y[i] / yield_frequency[i] > 0.0:
+            out_price[i] = np.nan
+            out_duration[i] = np.nan
+            out_convexity[i] = np.nan
+            continue
+
+        dirty, weighted, curvature, accrued = _fixed_rate_sums(
+            face[i], coupon[i], coupon_frequency[i], maturity[i], y[i], yield_frequency[i])
+        growth = 1.0 + y[i] / yield_frequency[i]
+        out_price[i] = dirty - accrued
+        out_duration[i] = weighted / (growth * dirty)
+        out_convexity[i] = curvature / (growth * growth * dirty)
+
+
+def _yield_fixed_batch(face, coupon, coupon_frequency, maturity, clean_price, yield_frequency, out_yield):
+    """
+    Yield implied by each bond's clean price, solved by Newton's method and written into out_yield.
+
+    Bonds with an irregular coupon or yield frequency, no positive price, or a Newton iteration that does not
+    converge within 50 steps get NaN.
+    """
+    for i in prange(face.shape[0]):
+        out_yield[i] = np.nan
+        frequency = yield_frequency[i]
+        if maturity[i] <= 0.0 or not clean_price[i] > 0.0 or not _regular_frequency(coupon_frequency[i]) \
+                or not _regular_frequency(frequency):
+            continue
+
+        y = coupon[i] if coupon[i] > 0.0 else 0.05
+        for _ in range(50):
+            dirty, weighted, _curvature, accrued = _fixed_rate_sums(
+                face[i], coupon[i], coupon_frequency[i], maturity[i], y, frequency)
+            slope = -weighted / (1.0 + y / frequency)
+            if slope == 0.0:
+                break
+            step = (dirty - accrued - clean_price[i]) / slope
+            y_next = y - step
+            if not math.isfinite(y_next):
+                break
+            # Keep the per-period growth 1 + y/f positive, where prices are real: an overshooting step only
+            # goes halfway to the -100% boundary
+            if 1.0 + y_next / frequency <= 0.0:
+                y_next = 0.5 * (y - frequency)
+            if abs(y_next - y) < 1e-12:
+                out_yield[i] = y_next
+                break
+            y = y_next
+
+
+def _prewarm():
+    """
+    Compile (or load from the on-disk cache) every kernel for the argument types used in analytics.
+
+    Running this at import moves the JIT cost out of the first analytics request, and because the
+    compiled code is cached next to this module, worker processes only pay for loading it. The cache lives in
+    this package's __pycache__, so it must be writable (or NUMBA_CACHE_DIR set) for the cache to persist
+    across runs, e.g. on CI runners.
+    """
+    grid = np.zeros((1, 1))
+    vector = np.zeros(1)
+    _first_call_dates(grid, grid, grid, vector)
+    _bond_value_hw(0.0, vector, vector, vector)
+    for kernel in (_zcb_discount, _zcb_modified_duration, _zcb_convexity):
+        kernel(0.05, 5.0, COMPOUNDED, 1)
+    _zcb_yield(100.0, 5.0, COMPOUNDED, 1)
+    _cashflow_yield(np.array([1.0]), np.array([100.0]), 95.0, 0.05, COMPOUNDED, 1)
+    batch = np.array([100.0]), np.array([0.05]), np.array([2.0]), np.array([5.0])
+    _price_fixed_batch(*batch, np.array([0.05]), np.array([2.0]), np.empty(1), np.empty(1), np.empty(1))
+    _yield_fixed_batch(*batch, np.array([100.0]), np.array([2.0]), np.empty(1))
+
+
+if NUMBA_AVAILABLE:
+    _first_call_dates = njit(parallel=True, cache=True, fastmath=True)(_first_call_dates)
+    _bond_value_hw = njit(cache=True, fastmath=True)(_bond_value_hw)
+    _zcb_discount = njit(cache=True)(_zcb_discount)
+    _zcb_yield = njit(cache=True)(_zcb_yield)
+    _zcb_modified_duration = njit(cache=True)(_zcb_modified_duration)
+    _zcb_convexity = njit(cache=True)(_zcb_convexity)
+    _cashflow_yield = njit(cache=True)(_cashflow_yield)
+    _fixed_rate_sums = njit(cache=True, fastmath=True)(_fixed_rate_sums)
+    _regular_frequency = njit(cache=True)(_regular_frequency)
+    _price_fixed_batch = njit(parallel=True, cache=True)(_price_fixed_batch)
+    _yield_fixed_batch = njit(parallel=True, cache=True)(_yield_fixed_batch)
+
+    try:
+        _prewarm()
+    except Exception as e:
+        logging.error(f"Kernel prewarm failed: {str(e)}")
@@ -1,11 +1,40 @@
+import copy
 from abc import ABC, abstractmethod
 from datetime import date
+from functools import lru_cache
+
+from QuantLib import Date, DateGeneration, HullWhite, Months, Period, PricingEngine, Schedule, TimeGrid, \
+    TreeCallableFixedRateBondEngine
 
 from fixed_income.src.model.bonds import BondBase
+from fixed_income.src.model.enums.BusinessDayConventionEnum import BusinessDayConventionEnum
+from fixed_income.src.model.enums.CalenderEnum import CalendarEnum
 from fixed_income.src.utils.quantlib_mapper import to_ql_business_day_convention, to_ql_calendar, \
     to_ql_compounding, to_ql_date, to_ql_day_count, to_ql_frequency
 
 
+@lru_cache(maxsize=1024)
+def _coupon_schedule(issue_serial: int, maturity_serial: int, tenor_months: int,
+                     calendar: CalendarEnum, business_day_convention: BusinessDayConventionEnum) -> Schedule:
+    """Coupon schedules depend only on these inputs, so bonds sharing them share one Schedule"""
+    convention = to_ql_business_day_convention(business_day_convention)
+    return Schedule(
+        Date(issue_serial),
+        Date(maturity_serial),
+        Period(tenor_months, Months),
+        to_ql_calendar(calendar),
+        convention,
+        convention,
+        DateGeneration.Backward,
+        False
+    )
+
+
+def hull_white_callable_engine(model: HullWhite, years_to_maturity: float, time_steps: int) -> PricingEngine:
+    """Callable/putable bond tree engine under Hull-White, with time_steps steps out to the bond's maturity"""
+    return TreeCallableFixedRateBondEngine(model, TimeGrid(years_to_maturity, time_steps))
+
+
 class BondAnalyticsBase(ABC):
     def __init__(self, bond: BondBase):
         # Basic bond metadata
@@ -21,6 +50,7 @@ class BondAnalyticsBase(ABC):
         self.evaluation_date = to_ql_date(bond.evaluation_date)
         self.settlement_days = bond.settlement_days
         self.calendar = to_ql_calendar(bond.calendar)
+        self._calendar_enum = bond.calendar
 
         # Financial values
         self.face_value = bond.face_value
@@ -31,6 +61,45 @@ class BondAnalyticsBase(ABC):
         self.compounding = to_ql_compounding(bond.compounding)
         self.frequency = to_ql_frequency(bond.frequency)
         self.business_day_convention = to_ql_business_day_convention(bond.business_day_convention)
+        self._business_day_convention_enum = bond.business_day_convention
+
+        # Yield-based measures (durations, convexity, DV01, summary) all start from the YTM, so it is solved once
+        self._ytm_cache = None
+
+    def _build_coupon_schedule(self) -> Schedule:
+        return _coupon_schedule(
+            self.issue_date.serialNumber(),
+            self.maturity_date.serialNumber(),
+            int(12 / self.coupon_frequency),
+            self._calendar_enum,
+            self._business_day_convention_enum
+        )
+
+    def _cached_ytm(self) -> float:
+        if self._ytm_cache is None:
+            self._ytm_cache = self.yield_to_maturity()
+        return self._ytm_cache
+
+    def with_market_price(self, market_price: float) -> "BondAnalyticsBase":
+        """
+        Returns a copy of these analytics re-priced at a different market price.
+
+        Only the price input and the caches derived from it change; the copy shares this instance's QuantLib
+        bond, schedule and curve, so updating the yield curve on either updates both.
+
+        Args:
+            market_price: Market price on the same face basis as the bond's own market price
+
+        Returns:
+            Analytics of the same type whose yield-based measures use the new price
+        """
+        if market_price is None or market_price <= 0:
+            raise ValueError("Market price must be positive")
+
+        clone = copy.copy(self)
+        clone.market_price = market_price
+        clone.invalidate_cache()
+        return clone
 
     @abstractmethod
     def _get_normalized_market_price(self):
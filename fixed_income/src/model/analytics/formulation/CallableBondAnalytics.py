@@ -1,17 +1,18 @@
 import logging
 import math
-from collections import defaultdict
 from datetime import date
 from typing import Dict, List, Optional, Tuple
 
+import numpy as np
 from QuantLib import BondFunctions, BondPrice, Callability, CallabilitySchedule, CallableFixedRateBond, \
-    DateGeneration, Days, Duration, FlatForward, HullWhite, Months, Period, QuoteHandle, Schedule, Settings, \
-    Simple, SimpleQuote, SobolRsg, TimeGrid, \
-    TreeCallableFixedRateBondEngine, YieldTermStructureHandle
+    Continuous, Days, Duration, FlatForward, HullWhite, NoFrequency, PricingEngine, QuoteHandle, \
+    RelinkableYieldTermStructureHandle, Settings, Simple, SimpleQuote, YieldTermStructureHandle
 
+from fixed_income.src.model.analytics._kernels import NUMBA_AVAILABLE, _first_call_dates
 from fixed_income.src.model.analytics.formulation import BondAnalyticsBase
+from fixed_income.src.model.analytics.formulation.BondAnalyticsBase import hull_white_callable_engine
 from fixed_income.src.model.bonds import CallableBondModel
-from fixed_income.src.utils.helpers import replace_nan_with_none
+from fixed_income.src.utils.helpers import replace_nan_with_none, safe_analytic
 from fixed_income.src.utils.quantlib_mapper import from_ql_date, to_ql_date, to_ql_frequency
 
 
@@ -23,11 +24,19 @@ class CallableBondAnalytics(BondAnalyticsBase):
             raise ValueError("Must provide a CallableBondModel instance")
 
         self._summary_cache = None
+        self._ytc_cache = None
+        self._normalized_price_cache = None
 
         self._bond: Optional[CallableFixedRateBond] = None
         self._discount_curve: Optional[YieldTermStructureHandle] = None
         self._rate_quote: Optional[SimpleQuote] = None
 
+        # Hull-White engines are expensive to build, so they are cached per (horizon, time steps)
+        # and re-pointed at a new curve through a relinkable handle instead of rebuilt.
+        self.model_params = {"mean_reversion": 0.05, "volatility": 0.01, "time_steps": 100}
+        self._pricing_curve: Optional[RelinkableYieldTermStructureHandle] = None
+        self._engine_cache: Dict[Tuple[float, int], Tuple[RelinkableYieldTermStructureHandle, PricingEngine]] = {}
+
         self.coupon_rate = bond.coupon_rate
         self.coupon_frequency = to_ql_frequency(bond.coupon_frequency)
         self.schedule = None
@@ -89,13 +98,17 @@ class CallableBondAnalytics(BondAnalyticsBase):
 
     def _get_normalized_market_price(self) -> float:
         """Returns market price normalized to 100 face value."""
+        if self._normalized_price_cache is not None:
+            return self._normalized_price_cache
+
         market_price = getattr(self, 'market_price', None)
         if market_price is None:
             logging.warning("Market price not set, using clean price as fallback.")
             market_price = self.clean_price()
         if self.face_value == 0:
             raise ZeroDivisionError("Face value cannot be zero when normalizing price.")
-        return (market_price / self.face_value) * 100
+        self._normalized_price_cache = (market_price / self.face_value) * 100
+        return self._normalized_price_cache
 
     # Yield curves must be anchored to the EVALUATION DATE
     def _build_yield_curve(self, initial_rate: float = 0.05) -> Tuple[YieldTermStructureHandle, SimpleQuote]:
@@ -111,18 +124,6 @@ class CallableBondAnalytics(BondAnalyticsBase):
         curve.enableExtrapolation()  # Allow extrapolation beyond curve dates
         return YieldTermStructureHandle(curve), flat_rate
 
-    def _build_coupon_schedule(self):
-        return Schedule(
-            self.issue_date,
-            self.maturity_date,
-            Period(int(12 / self.coupon_frequency), Months),
-            self.calendar,
-            self.business_day_convention,
-            self.business_day_convention,
-            DateGeneration.Backward,
-            False
-        )
-
     def _filter_call_schedule(self) -> List[Dict]:
         """Filter out historical call dates and validate remaining schedule."""
         if not self.call_schedule:
@@ -201,208 +202,204 @@ class CallableBondAnalytics(BondAnalyticsBase):
             if self._discount_curve is None or self._rate_quote is None:
                 self._discount_curve, self._rate_quote = self._build_yield_curve()
 
-            # Set pricing engine with the properly constructed discount curve
-            model = HullWhite(self._discount_curve, mean_reversion, volatility)
-
-            years_to_maturity = self._discount_curve.referenceDate().yearFraction(self.maturity_date)
-            time_grid = TimeGrid(years_to_maturity, time_steps)
+            model_params = {"mean_reversion": mean_reversion, "volatility": volatility, "time_steps": time_steps}
+            if model_params != self.model_params:
+                self.model_params = model_params
+                self._engine_cache = {}
 
-            engine = TreeCallableFixedRateBondEngine(model, time_grid)
+            # Set pricing engine with the properly constructed discount curve
+            self._pricing_curve, engine = self._pricing_engine(self._discount_curve.currentLink())
             self._bond.setPricingEngine(engine)
 
         return self._bond
 
+    def _pricing_engine(self, curve) -> Tuple[RelinkableYieldTermStructureHandle, PricingEngine]:
+        """Return a cached Hull-White engine for the curve's horizon, linked to ``curve``."""
+        time_steps = self.model_params["time_steps"]
+        years_to_maturity = self.day_count_convention.yearFraction(curve.referenceDate(), self.maturity_date)
+        key = (round(years_to_maturity, 6), time_steps)
+
+        cached = self._engine_cache.get(key)
+        if cached is not None:
+            cached[0].linkTo(curve)
+            return cached
+
+        handle = RelinkableYieldTermStructureHandle(curve)
+        model = HullWhite(handle, self.model_params["mean_reversion"], self.model_params["volatility"])
+        engine = hull_white_callable_engine(model, years_to_maturity, time_steps)
+        self._engine_cache[key] = (handle, engine)
+        return handle, engine
+
     def cashflows(self) -> List[Tuple[date, float]]:
         try:
             bond = self.build_quantlib_bond()
 
-            cashflows_by_date = defaultdict(float)
+            # QuantLib yields cashflows in date order, so same-date entries are adjacent
+            result = []
 
             for cf in bond.cashflows():
-                if not cf.hasOccurred():
-                    cf_date = from_ql_date(cf.date())
-                    cf_amount = cf.amount()
-                    if not isinstance(cf_amount, (float, int)):
-                        raise ValueError(f"Invalid cashflow amount {cf_amount} for date {cf_date}")
-                    # optionally skip past cashflows
-                    cashflows_by_date[from_ql_date(cf.date())] += cf.amount()
-
-            # Return as sorted list of (Date, Amount) tuples
-            return sorted(cashflows_by_date.items(), key=lambda x: x[0])
+                if cf.hasOccurred():
+                    continue
+
+                cf_date = from_ql_date(cf.date())
+                cf_amount = cf.amount()
+                if not isinstance(cf_amount, (float, int)):
+                    raise ValueError(f"Invalid cashflow amount {cf_amount} for date {cf_date}")
+
+                if result and result[-1][0] == cf_date:
+                    result[-1] = (cf_date, result[-1][1] + cf_amount)
+                else:
+                    result.append((cf_date, cf_amount))
+
+            return result
         except Exception as e:
             logging.error(f"Failed to get cashflows: {str(e)}")
             return []
 
+    @safe_analytic("Clean price")
     def clean_price(self) -> float:
         """Returns clean price normalized to face value of 1000"""
-        try:
-            ql_price = self.build_quantlib_bond().cleanPrice()  # QL returns price per 100
-            return ql_price * (self.face_value / 100.0)
-        except Exception as e:
-            logging.error(f"Clean price calculation failed: {str(e)}")
-            return float('nan')
+        ql_price = self.build_quantlib_bond().cleanPrice()  # QL returns price per 100
+        return ql_price * (self.face_value / 100.0)
 
+    @safe_analytic("Dirty price")
     def dirty_price(self) -> float:
         """Returns dirty price normalized to face value of 1000"""
-        try:
-            ql_price = self.build_quantlib_bond().dirtyPrice()  # QL returns price per 100
-            return ql_price * (self.face_value / 100.0)
-        except Exception as e:
-            logging.error(f"Dirty price calculation failed: {str(e)}")
-            return float('nan')
+        ql_price = self.build_quantlib_bond().dirtyPrice()  # QL returns price per 100
+        return ql_price * (self.face_value / 100.0)
 
+    @safe_analytic("Accrued interest")
     def accrued_interest(self) -> float:
         """Returns accrued interest normalized to face value of 1000"""
-        try:
-            ql_accrued = self.build_quantlib_bond().accruedAmount()  # QL returns per 100
-            return ql_accrued * (self.face_value / 100.0)
-        except Exception as e:
-            logging.error(f"Accrued interest calculation failed: {str(e)}")
-            return float('nan')
+        ql_accrued = self.build_quantlib_bond().accruedAmount()  # QL returns per 100
+        return ql_accrued * (self.face_value / 100.0)
 
+    @safe_analytic("YTM")
     def yield_to_maturity(self) -> float:
-        try:
-            normalized_price = self._get_normalized_market_price()
-            return self.build_quantlib_bond().bondYield(
-                normalized_price,
-                self.day_count_convention,
-                self.compounding,
-                self.frequency,
-                self.settlement_date
-            )
-        except Exception as e:
-            logging.error(f"YTM calculation failed: {str(e)}")
-            return float('nan')
+        normalized_price = self._get_normalized_market_price()
+        return self.build_quantlib_bond().bondYield(
+            normalized_price,
+            self.day_count_convention,
+            self.compounding,
+            self.frequency,
+            self.settlement_date
+        )
 
+    def _cached_ytc(self) -> float:
+        if self._ytc_cache is None:
+            self._ytc_cache = self.yield_to_call()
+        return self._ytc_cache
+
+    @safe_analytic("YTC")
     def yield_to_call(self) -> float:
         """
         Returns the Yield to Call (YTC), calculated to the earliest call date after settlement.
         If no future call date is available, returns NaN.
         """
-        try:
-            bond = self.build_quantlib_bond()
-
-            # Find the first call date strictly after eval date
-            future_calls = [c for c in self.callability_schedule if c.date() > self.evaluation_date]
-            if not future_calls:
-                logging.warning("No future call dates available to compute YTC.")
-                return float('nan')
-
-            first_call = min(future_calls, key=lambda c: c.date())
-            call_date = first_call.date()
-            call_price = first_call.price().amount()
-
-            return BondFunctions.bondYield(
-                bond,
-                call_price,
-                self.day_count_convention,
-                self.compounding,
-                self.frequency,
-                self.settlement_date,
-                call_date
-            )
+        bond = self.build_quantlib_bond()
 
-        except Exception as e:
-            logging.error(f"YTC calculation failed: {str(e)}")
+        # Find the first call date strictly after eval date
+        future_calls = [c for c in self.callability_schedule if c.date() > self.evaluation_date]
+        if not future_calls:
+            logging.warning("No future call dates available to compute YTC.")
             return float('nan')
 
+        first_call = min(future_calls, key=lambda c: c.date())
+        call_date = first_call.date()
+        call_price = first_call.price().amount()
+
+        return BondFunctions.bondYield(
+            bond,
+            call_price,
+            self.day_count_convention,
+            self.compounding,
+            self.frequency,
+            self.settlement_date,
+            call_date
+        )
+
     def yield_to_worst(self) -> float:
         """
         Returns Yield to Worst (YTW).
         """
-        return min(self.yield_to_maturity(), self.yield_to_call())
+        return min(self._cached_ytm(), self._cached_ytc())
 
+    @safe_analytic("Modified duration")
     def modified_duration(self) -> float:
-        try:
-            ytm = self.yield_to_maturity()
-            if math.isnan(ytm):
-                return float('nan')
-            return BondFunctions.duration(
-                self.build_quantlib_bond(),
-                ytm,
-                self.day_count_convention,
-                self.compounding,
-                self.frequency,
-                Duration.Modified,
-                self.settlement_date
-            )
-        except Exception as e:
-            logging.error(f"Modified duration calculation failed: {str(e)}")
+        ytm = self._cached_ytm()
+        if math.isnan(ytm):
             return float('nan')
+        return BondFunctions.duration(
+            self.build_quantlib_bond(),
+            ytm,
+            self.day_count_convention,
+            self.compounding,
+            self.frequency,
+            Duration.Modified,
+            self.settlement_date
+        )
 
+    @safe_analytic("Macaulay duration")
     def macaulay_duration(self) -> float:
-        try:
-            ytm = self.yield_to_maturity()
-            if math.isnan(ytm):
-                return float('nan')
-            return BondFunctions.duration(
-                self.build_quantlib_bond(),
-                ytm,
-                self.day_count_convention,
-                self.compounding,
-                self.frequency,
-                Duration.Macaulay,
-                self.settlement_date
-            )
-        except Exception as e:
-            logging.error(f"Macaulay duration calculation failed: {str(e)}")
+        ytm = self._cached_ytm()
+        if math.isnan(ytm):
             return float('nan')
+        return BondFunctions.duration(
+            self.build_quantlib_bond(),
+            ytm,
+            self.day_count_convention,
+            self.compounding,
+            self.frequency,
+            Duration.Macaulay,
+            self.settlement_date
+        )
 
+    @safe_analytic("Simple duration")
     def simple_duration(self) -> float:
-        try:
-            ytm = self.yield_to_maturity()
-            if math.isnan(ytm):
-                return float('nan')
-            return BondFunctions.duration(
-                self.build_quantlib_bond(),
-                ytm,
-                self.day_count_convention,
-                Simple,
-                self.frequency,
-                Duration.Simple,
-                self.settlement_date
-            )
-        except Exception as e:
-            logging.error(f"Simple duration calculation failed: {str(e)}")
+        ytm = self._cached_ytm()
+        if math.isnan(ytm):
             return float('nan')
+        return BondFunctions.duration(
+            self.build_quantlib_bond(),
+            ytm,
+            self.day_count_convention,
+            Simple,
+            self.frequency,
+            Duration.Simple,
+            self.settlement_date
+        )
 
+    @safe_analytic("Convexity")
     def convexity(self) -> float:
-        try:
-            ytm = self.yield_to_maturity()
-            if math.isnan(ytm):
-                return float('nan')
-            return BondFunctions.convexity(
-                self.build_quantlib_bond(),
-                ytm,
-                self.day_count_convention,
-                self.compounding,
-                self.frequency,
-                self.settlement_date
-            )
-        except Exception as e:
-            logging.error(f"Convexity calculation failed: {str(e)}")
+        ytm = self._cached_ytm()
+        if math.isnan(ytm):
             return float('nan')
+        return BondFunctions.convexity(
+            self.build_quantlib_bond(),
+            ytm,
+            self.day_count_convention,
+            self.compounding,
+            self.frequency,
+            self.settlement_date
+        )
 
+    @safe_analytic("DV01")
     def dv01(self, bump_size: float = 0.0001) -> float:
-        try:
-            ytm = self.yield_to_maturity()
-            if math.isnan(ytm):
-                return float('nan')
+        ytm = self._cached_ytm()
+        if math.isnan(ytm):
+            return float('nan')
 
-            bond = self.build_quantlib_bond()
-            price_up = BondFunctions.cleanPrice(
-                bond, ytm + bump_size, self.day_count_convention, self.compounding,
-                self.frequency, self.settlement_date
-            )
-            price_down = BondFunctions.cleanPrice(
-                bond, ytm - bump_size, self.day_count_convention, self.compounding,
-                self.frequency, self.settlement_date
-            )
+        bond = self.build_quantlib_bond()
+        price_up = BondFunctions.cleanPrice(
+            bond, ytm + bump_size, self.day_count_convention, self.compounding,
+            self.frequency, self.settlement_date
+        )
+        price_down = BondFunctions.cleanPrice(
+            bond, ytm - bump_size, self.day_count_convention, self.compounding,
+            self.frequency, self.settlement_date
+        )
 
-            return (price_down - price_up) / (2 * bump_size)
-        except Exception as e:
-            logging.error(f"DV01 calculation failed: {str(e)}")
-            return float('nan')
+        return (price_down - price_up) / (2 * bump_size)
 
     def get_discount_curve(self, start=None, end=None, points=20) -> Dict[str, float]:
         try:
@@ -424,29 +421,18 @@ class CallableBondAnalytics(BondAnalyticsBase):
             # Calculate the total period in years according to day count convention
             total_years = day_counter.yearFraction(ql_start, ql_end)
 
-            # Calculate step size in years
-            step_years = total_years / (points - 1)
-
-            result = {}
-            current = ql_start
-
-            for i in range(points):
-                if i == points - 1:  # Ensure we always include the end date
-                    current = ql_end
-
-                rate = curve.zeroRate(current, day_counter, compounding, frequency).rate()
-                result[from_ql_date(current)] = rate
-
-                # Advance using calendar and business day convention
-                if i < points - 2:  # Don't advance after the second-to-last point
-                    current = calendar.advance(
-                        current,
-                        Period(int(round(step_years * 365)), Days),
-                        self.business_day_convention
-                    )
-                    current = min(current, ql_end)  # Don't go past end date
+            # Evenly spaced grid in year fractions; each date is adjusted once rather than chained
+            # through calendar.advance, and the end date is always included
+            sample_dates = [
+                min(calendar.adjust(ql_start + int(round(t * 365)), self.business_day_convention), ql_end)
+                for t in np.linspace(0.0, total_years, points)[:-1]
+            ]
+            sample_dates.append(ql_end)
 
-            return result
+            return {
+                from_ql_date(current): curve.zeroRate(current, day_counter, compounding, frequency).rate()
+                for current in sample_dates
+            }
 
         except Exception as e:
             logging.error(f"Discount curve generation failed: {str(e)}", exc_info=True)
@@ -531,29 +517,24 @@ class CallableBondAnalytics(BondAnalyticsBase):
 
     def _price_with_shocked_curve(self, shocked_curve):
         """Calculate bond price with temporary shocked curve"""
-        # Store original engine
-        original_engine = self._bond.pricingEngine()
+        bond = self.build_quantlib_bond()
 
         try:
-            # Create temporary pricing engine with shocked curve
-            model = HullWhite(YieldTermStructureHandle(shocked_curve))
-            time_grid = TimeGrid(
-                shocked_curve.referenceDate().yearFraction(self.maturity_date),
-                self.model_params["time_steps"]
-            )
-            temp_engine = TreeCallableFixedRateBondEngine(model, time_grid)
-
-            # Price with shocked curve
-            self._bond.setPricingEngine(temp_engine)
-            return self._bond.cleanPrice()
+            # Shocked curves share the evaluation date, so the existing engine can be reused as is
+            self._pricing_curve.linkTo(shocked_curve)
+            return bond.cleanPrice()
         finally:
-            # Restore original engine
-            self._bond.setPricingEngine(original_engine)
+            # Restore original curve
+            self._pricing_curve.linkTo(self._discount_curve.currentLink())
 
     def call_probability(self, num_paths: int = 1000) -> Dict[date, float]:
         """
         Estimate probability of bond being called at each call date using Monte Carlo simulation.
 
+        Short rates are sampled from the exact Hull-White transition density at each call date, and the
+        bond is valued there with the closed-form zero-coupon price P(t, T) = A(t, T) * exp(-B(t, T) * r(t)),
+        so all paths are priced at once as arrays instead of through a tree per path and call date.
+
         Args:
             num_paths: Number of Monte Carlo paths to simulate
 
@@ -577,128 +558,74 @@ class CallableBondAnalytics(BondAnalyticsBase):
             # Sort call dates
             future_calls.sort(key=lambda x: x[0])
 
-            # Set up Hull-White model
-            model = HullWhite(
-                self._discount_curve,
-                self.model_params["mean_reversion"],
-                self.model_params["volatility"]
-            )
-
-            # Create sequence generator
-            seed = 42  # For reproducibility
-            sequence_generator = SobolRsg(1)  # 1-dimensional
-
-            # Simulate paths
-            call_counts = defaultdict(int)
-
-            for _ in range(num_paths):
-                # Generate random path
-                path = self._generate_interest_rate_path(
-                    model,
-                    max(c[0] for c in future_calls),
-                    sequence_generator
-                )
-
-                # Check each call date
-                for call_date, call_price in future_calls:
-                    # Get simulated short rate at call date
-                    rate = path[call_date]
-
-                    # Create temporary curve
-                    temp_curve = FlatForward(
-                        call_date,
-                        QuoteHandle(SimpleQuote(rate)),
-                        self.day_count_convention,
-                        self.compounding,
-                        self.frequency
-                    )
-
-                    # Price bond if not called yet
-                    bond_value = self._calculate_bond_value_at_date(call_date, temp_curve)
-
-                    # Check if called
-                    if bond_value >= call_price:
-                        call_counts[from_ql_date(call_date)] += 1
-                        break  # Bond is called, no later calls matter
+            bond = self.build_quantlib_bond()
+            curve = self._discount_curve.currentLink()
+            a = self.model_params["mean_reversion"]
+            sigma = self.model_params["volatility"]
+
+            def year_fraction(d) -> float:
+                return self.day_count_convention.yearFraction(self.evaluation_date, d)
+
+            call_times = np.array([year_fraction(call_date) for call_date, _ in future_calls])
+            call_prices = np.array([call_price for _, call_price in future_calls])
+
+            # Remaining cashflows, per 100 of face to match the call prices
+            cashflows = [(year_fraction(cf.date()), cf.amount()) for cf in bond.cashflows()
+                         if cf.date() > self.evaluation_date]
+            cf_times = np.array([t for t, _ in cashflows])
+            cf_amounts = np.array([amount for _, amount in cashflows]) * (100.0 / self.face_value)
+
+            call_discounts = np.array([curve.discount(t) for t in call_times])
+            cf_discounts = np.array([curve.discount(t) for t in cf_times])
+            call_forwards = np.array([curve.forwardRate(t, t, Continuous, NoFrequency).rate() for t in call_times])
+
+            # B(t_i, T_j) and ln A(t_i, T_j) for every (call date, cashflow date) pair; cashflows paid
+            # on or before a call date do not count towards the bond's value on that date
+            tau = cf_times[None, :] - call_times[:, None]
+            alive = tau > 0
+            b = np.where(alive, (1.0 - np.exp(-a * tau)) / a, 0.0)
+            ln_a = (np.log(cf_discounts[None, :] / call_discounts[:, None])
+                    + b * call_forwards[:, None]
+                    - sigma ** 2 / (4.0 * a) * (1.0 - np.exp(-2.0 * a * call_times[:, None])) * b ** 2)
+            weights = np.where(alive, cf_amounts[None, :] * np.exp(ln_a), 0.0)
+
+            # r(t) = x(t) + alpha(t), where x is an Ornstein-Uhlenbeck process started at zero
+            alpha = call_forwards + sigma ** 2 / (2.0 * a ** 2) * (1.0 - np.exp(-a * call_times)) ** 2
+            dt = np.diff(call_times, prepend=0.0)
+            decay = np.exp(-a * dt)
+            step_std = sigma * np.sqrt((1.0 - np.exp(-2.0 * a * dt)) / (2.0 * a))
+
+            rng = np.random.default_rng(42)  # For reproducibility
+            shocks = rng.standard_normal((num_paths, len(future_calls)))
+            x = np.empty_like(shocks)
+            x_prev = np.zeros(num_paths)
+            for i in range(len(future_calls)):
+                x_prev = x_prev * decay[i] + step_std[i] * shocks[:, i]
+                x[:, i] = x_prev
+            short_rates = x + alpha[None, :]
+
+            # A path is called at its first call date where the bond is worth at least the call price
+            if NUMBA_AVAILABLE:
+                first_call = _first_call_dates(short_rates, weights, b, call_prices)
+                first_call = first_call[first_call >= 0]
+            else:
+                # Bond value per (path, call date): sum_j cf_j * A(t_i, T_j) * exp(-B(t_i, T_j) * r(t_i))
+                bond_values = np.einsum('ij,pij->pi', weights, np.exp(-b[None, :, :] * short_rates[:, :, None]))
+                called = bond_values >= call_prices[None, :]
+                first_call = called.argmax(axis=1)[called.any(axis=1)]
+            call_counts = np.bincount(first_call, minlength=len(future_calls))
 
             # Calculate probabilities
             total_paths = float(num_paths)
-            probabilities = {
-                call_date: count / total_paths
-                for call_date, count in call_counts.items()
+            return {
+                from_ql_date(call_date): count / total_paths
+                for (call_date, _), count in zip(future_calls, call_counts)
             }
 
-            # Add zero probabilities for dates that were never called
-            for call_date, _ in future_calls:
-                ql_date = to_ql_date(call_date)
-                if ql_date not in probabilities:
-                    probabilities[ql_date] = 0.0
-
-            return probabilities
-
         except Exception as e:
             logging.error(f"Call probability calculation failed: {str(e)}", exc_info=True)
             return {}
 
-    def _generate_interest_rate_path(self, model, end_date, sequence_generator):
-        """Generate a single interest rate path using the model"""
-        # Convert dates to times
-        times = [self.day_count_convention.yearFraction(
-            self.evaluation_date,
-            date
-        ) for date in [self.evaluation_date, end_date]]
-
-        # Generate random numbers
-        sequence = sequence_generator.nextSequence().value()
-
-        # Simulate path
-        path = {}
-        time_grid = TimeGrid(times[0], times[1], 100)
-        process = model.treeProcess(time_grid)
-
-        # Store the path at each call date
-        for call_date in self.callability_schedule:
-            ql_date = call_date.date()
-            if ql_date > self.evaluation_date:
-                t = self.day_count_convention.yearFraction(self.evaluation_date, ql_date)
-                path[ql_date] = process.evolve(0, 0, t, sequence[0])
-
-        return path
-
-    def _calculate_bond_value_at_date(self, call_date, temp_curve):
-        """Calculate bond value at a specific future date"""
-        # Temporarily change evaluation date
-        Settings.instance().evaluationDate = call_date
-
-        try:
-            # Create temporary bond
-            temp_bond = CallableFixedRateBond(
-                settlementDays=0,  # Immediate settlement
-                faceAmount=self.face_value,
-                schedule=self.schedule,
-                coupons=[self.coupon_rate],
-                paymentDayCounter=self.day_count_convention,
-                paymentConvention=self.business_day_convention,
-                redemption=100.0,
-                issueDate=self.issue_date,
-                putCallSchedule=self.callability_schedule,
-                paymentCalendar=self.calendar
-            )
-
-            # Set pricing engine
-            temp_model = HullWhite(YieldTermStructureHandle(temp_curve))
-            time_grid = TimeGrid(
-                temp_curve.referenceDate().yearFraction(self.maturity_date),
-                self.model_params["time_steps"]
-            )
-            temp_engine = TreeCallableFixedRateBondEngine(temp_model, time_grid)
-            temp_bond.setPricingEngine(temp_engine)
-
-            return temp_bond.cleanPrice()
-        finally:
-            # Restore original evaluation date
-            Settings.instance().evaluationDate = self.evaluation_date
-
     def summary(self) -> Dict[str, float]:
         if self._summary_cache is not None:
             return self._summary_cache
@@ -707,9 +634,9 @@ class CallableBondAnalytics(BondAnalyticsBase):
             'clean_price': self.clean_price,
             'dirty_price': self.dirty_price,
             'accrued_interest': self.accrued_interest,
-            'yield_to_maturity': self.yield_to_maturity,
+            'yield_to_maturity': self._cached_ytm,
             'yield_to_worst': self.yield_to_worst,
-            'yield_to_call': self.yield_to_call,
+            'yield_to_call': self._cached_ytc,
             'modified_duration': self.modified_duration,
             'macaulay_duration': self.macaulay_duration,
             'simple_duration': self.simple_duration,
@@ -739,6 +666,9 @@ class CallableBondAnalytics(BondAnalyticsBase):
 
     def invalidate_cache(self):
         self._summary_cache = None
+        self._ytm_cache = None
+        self._ytc_cache = None
+        self._normalized_price_cache = None
 
     # Then, in methods that update key state, call invalidate_cache
     def update_yield_curve(self, rate: float) -> None:
@@ -759,4 +689,6 @@ class CallableBondAnalytics(BondAnalyticsBase):
         self._bond = None
         self._discount_curve = None
         self._rate_quote = None
+        self._pricing_curve = None
+        self._engine_cache = {}
         self.invalidate_cache()
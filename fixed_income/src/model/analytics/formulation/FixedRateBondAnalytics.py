@@ -1,16 +1,17 @@
 import logging
 import math
-from collections import defaultdict
 from datetime import date
 from typing import Dict, List, Optional, Tuple
 
-from QuantLib import (BondFunctions, DateGeneration, Days, DiscountingBondEngine, Duration,
+import numpy as np
+from QuantLib import (BondFunctions, Days, DiscountingBondEngine, Duration,
                       FixedRateBond, FlatForward,
-                      Months, Period, QuoteHandle, Schedule, Settings, Simple, SimpleQuote, YieldTermStructureHandle)
+                      QuoteHandle, Settings, Simple, SimpleQuote, YieldTermStructureHandle)
 
+from fixed_income.src.model.analytics._kernels import COMPOUNDED, CONTINUOUS, SIMPLE, _cashflow_yield
 from fixed_income.src.model.analytics.formulation import BondAnalyticsBase
 from fixed_income.src.model.bonds import FixedRateBondModel
-from fixed_income.src.utils.helpers import replace_nan_with_none
+from fixed_income.src.utils.helpers import replace_nan_with_none, safe_analytic
 from fixed_income.src.utils.quantlib_mapper import from_ql_date, to_ql_date, to_ql_frequency
 
 
@@ -22,6 +23,9 @@ class FixedRateBondAnalytics(BondAnalyticsBase):
             raise ValueError("Must provide a FixedRateBondModel instance")
 
         self._summary_cache = None
+        self._normalized_price_cache = None
+        self._yield_terms_cache: Optional[Tuple[np.ndarray, np.ndarray]] = None
+        self._cashflow_arrays_cache: Optional[Tuple[np.ndarray, np.ndarray]] = None
 
         self._bond: Optional[FixedRateBond] = None
         self._discount_curve: Optional[YieldTermStructureHandle] = None
@@ -82,13 +86,17 @@ class FixedRateBondAnalytics(BondAnalyticsBase):
 
     def _get_normalized_market_price(self) -> float:
         """Returns market price normalized to 100 face value."""
+        if self._normalized_price_cache is not None:
+            return self._normalized_price_cache
+
         market_price = getattr(self, 'market_price', None)
         if market_price is None:
             logging.warning("Market price not set, using clean price as fallback.")
             market_price = self.clean_price()
         if self.face_value == 0:
             raise ZeroDivisionError("Face value cannot be zero when normalizing price.")
-        return (market_price / self.face_value) * 100
+        self._normalized_price_cache = (market_price / self.face_value) * 100
+        return self._normalized_price_cache
 
     # Yield curves must be anchored to the EVALUATION DATE
     def _build_yield_curve(self, initial_rate: float = 0.05) -> Tuple[YieldTermStructureHandle, SimpleQuote]:
@@ -104,18 +112,6 @@ class FixedRateBondAnalytics(BondAnalyticsBase):
         curve.enableExtrapolation()  # Allow extrapolation beyond curve dates
         return YieldTermStructureHandle(curve), flat_rate
 
-    def _build_coupon_schedule(self):
-        return Schedule(
-            self.issue_date,
-            self.maturity_date,
-            Period(int(12 / self.coupon_frequency), Months),
-            self.calendar,
-            self.business_day_convention,
-            self.business_day_convention,
-            DateGeneration.Backward,
-            False
-        )
-
     def build_quantlib_bond(self) -> FixedRateBond:
         if self.schedule is None:
             self.schedule = self._build_coupon_schedule()
@@ -141,165 +137,233 @@ class FixedRateBondAnalytics(BondAnalyticsBase):
 
         return self._bond
 
-    def cashflows(self) -> List[Tuple[date, float]]:
-        try:
-            bond = self.build_quantlib_bond()
+    def _cashflow_arrays(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Future cashflows as (datetime64[D] dates, float64 amounts), with same-date amounts merged"""
+        if self._cashflow_arrays_cache is None:
+            # QuantLib yields cashflows in date order, so same-date entries are adjacent
+            dates, amounts = [], []
+
+            for cf in self.build_quantlib_bond().cashflows():
+                if cf.hasOccurred():
+                    continue
 
-            cashflows_by_date = defaultdict(float)
+                cf_date = from_ql_date(cf.date())
+                cf_amount = cf.amount()
+                if not isinstance(cf_amount, (float, int)):
+                    raise ValueError(f"Invalid cashflow amount {cf_amount} for date {cf_date}")
 
-            for cf in bond.cashflows():
-                if not cf.hasOccurred():
-                    cf_date = from_ql_date(cf.date())
-                    cf_amount = cf.amount()
-                    if not isinstance(cf_amount, (float, int)):
-                        raise ValueError(f"Invalid cashflow amount {cf_amount} for date {cf_date}")
+                if cf_amount == 0:
+                    continue
 
-                    if cf_amount == 0:
-                        continue
+                if dates and dates[-1] == cf_date:
+                    amounts[-1] += cf_amount
+                else:
+                    dates.append(cf_date)
+                    amounts.append(cf_amount)
 
-                    cashflows_by_date[from_ql_date(cf.date())] += cf_amount
+            self._cashflow_arrays_cache = np.array(dates, dtype='datetime64[D]'), np.array(amounts, dtype=np.float64)
+        return self._cashflow_arrays_cache
 
-            return sorted(cashflows_by_date.items(), key=lambda x: x[0])
+    def cashflows(self) -> List[Tuple[date, float]]:
+        try:
+            dates, amounts = self._cashflow_arrays()
+            return list(zip(dates.tolist(), amounts.tolist()))
         except Exception as e:
             logging.error(f"Failed to get cashflows: {str(e)}")
             return []
 
+    @safe_analytic("Clean price")
     def clean_price(self) -> float:
         """Returns clean price normalized to face value of 1000"""
-        try:
-            ql_price = self.build_quantlib_bond().cleanPrice()  # QL returns price per 100
-            return ql_price * (self.face_value / 100.0)
-        except Exception as e:
-            logging.error(f"Clean price calculation failed: {str(e)}")
-            return float('nan')
+        ql_price = self.build_quantlib_bond().cleanPrice()  # QL returns price per 100
+        return ql_price * (self.face_value / 100.0)
 
+    @safe_analytic("Dirty price")
     def dirty_price(self) -> float:
         """Returns dirty price normalized to face value of 1000"""
-        try:
-            ql_price = self.build_quantlib_bond().dirtyPrice()  # QL returns price per 100
-            return ql_price * (self.face_value / 100.0)
-        except Exception as e:
-            logging.error(f"Dirty price calculation failed: {str(e)}")
-            return float('nan')
+        ql_price = self.build_quantlib_bond().dirtyPrice()  # QL returns price per 100
+        return ql_price * (self.face_value / 100.0)
 
+    @safe_analytic("Accrued interest")
     def accrued_interest(self) -> float:
         """Returns accrued interest normalized to face value of 1000"""
-        try:
-            ql_accrued = self.build_quantlib_bond().accruedAmount()  # QL returns per 100
-            return ql_accrued * (self.face_value / 100.0)
-        except Exception as e:
-            logging.error(f"Accrued interest calculation failed: {str(e)}")
-            return float('nan')
+        ql_accrued = self.build_quantlib_bond().accruedAmount()  # QL returns per 100
+        return ql_accrued * (self.face_value / 100.0)
+
+    def _yield_cashflow_terms(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Times (years from settlement) and amounts per 100 face of the cashflows after settlement.
+
+        Times accumulate period by period, the way QuantLib discounts a cashflow leg at a flat yield.
+        """
+        if self._yield_terms_cache is None:
+            times, amounts = [], []
+            t = 0.0
+            last_date = self.settlement_date
+            for cf in self.build_quantlib_bond().cashflows():
+                if cf.date() <= self.settlement_date:
+                    continue
+                t += self.day_count_convention.yearFraction(last_date, cf.date())
+                last_date = cf.date()
+                times.append(t)
+                amounts.append(cf.amount() * (100.0 / self.face_value))
+            self._yield_terms_cache = np.array(times), np.array(amounts)
+        return self._yield_terms_cache
+
+    def _has_closed_form_yield(self) -> bool:
+        """Whether the yield convention discounts each cashflow with a closed-form factor"""
+        return (self.compounding in (SIMPLE, CONTINUOUS)
+                or (self.compounding == COMPOUNDED and 0 < self.frequency <= 365))
+
+    def _yield_sensitivities(self, ytm: float) -> Optional[Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]]:
+        """
+        Per-cashflow terms for yield-based risk measures, or None when QuantLib has to compute them.
+
+        Args:
+            ytm: Yield at which to discount the cashflows
+
+        Returns:
+            Tuple of (times, present values, first and second derivatives of the present values in the yield)
+        """
+        if not self._has_closed_form_yield():
+            return None
+        times, amounts = self._yield_cashflow_terms()
+        if not len(times):
+            return None
+
+        if self.compounding == SIMPLE:
+            # QuantLib's duration and convexity discount a simple yield over each cashflow's whole time, unlike
+            # the period-by-period product its bondYield solves for
+            df = 1.0 / (1.0 + ytm * times)
+            d1 = -times * df * df
+            d2 = 2.0 * times ** 2 * df ** 3
+        elif self.compounding == CONTINUOUS:
+            df = np.exp(-ytm * times)
+            d1 = -times * df
+            d2 = times ** 2 * df
+        else:
+            growth = 1.0 + ytm / self.frequency
+            df = growth ** (-self.frequency * times)
+            d1 = -times * df / growth
+            d2 = times * (times + 1.0 / self.frequency) * df / growth ** 2
 
+        return times, amounts * df, amounts * d1, amounts * d2
+
+    @safe_analytic("YTM")
     def yield_to_maturity(self) -> float:
-        try:
-            normalized_price = self._get_normalized_market_price()
-            return self.build_quantlib_bond().bondYield(
-                normalized_price,
-                self.day_count_convention,
-                self.compounding,
-                self.frequency,
-                self.settlement_date
-            )
-        except Exception as e:
-            logging.error(f"YTM calculation failed: {str(e)}")
-            return float('nan')
+        normalized_price = self._get_normalized_market_price()
+        bond = self.build_quantlib_bond()
+
+        if self._has_closed_form_yield():
+            times, amounts = self._yield_cashflow_terms()
+            if len(times):
+                dirty_price = normalized_price + bond.accruedAmount(self.settlement_date)
+                ytm = _cashflow_yield(times, amounts, dirty_price, self.coupon_rate, self.compounding, self.frequency)
+                if not math.isnan(ytm):
+                    return ytm
+
+        # Other conventions, or a Newton step that failed to converge, use QuantLib's bracketing solver
+        return bond.bondYield(
+            normalized_price,
+            self.day_count_convention,
+            self.compounding,
+            self.frequency,
+            self.settlement_date
+        )
 
     def yield_to_worst(self) -> float:
-        return self.yield_to_maturity()
+        return self._cached_ytm()
 
+    @safe_analytic("Modified duration")
     def modified_duration(self) -> float:
-        try:
-            ytm = self.yield_to_maturity()
-            if math.isnan(ytm):
-                return float('nan')
-            return BondFunctions.duration(
-                self.build_quantlib_bond(),
-                ytm,
-                self.day_count_convention,
-                self.compounding,
-                self.frequency,
-                Duration.Modified,
-                self.settlement_date
-            )
-        except Exception as e:
-            logging.error(f"Modified duration calculation failed: {str(e)}")
+        ytm = self._cached_ytm()
+        if math.isnan(ytm):
             return float('nan')
+        terms = self._yield_sensitivities(ytm)
+        if terms is not None:
+            _, pv, d_pv, _ = terms
+            return -d_pv.sum() / pv.sum()
+        return BondFunctions.duration(
+            self.build_quantlib_bond(),
+            ytm,
+            self.day_count_convention,
+            self.compounding,
+            self.frequency,
+            Duration.Modified,
+            self.settlement_date
+        )
 
+    @safe_analytic("Macaulay duration")
     def macaulay_duration(self) -> float:
-        try:
-            ytm = self.yield_to_maturity()
-            if math.isnan(ytm):
-                return float('nan')
-            return BondFunctions.duration(
-                self.build_quantlib_bond(),
-                ytm,
-                self.day_count_convention,
-                self.compounding,
-                self.frequency,
-                Duration.Macaulay,
-                self.settlement_date
-            )
-        except Exception as e:
-            logging.error(f"Macaulay duration calculation failed: {str(e)}")
+        ytm = self._cached_ytm()
+        if math.isnan(ytm):
             return float('nan')
+        # QuantLib only defines Macaulay duration for compounded yields, so other conventions fall through to it
+        terms = self._yield_sensitivities(ytm) if self.compounding == COMPOUNDED else None
+        if terms is not None:
+            times, pv, _, _ = terms
+            return (times * pv).sum() / pv.sum()
+        return BondFunctions.duration(
+            self.build_quantlib_bond(),
+            ytm,
+            self.day_count_convention,
+            self.compounding,
+            self.frequency,
+            Duration.Macaulay,
+            self.settlement_date
+        )
 
+    @safe_analytic("Simple duration")
     def simple_duration(self) -> float:
-        try:
-            ytm = self.yield_to_maturity()
-            if math.isnan(ytm):
-                return float('nan')
-            return BondFunctions.duration(
-                self.build_quantlib_bond(),
-                ytm,
-                self.day_count_convention,
-                Simple,
-                self.frequency,
-                Duration.Simple,
-                self.settlement_date
-            )
-        except Exception as e:
-            logging.error(f"Simple duration calculation failed: {str(e)}")
+        ytm = self._cached_ytm()
+        if math.isnan(ytm):
             return float('nan')
+        return BondFunctions.duration(
+            self.build_quantlib_bond(),
+            ytm,
+            self.day_count_convention,
+            Simple,
+            self.frequency,
+            Duration.Simple,
+            self.settlement_date
+        )
 
+    @safe_analytic("Convexity")
     def convexity(self) -> float:
-        try:
-            ytm = self.yield_to_maturity()
-            if math.isnan(ytm):
-                return float('nan')
-            return BondFunctions.convexity(
-                self.build_quantlib_bond(),
-                ytm,
-                self.day_count_convention,
-                self.compounding,
-                self.frequency,
-                self.settlement_date
-            )
-        except Exception as e:
-            logging.error(f"Convexity calculation failed: {str(e)}")
+        ytm = self._cached_ytm()
+        if math.isnan(ytm):
             return float('nan')
+        terms = self._yield_sensitivities(ytm)
+        if terms is not None:
+            _, pv, _, d2_pv = terms
+            return d2_pv.sum() / pv.sum()
+        return BondFunctions.convexity(
+            self.build_quantlib_bond(),
+            ytm,
+            self.day_count_convention,
+            self.compounding,
+            self.frequency,
+            self.settlement_date
+        )
 
+    @safe_analytic("DV01")
     def dv01(self, bump_size: float = 0.0001) -> float:
-        try:
-            ytm = self.yield_to_maturity()
-            if math.isnan(ytm):
-                return float('nan')
-
-            bond = self.build_quantlib_bond()
-            price_up = BondFunctions.cleanPrice(
-                bond, ytm + bump_size, self.day_count_convention, self.compounding,
-                self.frequency, self.settlement_date
-            )
-            price_down = BondFunctions.cleanPrice(
-                bond, ytm - bump_size, self.day_count_convention, self.compounding,
-                self.frequency, self.settlement_date
-            )
-
-            return (price_down - price_up) / (2 * bump_size)
-        except Exception as e:
-            logging.error(f"DV01 calculation failed: {str(e)}")
+        ytm = self._cached_ytm()
+        if math.isnan(ytm):
             return float('nan')
 
+        bond = self.build_quantlib_bond()
+        price_up = BondFunctions.cleanPrice(
+            bond, ytm + bump_size, self.day_count_convention, self.compounding,
+            self.frequency, self.settlement_date
+        )
+        price_down = BondFunctions.cleanPrice(
+            bond, ytm - bump_size, self.day_count_convention, self.compounding,
+            self.frequency, self.settlement_date
+        )
+
+        return (price_down - price_up) / (2 * bump_size)
+
     def get_discount_curve(self, start=None, end=None, points=20) -> Dict[str, float]:
         try:
             if self._discount_curve is None:
@@ -320,29 +384,18 @@ class FixedRateBondAnalytics(BondAnalyticsBase):
             # Calculate the total period in years according to day count convention
             total_years = day_counter.yearFraction(ql_start, ql_end)
 
-            # Calculate step size in years
-            step_years = total_years / (points - 1)
-
-            result = {}
-            current = ql_start
-
-            for i in range(points):
-                if i == points - 1:  # Ensure we always include the end date
-                    current = ql_end
-
-                rate = curve.zeroRate(current, day_counter, compounding, frequency).rate()
-                result[from_ql_date(current)] = rate
-
-                # Advance using calendar and business day convention
-                if i < points - 2:  # Don't advance after the second-to-last point
-                    current = calendar.advance(
-                        current,
-                        Period(int(round(step_years * 365)), Days),
-                        self.business_day_convention
-                    )
-                    current = min(current, ql_end)  # Don't go past end date
+            # Evenly spaced grid in year fractions; each date is adjusted once rather than chained
+            # through calendar.advance, and the end date is always included
+            sample_dates = [
+                min(calendar.adjust(ql_start + int(round(t * 365)), self.business_day_convention), ql_end)
+                for t in np.linspace(0.0, total_years, points)[:-1]
+            ]
+            sample_dates.append(ql_end)
 
-            return result
+            return {
+                from_ql_date(current): curve.zeroRate(current, day_counter, compounding, frequency).rate()
+                for current in sample_dates
+            }
 
         except Exception as e:
             logging.error(f"Discount curve generation failed: {str(e)}", exc_info=True)
@@ -356,7 +409,7 @@ class FixedRateBondAnalytics(BondAnalyticsBase):
             'clean_price': self.clean_price,
             'dirty_price': self.dirty_price,
             'accrued_interest': self.accrued_interest,
-            'yield_to_maturity': self.yield_to_maturity,
+            'yield_to_maturity': self._cached_ytm,
             'yield_to_worst': self.yield_to_worst,
             'modified_duration': self.modified_duration,
             'macaulay_duration': self.macaulay_duration,
@@ -387,6 +440,10 @@ class FixedRateBondAnalytics(BondAnalyticsBase):
 
     def invalidate_cache(self):
         self._summary_cache = None
+        self._ytm_cache = None
+        self._normalized_price_cache = None
+        self._yield_terms_cache = None
+        self._cashflow_arrays_cache = None
 
     # Then, in methods that update key state, call invalidate_cache
     def update_yield_curve(self, rate: float) -> None:
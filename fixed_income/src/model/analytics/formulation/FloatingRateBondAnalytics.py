@@ -9,6 +9,7 @@ from QuantLib import Annual, BondFunctions, Compounded, DateGeneration, Days, Di
 
 from fixed_income.src.model.analytics.formulation import BondAnalyticsBase
 from fixed_income.src.model.bonds import FloatingRateBondModel
+from fixed_income.src.utils.helpers import safe_analytic
 
 
 class FloatingRateBondAnalytics(BondAnalyticsBase):
@@ -129,162 +130,137 @@ class FloatingRateBondAnalytics(BondAnalyticsBase):
         return [(cf.date(), cf.amount()) for cf in bond.cashflows() if
                 cf.date() >= self.settlement_date and cf.amount() > 0]
 
+    @safe_analytic("Clean price")
     def clean_price(self) -> float:
         """Returns the clean price using QuantLib's pricing engine"""
-        try:
-            # Ensure QuantLib evaluation date is current
-            Settings.instance().evaluationDate = self.settlement_date
-
-            bond = self.build_quantlib_bond()
+        # Ensure QuantLib evaluation date is current
+        Settings.instance().evaluationDate = self.settlement_date
 
-            return bond.cleanPrice()
+        bond = self.build_quantlib_bond()
 
-        except Exception as e:
-            logging.error(f"Clean price calculation failed: {str(e)}")
-            return float('nan')
+        return bond.cleanPrice()
 
+    @safe_analytic("Dirty price")
     def dirty_price(self) -> float:
         """Returns the dirty price using QuantLib's built-in method"""
-        try:
-            # Ensure QuantLib evaluation date is current
-            Settings.instance().evaluationDate = self.settlement_date
-
-            bond = self.build_quantlib_bond()
+        # Ensure QuantLib evaluation date is current
+        Settings.instance().evaluationDate = self.settlement_date
 
-            return bond.dirtyPrice()
+        bond = self.build_quantlib_bond()
 
-        except Exception as e:
-            logging.error(f"Dirty price calculation failed: {str(e)}")
-            return float('nan')
+        return bond.dirtyPrice()
 
+    @safe_analytic("Accrued interest")
     def accrued_interest(self) -> float:
         """Returns the accrued interest since last cashflow"""
-        try:
-            # Ensure evaluation date is set correctly
-            Settings.instance().evaluationDate = self.settlement_date
-            return self.build_quantlib_bond().accruedAmount()
-        except Exception as e:
-            logging.error(f"Accrued interest calculation failed: {str(e)}")
-            return float('nan')
+        # Ensure evaluation date is set correctly
+        Settings.instance().evaluationDate = self.settlement_date
+        return self.build_quantlib_bond().accruedAmount()
 
+    @safe_analytic("YTM")
     def yield_to_maturity(self) -> float:
         """
         Returns the Yield to Maturity (YTM) given the market price.
         Computed with Compounded Annual convention.
         """
-        try:
-            # Ensure evaluation date is set correctly
-            Settings.instance().evaluationDate = self.settlement_date
-
-            return self.build_quantlib_bond().bondYield(
-                self.market_price,
-                self.day_count_convention,
-                Compounded,
-                Annual,
-                self.settlement_date
-            )
-        except Exception as e:
-            logging.error(f"YTM calculation failed: {str(e)}")
-            return float('nan')
+        # Ensure evaluation date is set correctly
+        Settings.instance().evaluationDate = self.settlement_date
+
+        return self.build_quantlib_bond().bondYield(
+            self.market_price,
+            self.day_count_convention,
+            Compounded,
+            Annual,
+            self.settlement_date
+        )
 
     def yield_to_worst(self) -> float:
         """
         Returns Yield to Worst (YTW).
         For non-callable zero-coupon bonds, YTW = YTM.
         """
-        return self.yield_to_maturity()
+        return self._cached_ytm()
 
+    @safe_analytic("Modified duration")
     def modified_duration(self) -> float:
         """Returns the modified duration in years"""
-        try:
-            # Ensure evaluation date is set correctly
-            Settings.instance().evaluationDate = self.settlement_date
-
-            ytm = self.yield_to_maturity()
-            if math.isnan(ytm):
-                return float('nan')
-
-            return BondFunctions.duration(
-                self.build_quantlib_bond(),
-                ytm,
-                self.day_count_convention,
-                Compounded,
-                Annual,
-                Duration.Modified,
-                self.settlement_date
-            )
-        except Exception as e:
-            logging.error(f"Modified duration calculation failed: {str(e)}")
+        # Ensure evaluation date is set correctly
+        Settings.instance().evaluationDate = self.settlement_date
+
+        ytm = self._cached_ytm()
+        if math.isnan(ytm):
             return float('nan')
 
+        return BondFunctions.duration(
+            self.build_quantlib_bond(),
+            ytm,
+            self.day_count_convention,
+            Compounded,
+            Annual,
+            Duration.Modified,
+            self.settlement_date
+        )
+
+    @safe_analytic("Macaulay duration")
     def macaulay_duration(self) -> float:
         """Returns the Macaulay duration in years"""
-        try:
-            # Ensure evaluation date is set correctly
-            Settings.instance().evaluationDate = self.settlement_date
-
-            ytm = self.yield_to_maturity()
-            if math.isnan(ytm):
-                return float('nan')
-
-            return BondFunctions.duration(
-                self.build_quantlib_bond(),
-                ytm,
-                self.day_count_convention,
-                Compounded,
-                Annual,
-                Duration.Macaulay,
-                self.settlement_date
-            )
-        except Exception as e:
-            logging.error(f"Macaulay duration calculation failed: {str(e)}")
+        # Ensure evaluation date is set correctly
+        Settings.instance().evaluationDate = self.settlement_date
+
+        ytm = self._cached_ytm()
+        if math.isnan(ytm):
             return float('nan')
 
+        return BondFunctions.duration(
+            self.build_quantlib_bond(),
+            ytm,
+            self.day_count_convention,
+            Compounded,
+            Annual,
+            Duration.Macaulay,
+            self.settlement_date
+        )
+
+    @safe_analytic("Simple duration")
     def simple_duration(self) -> float:
         """Returns simple duration approximation"""
-        try:
-            # Ensure evaluation date is set correctly
-            Settings.instance().evaluationDate = self.settlement_date
-
-            ytm = self.yield_to_maturity()
-            if math.isnan(ytm):
-                return float('nan')
-
-            return BondFunctions.duration(
-                self.build_quantlib_bond(),
-                ytm,
-                self.day_count_convention,
-                Simple,
-                Annual,
-                Duration.Simple,
-                self.settlement_date
-            )
-        except Exception as e:
-            logging.error(f"Simple duration calculation failed: {str(e)}")
+        # Ensure evaluation date is set correctly
+        Settings.instance().evaluationDate = self.settlement_date
+
+        ytm = self._cached_ytm()
+        if math.isnan(ytm):
             return float('nan')
 
+        return BondFunctions.duration(
+            self.build_quantlib_bond(),
+            ytm,
+            self.day_count_convention,
+            Simple,
+            Annual,
+            Duration.Simple,
+            self.settlement_date
+        )
+
+    @safe_analytic("Convexity")
     def convexity(self) -> float:
         """Returns convexity measure"""
-        try:
-            # Ensure evaluation date is set correctly
-            Settings.instance().evaluationDate = self.settlement_date
-
-            ytm = self.yield_to_maturity()
-            if math.isnan(ytm):
-                return float('nan')
-
-            return BondFunctions.convexity(
-                self.build_quantlib_bond(),
-                ytm,
-                self.day_count_convention,
-                Compounded,
-                Annual,
-                self.settlement_date
-            )
-        except Exception as e:
-            logging.error(f"Convexity calculation failed: {str(e)}")
+        # Ensure evaluation date is set correctly
+        Settings.instance().evaluationDate = self.settlement_date
+
+        ytm = self._cached_ytm()
+        if math.isnan(ytm):
             return float('nan')
 
+        return BondFunctions.convexity(
+            self.build_quantlib_bond(),
+            ytm,
+            self.day_count_convention,
+            Compounded,
+            Annual,
+            self.settlement_date
+        )
+
+    @safe_analytic("DV01")
     def dv01(self, bump_size: float = 0.0001) -> float:
         """
         Returns DV01 (Dollar Value of 1 basis point)
@@ -292,39 +268,35 @@ class FloatingRateBondAnalytics(BondAnalyticsBase):
         Args:
             bump_size: The yield change to use (default 1bp)
         """
-        try:
-            # Ensure evaluation date is set correctly
-            Settings.instance().evaluationDate = self.settlement_date
-
-            ytm = self.yield_to_maturity()
-            if math.isnan(ytm):
-                return float('nan')
-
-            bond = self.build_quantlib_bond()
-
-            price_up = BondFunctions.cleanPrice(
-                bond,
-                ytm + bump_size,
-                self.day_count_convention,
-                Compounded,
-                Annual,
-                self.settlement_date
-            )
-
-            price_down = BondFunctions.cleanPrice(
-                bond,
-                ytm - bump_size,
-                self.day_count_convention,
-                Compounded,
-                Annual,
-                self.settlement_date
-            )
+        # Ensure evaluation date is set correctly
+        Settings.instance().evaluationDate = self.settlement_date
 
-            return (price_down - price_up) / 2
-        except Exception as e:
-            logging.error(f"DV01 calculation failed: {str(e)}")
+        ytm = self._cached_ytm()
+        if math.isnan(ytm):
             return float('nan')
 
+        bond = self.build_quantlib_bond()
+
+        price_up = BondFunctions.cleanPrice(
+            bond,
+            ytm + bump_size,
+            self.day_count_convention,
+            Compounded,
+            Annual,
+            self.settlement_date
+        )
+
+        price_down = BondFunctions.cleanPrice(
+            bond,
+            ytm - bump_size,
+            self.day_count_convention,
+            Compounded,
+            Annual,
+            self.settlement_date
+        )
+
+        return (price_down - price_up) / 2
+
     def get_discount_curve(self, start=None, end=None, frequency_days=365) -> Dict[str, float]:
         """
         Returns a dictionary of {ISO_date: zero_rate} over the selected range.
@@ -372,7 +344,7 @@ class FloatingRateBondAnalytics(BondAnalyticsBase):
             'clean_price': self.clean_price,
             'dirty_price': self.dirty_price,
             'accrued_interest': self.accrued_interest,
-            'yield_to_maturity': self.yield_to_maturity,
+            'yield_to_maturity': self._cached_ytm,
             'yield_to_worst': self.yield_to_worst,
             'modified_duration': self.modified_duration,
             'macaulay_duration': self.macaulay_duration,
@@ -406,6 +378,10 @@ class FloatingRateBondAnalytics(BondAnalyticsBase):
             self.build_quantlib_bond()
 
         self._rate_quote.setValue(rate)
+        self.invalidate_cache()
+
+    def invalidate_cache(self):
+        self._ytm_cache = None
 
     def update_settlement_date(self, new_date: date) -> None:
         """
@@ -422,3 +398,4 @@ class FloatingRateBondAnalytics(BondAnalyticsBase):
         self._bond = None
         self._discount_curve = None
         self._rate_quote = None
+        self._ytm_cache = None
@@ -4,15 +4,17 @@ from collections import defaultdict
 from datetime import date
 from typing import Dict, List, Optional, Tuple
 
+import numpy as np
 from QuantLib import BondFunctions, BondPrice, Callability, CallabilitySchedule, CallableFixedRateBond, \
-    DateGeneration, Days, Duration, FlatForward, HullWhite, Months, Period, QuoteHandle, Schedule, Settings, \
+    Continuous, Date, Days, Duration, FlatForward, HullWhite, NoFrequency, QuoteHandle, Settings, \
     Simple, SimpleQuote, \
-    SobolRsg, TimeGrid, \
-    TreeCallableFixedRateBondEngine, YieldTermStructureHandle
+    SobolRsg, TimeGrid, YieldTermStructureHandle
 
+from fixed_income.src.model.analytics._kernels import _bond_value_hw
 from fixed_income.src.model.analytics.formulation import BondAnalyticsBase
+from fixed_income.src.model.analytics.formulation.BondAnalyticsBase import hull_white_callable_engine
 from fixed_income.src.model.bonds import PutableBondModel
-from fixed_income.src.utils.helpers import replace_nan_with_none
+from fixed_income.src.utils.helpers import replace_nan_with_none, safe_analytic
 from fixed_income.src.utils.quantlib_mapper import from_ql_date, to_ql_date, to_ql_frequency
 
 
@@ -24,17 +26,25 @@ class PutableBondAnalytics(BondAnalyticsBase):
             raise ValueError("Must provide a PutableBondModel instance")
 
         self._summary_cache = None
+        self._ytp_cache = None
+        self._normalized_price_cache = None
 
         self._bond: Optional[CallableFixedRateBond] = None
         self._discount_curve: Optional[YieldTermStructureHandle] = None
         self._rate_quote: Optional[SimpleQuote] = None
 
+        # QuantLib's HullWhite defaults, matching the model behind the pricing engine
+        self.model_params = {"mean_reversion": 0.1, "volatility": 0.01, "time_steps": 100}
+
         self.coupon_rate = bond.coupon_rate
         self.coupon_frequency = to_ql_frequency(bond.coupon_frequency)
         self.schedule = None
 
         self.put_schedule = bond.put_schedule
         self.putability_schedule = CallabilitySchedule()
+        self._put_schedule_cached: Optional[List[Tuple[Date, float]]] = None
+        self._first_future_put: Optional[Tuple[Date, float]] = None
+        self._put_dates_ser = np.empty(0, dtype=np.int32)
 
         # Adjust dates to business days
         self._adjust_dates()
@@ -89,13 +99,17 @@ class PutableBondAnalytics(BondAnalyticsBase):
 
     def _get_normalized_market_price(self) -> float:
         """Returns market price normalized to 100 face value."""
+        if self._normalized_price_cache is not None:
+            return self._normalized_price_cache
+
         market_price = getattr(self, 'market_price', None)
         if market_price is None:
             logging.warning("Market price not set, using clean price as fallback.")
             market_price = self.clean_price()
         if self.face_value == 0:
             raise ZeroDivisionError("Face value cannot be zero when normalizing price.")
-        return (market_price / self.face_value) * 100
+        self._normalized_price_cache = (market_price / self.face_value) * 100
+        return self._normalized_price_cache
 
     # Yield curves must be anchored to the EVALUATION DATE
     def _build_yield_curve(self, initial_rate: float = 0.05) -> Tuple[YieldTermStructureHandle, SimpleQuote]:
@@ -111,66 +125,46 @@ class PutableBondAnalytics(BondAnalyticsBase):
         curve.enableExtrapolation()  # Allow extrapolation beyond curve dates
         return YieldTermStructureHandle(curve), flat_rate
 
-    def _build_coupon_schedule(self):
-        return Schedule(
-            self.issue_date,
-            self.maturity_date,
-            Period(int(12 / self.coupon_frequency), Months),
-            self.calendar,
-            self.business_day_convention,
-            self.business_day_convention,
-            DateGeneration.Backward,
-            False
-        )
-
-    def _filter_put_schedule(self) -> List[Dict]:
-        """Filter out historical put dates and validate remaining schedule."""
-        if not self.put_schedule:
-            return []
+    def _filter_put_schedule(self) -> List[Tuple[Date, float]]:
+        """Filter out historical put dates and validate remaining schedule, parsing the raw entries only once."""
+        if self._put_schedule_cached is not None:
+            return self._put_schedule_cached
 
         filtered_schedule = []
-        for entry in self.put_schedule:
+        for entry in self.put_schedule or []:
             if not isinstance(entry, dict) or "date" not in entry or "price" not in entry:
                 raise ValueError("Put schedule entries must be dicts with 'date' and 'price' keys")
 
-            put_date = to_ql_date(date.fromisoformat(entry["date"]))
-            adjusted_put_date = self.calendar.adjust(put_date, self.business_day_convention)
+            put_date = self.calendar.adjust(to_ql_date(date.fromisoformat(entry["date"])), self.business_day_convention)
 
             # Only include put dates that are in the future relative to evaluation date
-            if adjusted_put_date > self.evaluation_date:
-                filtered_schedule.append({
-                    "date": adjusted_put_date,
-                    "price": float(entry["price"])
-                })
-
-        # Sort the call schedule by date
-        filtered_schedule.sort(key=lambda x: x["date"])
+            if put_date > self.evaluation_date:
+                put_price = float(entry["price"])
+                if put_price <= 0:
+                    raise ValueError("Put price must be positive")
+                filtered_schedule.append((put_date, put_price))
+
+        # Sort the put schedule by date
+        filtered_schedule.sort(key=lambda x: x[0])
+        self._put_schedule_cached = filtered_schedule
         return filtered_schedule
 
     def _build_putability_schedule(self):
         """Build callability schedule considering only future put dates."""
         filtered_schedule = self._filter_put_schedule()
+        self._first_future_put = filtered_schedule[0] if filtered_schedule else None
+        # Serial numbers of the (sorted) put dates, so later date cut-offs are a binary search
+        self._put_dates_ser = np.array([put_date.serialNumber() for put_date, _ in filtered_schedule],
+                                       dtype=np.int32)
 
         if not filtered_schedule:
             logging.warning("No valid future put dates found in put schedule")
             return
 
-        for entry in self.put_schedule:
-            if not isinstance(entry, dict) or "date" not in entry or "price" not in entry:
-                raise ValueError("Put schedule entries must be dicts with 'date' and 'price' keys")
-
-            schedule_date = self.calendar.adjust(
-                to_ql_date(date.fromisoformat(entry["date"])),
-                self.business_day_convention
-            )
-
-            schedule_price = float(entry["price"])
-            if schedule_price <= 0:
-                raise ValueError("Put price must be positive")
-
+        for schedule_date, schedule_price in filtered_schedule:
             self.putability_schedule.append(Callability(
                 BondPrice(schedule_price, BondPrice.Dirty),
-                Callability.Call,
+                Callability.Put,
                 schedule_date
             ))
 
@@ -182,10 +176,11 @@ class PutableBondAnalytics(BondAnalyticsBase):
         if self.schedule is None:
             self.schedule = self._build_coupon_schedule()
 
-        if self.put_schedule is None:
+        if self._bond is None:
+            # Rebuilt with the bond so only puts after the current evaluation date reach the tree
+            self.putability_schedule = CallabilitySchedule()
             self._build_putability_schedule()
 
-        if self._bond is None:
             self._bond = CallableFixedRateBond(
                 settlementDays=self.settlement_days,
                 faceAmount=self.face_value,
@@ -204,10 +199,8 @@ class PutableBondAnalytics(BondAnalyticsBase):
             # Set pricing engine with the properly constructed discount curve
             model = HullWhite(self._discount_curve)
 
-            years_to_maturity = self._discount_curve.referenceDate().yearFraction(self.maturity_date)
-            time_grid = TimeGrid(years_to_maturity, 100)
-
-            engine = TreeCallableFixedRateBondEngine(model, time_grid)
+            years_to_maturity = self.day_count_convention.yearFraction(self.evaluation_date, self.maturity_date)
+            engine = hull_white_callable_engine(model, years_to_maturity, self.model_params["time_steps"])
             self._bond.setPricingEngine(engine)
 
         return self._bond
@@ -216,193 +209,169 @@ class PutableBondAnalytics(BondAnalyticsBase):
         try:
             bond = self.build_quantlib_bond()
 
-            cashflows_by_date = defaultdict(float)
+            # QuantLib yields cashflows in date order, so same-date entries are adjacent
+            result = []
 
             for cf in bond.cashflows():
-                if not cf.hasOccurred():
-                    cf_date = from_ql_date(cf.date())
-                    cf_amount = cf.amount()
-                    if not isinstance(cf_amount, (float, int)):
-                        raise ValueError(f"Invalid cashflow amount {cf_amount} for date {cf_date}")
-                    # optionally skip past cashflows
-                    cashflows_by_date[from_ql_date(cf.date())] += cf.amount()
-
-            # Return as sorted list of (Date, Amount) tuples
-            return sorted(cashflows_by_date.items(), key=lambda x: x[0])
+                if cf.hasOccurred():
+                    continue
+
+                cf_date = from_ql_date(cf.date())
+                cf_amount = cf.amount()
+                if not isinstance(cf_amount, (float, int)):
+                    raise ValueError(f"Invalid cashflow amount {cf_amount} for date {cf_date}")
+
+                if result and result[-1][0] == cf_date:
+                    result[-1] = (cf_date, result[-1][1] + cf_amount)
+                else:
+                    result.append((cf_date, cf_amount))
+
+            return result
         except Exception as e:
             logging.error(f"Failed to get cashflows: {str(e)}")
             return []
 
+    @safe_analytic("Clean price")
     def clean_price(self) -> float:
         """Returns clean price normalized to face value of 1000"""
-        try:
-            ql_price = self.build_quantlib_bond().cleanPrice()  # QL returns price per 100
-            return ql_price * (self.face_value / 100.0)
-        except Exception as e:
-            logging.error(f"Clean price calculation failed: {str(e)}")
-            return float('nan')
+        ql_price = self.build_quantlib_bond().cleanPrice()  # QL returns price per 100
+        return ql_price * (self.face_value / 100.0)
 
+    @safe_analytic("Dirty price")
     def dirty_price(self) -> float:
         """Returns dirty price normalized to face value of 1000"""
-        try:
-            ql_price = self.build_quantlib_bond().dirtyPrice()  # QL returns price per 100
-            return ql_price * (self.face_value / 100.0)
-        except Exception as e:
-            logging.error(f"Dirty price calculation failed: {str(e)}")
-            return float('nan')
+        ql_price = self.build_quantlib_bond().dirtyPrice()  # QL returns price per 100
+        return ql_price * (self.face_value / 100.0)
 
+    @safe_analytic("Accrued interest")
     def accrued_interest(self) -> float:
         """Returns accrued interest normalized to face value of 1000"""
-        try:
-            ql_accrued = self.build_quantlib_bond().accruedAmount()  # QL returns per 100
-            return ql_accrued * (self.face_value / 100.0)
-        except Exception as e:
-            logging.error(f"Accrued interest calculation failed: {str(e)}")
-            return float('nan')
+        ql_accrued = self.build_quantlib_bond().accruedAmount()  # QL returns per 100
+        return ql_accrued * (self.face_value / 100.0)
 
+    @safe_analytic("YTM")
     def yield_to_maturity(self) -> float:
-        try:
-            normalized_price = self._get_normalized_market_price()
-            return self.build_quantlib_bond().bondYield(
-                normalized_price,
-                self.day_count_convention,
-                self.compounding,
-                self.frequency,
-                self.settlement_date
-            )
-        except Exception as e:
-            logging.error(f"YTM calculation failed: {str(e)}")
-            return float('nan')
+        normalized_price = self._get_normalized_market_price()
+        return self.build_quantlib_bond().bondYield(
+            normalized_price,
+            self.day_count_convention,
+            self.compounding,
+            self.frequency,
+            self.settlement_date
+        )
+
+    def _cached_ytp(self) -> float:
+        if self._ytp_cache is None:
+            self._ytp_cache = self.yield_to_put()
+        return self._ytp_cache
 
+    @safe_analytic("YTP")
     def yield_to_put(self) -> float:
         """
         Returns the Yield to Put (YTP), calculated to the earliest put date after settlement.
         If no future put date is available, returns NaN.
         """
-        try:
-            bond = self.build_quantlib_bond()
+        bond = self.build_quantlib_bond()
 
-            # Find the first put date strictly after settlement
-            future_puts = [c for c in self.putability_schedule if c.date() > self.evaluation_date]
-            if not future_puts:
-                logging.warning("No future put dates available to compute YTP.")
-                return float('nan')
-
-            first_put = min(future_puts, key=lambda c: c.date())
-            put_date = first_put.date()
-            put_price = first_put.price().amount()
-
-            return BondFunctions.bondYield(
-                bond,
-                put_price,
-                self.day_count_convention,
-                self.compounding,
-                self.frequency,
-                self.settlement_date,
-                put_date
-            )
-
-        except Exception as e:
-            logging.error(f"YTP calculation failed: {str(e)}")
+        # The putability schedule is built from future puts in date order, so its head is the first put
+        if self._first_future_put is None:
+            logging.warning("No future put dates available to compute YTP.")
             return float('nan')
 
+        put_date, put_price = self._first_future_put
+
+        return BondFunctions.bondYield(
+            bond,
+            put_price,
+            self.day_count_convention,
+            self.compounding,
+            self.frequency,
+            self.settlement_date,
+            put_date
+        )
+
     def yield_to_worst(self) -> float:
         """
         Returns Yield to Worst (YTW).
         """
-        return min(self.yield_to_maturity(), self.yield_to_put())
+        return min(self._cached_ytm(), self._cached_ytp())
 
+    @safe_analytic("Modified duration")
     def modified_duration(self) -> float:
-        try:
-            ytm = self.yield_to_maturity()
-            if math.isnan(ytm):
-                return float('nan')
-            return BondFunctions.duration(
-                self.build_quantlib_bond(),
-                ytm,
-                self.day_count_convention,
-                self.compounding,
-                self.frequency,
-                Duration.Modified,
-                self.settlement_date
-            )
-        except Exception as e:
-            logging.error(f"Modified duration calculation failed: {str(e)}")
+        ytm = self._cached_ytm()
+        if math.isnan(ytm):
             return float('nan')
+        return BondFunctions.duration(
+            self.build_quantlib_bond(),
+            ytm,
+            self.day_count_convention,
+            self.compounding,
+            self.frequency,
+            Duration.Modified,
+            self.settlement_date
+        )
 
+    @safe_analytic("Macaulay duration")
     def macaulay_duration(self) -> float:
-        try:
-            ytm = self.yield_to_maturity()
-            if math.isnan(ytm):
-                return float('nan')
-            return BondFunctions.duration(
-                self.build_quantlib_bond(),
-                ytm,
-                self.day_count_convention,
-                self.compounding,
-                self.frequency,
-                Duration.Macaulay,
-                self.settlement_date
-            )
-        except Exception as e:
-            logging.error(f"Macaulay duration calculation failed: {str(e)}")
+        ytm = self._cached_ytm()
+        if math.isnan(ytm):
             return float('nan')
+        return BondFunctions.duration(
+            self.build_quantlib_bond(),
+            ytm,
+            self.day_count_convention,
+            self.compounding,
+            self.frequency,
+            Duration.Macaulay,
+            self.settlement_date
+        )
 
+    @safe_analytic("Simple duration")
     def simple_duration(self) -> float:
-        try:
-            ytm = self.yield_to_maturity()
-            if math.isnan(ytm):
-                return float('nan')
-            return BondFunctions.duration(
-                self.build_quantlib_bond(),
-                ytm,
-                self.day_count_convention,
-                Simple,
-                self.frequency,
-                Duration.Simple,
-                self.settlement_date
-            )
-        except Exception as e:
-            logging.error(f"Simple duration calculation failed: {str(e)}")
+        ytm = self._cached_ytm()
+        if math.isnan(ytm):
             return float('nan')
+        return BondFunctions.duration(
+            self.build_quantlib_bond(),
+            ytm,
+            self.day_count_convention,
+            Simple,
+            self.frequency,
+            Duration.Simple,
+            self.settlement_date
+        )
 
+    @safe_analytic("Convexity")
     def convexity(self) -> float:
-        try:
-            ytm = self.yield_to_maturity()
-            if math.isnan(ytm):
-                return float('nan')
-            return BondFunctions.convexity(
-                self.build_quantlib_bond(),
-                ytm,
-                self.day_count_convention,
-                self.compounding,
-                self.frequency,
-                self.settlement_date
-            )
-        except Exception as e:
-            logging.error(f"Convexity calculation failed: {str(e)}")
+        ytm = self._cached_ytm()
+        if math.isnan(ytm):
             return float('nan')
+        return BondFunctions.convexity(
+            self.build_quantlib_bond(),
+            ytm,
+            self.day_count_convention,
+            self.compounding,
+            self.frequency,
+            self.settlement_date
+        )
 
+    @safe_analytic("DV01")
     def dv01(self, bump_size: float = 0.0001) -> float:
-        try:
-            ytm = self.yield_to_maturity()
-            if math.isnan(ytm):
-                return float('nan')
+        ytm = self._cached_ytm()
+        if math.isnan(ytm):
+            return float('nan')
 
-            bond = self.build_quantlib_bond()
-            price_up = BondFunctions.cleanPrice(
-                bond, ytm + bump_size, self.day_count_convention, self.compounding,
-                self.frequency, self.settlement_date
-            )
-            price_down = BondFunctions.cleanPrice(
-                bond, ytm - bump_size, self.day_count_convention, self.compounding,
-                self.frequency, self.settlement_date
-            )
+        bond = self.build_quantlib_bond()
+        price_up = BondFunctions.cleanPrice(
+            bond, ytm + bump_size, self.day_count_convention, self.compounding,
+            self.frequency, self.settlement_date
+        )
+        price_down = BondFunctions.cleanPrice(
+            bond, ytm - bump_size, self.day_count_convention, self.compounding,
+            self.frequency, self.settlement_date
+        )
 
-            return (price_down - price_up) / (2 * bump_size)
-        except Exception as e:
-            logging.error(f"DV01 calculation failed: {str(e)}")
-            return float('nan')
+        return (price_down - price_up) / (2 * bump_size)
 
     def get_discount_curve(self, start=None, end=None, points=20) -> Dict[str, float]:
         try:
@@ -424,29 +393,18 @@ class PutableBondAnalytics(BondAnalyticsBase):
             # Calculate the total period in years according to day count convention
             total_years = day_counter.yearFraction(ql_start, ql_end)
 
-            # Calculate step size in years
-            step_years = total_years / (points - 1)
-
-            result = {}
-            current = ql_start
-
-            for i in range(points):
-                if i == points - 1:  # Ensure we always include the end date
-                    current = ql_end
-
-                rate = curve.zeroRate(current, day_counter, compounding, frequency).rate()
-                result[from_ql_date(current)] = rate
-
-                # Advance using calendar and business day convention
-                if i < points - 2:  # Don't advance after the second-to-last point
-                    current = calendar.advance(
-                        current,
-                        Period(int(round(step_years * 365)), Days),
-                        self.business_day_convention
-                    )
-                    current = min(current, ql_end)  # Don't go past end date
+            # Evenly spaced grid in year fractions; each date is adjusted once rather than chained
+            # through calendar.advance, and the end date is always included
+            sample_dates = [
+                min(calendar.adjust(ql_start + int(round(t * 365)), self.business_day_convention), ql_end)
+                for t in np.linspace(0.0, total_years, points)[:-1]
+            ]
+            sample_dates.append(ql_end)
 
-            return result
+            return {
+                from_ql_date(current): curve.zeroRate(current, day_counter, compounding, frequency).rate()
+                for current in sample_dates
+            }
 
         except Exception as e:
             logging.error(f"Discount curve generation failed: {str(e)}", exc_info=True)
@@ -537,11 +495,9 @@ class PutableBondAnalytics(BondAnalyticsBase):
         try:
             # Create temporary pricing engine with shocked curve
             model = HullWhite(YieldTermStructureHandle(shocked_curve))
-            time_grid = TimeGrid(
-                shocked_curve.referenceDate().yearFraction(self.maturity_date),
-                self.model_params["time_steps"]
-            )
-            temp_engine = TreeCallableFixedRateBondEngine(model, time_grid)
+            years_to_maturity = self.day_count_convention.yearFraction(shocked_curve.referenceDate(),
+                                                                       self.maturity_date)
+            temp_engine = hull_white_callable_engine(model, years_to_maturity, self.model_params["time_steps"])
 
             # Price with shocked curve
             self._bond.setPricingEngine(temp_engine)
@@ -561,21 +517,24 @@ class PutableBondAnalytics(BondAnalyticsBase):
             Dictionary mapping call dates to their respective call probabilities
         """
         try:
+            self.build_quantlib_bond()
             if not self.putability_schedule:
                 return {}
 
-            # Get future call dates
-            future_calls = [
-                (c.date(), c.price().amount())
-                for c in self.putability_schedule
-                if c.date() > self.evaluation_date
-            ]
+            # Get future call dates; the schedule is already sorted by date
+            first_future = np.searchsorted(self._put_dates_ser, self.evaluation_date.serialNumber(), side='right')
+            future_calls = self._filter_put_schedule()[first_future:]
 
             if not future_calls:
                 return {}
 
-            # Sort call dates
-            future_calls.sort(key=lambda x: x[0])
+            # Year fractions depend only on the schedule, so compute them once for all paths
+            call_dates = [call_date for call_date, _ in future_calls]
+            call_times = np.array([
+                self.day_count_convention.yearFraction(self.evaluation_date, call_date)
+                for call_date in call_dates
+            ])
+            forward_terms = self._forward_cashflow_terms(call_dates, call_times)
 
             # Set up Hull-White model
             model = HullWhite(
@@ -595,26 +554,15 @@ class PutableBondAnalytics(BondAnalyticsBase):
                 # Generate random path
                 path = self._generate_interest_rate_path(
                     model,
-                    max(c[0] for c in future_calls),
+                    call_dates,
+                    call_times,
                     sequence_generator
                 )
 
                 # Check each call date
                 for call_date, call_price in future_calls:
-                    # Get simulated short rate at call date
-                    rate = path[call_date]
-
-                    # Create temporary curve
-                    temp_curve = FlatForward(
-                        call_date,
-                        QuoteHandle(SimpleQuote(rate)),
-                        self.day_count_convention,
-                        self.compounding,
-                        self.frequency
-                    )
-
-                    # Price bond if not called yet
-                    bond_value = self._calculate_bond_value_at_date(call_date, temp_curve)
+                    # Price bond if not called yet, from the simulated state at the call date
+                    bond_value = _bond_value_hw(path[call_date], *forward_terms[call_date])
 
                     # Check if called
                     if bond_value >= call_price:
@@ -640,64 +588,63 @@ class PutableBondAnalytics(BondAnalyticsBase):
             logging.error(f"Call probability calculation failed: {str(e)}", exc_info=True)
             return {}
 
-    def _generate_interest_rate_path(self, model, end_date, sequence_generator):
-        """Generate a single interest rate path using the model"""
-        # Convert dates to times
-        times = [self.day_count_convention.yearFraction(
-            self.evaluation_date,
-            date
-        ) for date in [self.evaluation_date, end_date]]
-
+    def _generate_interest_rate_path(self, model, call_dates, call_times, sequence_generator):
+        """Generate a single interest rate path using the model, sampled at the (sorted) call dates"""
         # Generate random numbers
         sequence = sequence_generator.nextSequence().value()
 
         # Simulate path
         path = {}
-        time_grid = TimeGrid(times[0], times[1], 100)
+        time_grid = TimeGrid(0.0, call_times[-1], 100)
         process = model.treeProcess(time_grid)
 
         # Store the path at each call date
-        for call_date in self.putability_schedule:
-            ql_date = call_date.date()
-            if ql_date > self.evaluation_date:
-                t = self.day_count_convention.yearFraction(self.evaluation_date, ql_date)
-                path[ql_date] = process.evolve(0, 0, t, sequence[0])
+        for ql_date, t in zip(call_dates, call_times):
+            path[ql_date] = process.evolve(0, 0, t, sequence[0])
 
         return path
 
-    def _calculate_bond_value_at_date(self, call_date, temp_curve):
-        """Calculate bond value at a specific future date"""
-        # Temporarily change evaluation date
-        Settings.instance().evaluationDate = call_date
+    def _forward_cashflow_terms(self, call_dates, call_times) -> Dict[Date, Tuple[np.ndarray, np.ndarray, np.ndarray]]:
+        """
+        Precompute, for each call date, what is needed to value the bond there in closed form.
 
-        try:
-            # Create temporary bond
-            temp_bond = CallableFixedRateBond(
-                settlementDays=0,  # Immediate settlement
-                faceAmount=self.face_value,
-                schedule=self.schedule,
-                coupons=[self.coupon_rate],
-                paymentDayCounter=self.day_count_convention,
-                paymentConvention=self.business_day_convention,
-                redemption=100.0,
-                issueDate=self.issue_date,
-                putCallSchedule=self.putability_schedule,
-                paymentCalendar=self.calendar
-            )
+        Under Hull-White the bond is worth sum_k c_k * exp(-x * B(t, T_k) - L(t, T_k)) given the simulated
+        state x(t), where L folds the fitted drift alpha(t) into -ln A(t, T_k).
 
-            # Set pricing engine
-            temp_model = HullWhite(YieldTermStructureHandle(temp_curve))
-            time_grid = TimeGrid(
-                temp_curve.referenceDate().yearFraction(self.maturity_date),
-                self.model_params["time_steps"]
-            )
-            temp_engine = TreeCallableFixedRateBondEngine(temp_model, time_grid)
-            temp_bond.setPricingEngine(temp_engine)
+        Args:
+            call_dates: Sorted future call dates
+            call_times: Year fractions from the evaluation date to each call date
 
-            return temp_bond.cleanPrice()
-        finally:
-            # Restore original evaluation date
-            Settings.instance().evaluationDate = self.evaluation_date
+        Returns:
+            Dictionary mapping call dates to (cashflow amounts per 100 face, B, L) arrays
+        """
+        bond = self.build_quantlib_bond()
+        curve = self._discount_curve.currentLink()
+        a = self.model_params["mean_reversion"]
+        sigma = self.model_params["volatility"]
+
+        cashflows = [
+            (cf.date(), self.day_count_convention.yearFraction(self.evaluation_date, cf.date()), cf.amount())
+            for cf in bond.cashflows()
+            if cf.date() > self.evaluation_date
+        ]
+
+        terms = {}
+        for call_date, t in zip(call_dates, call_times):
+            remaining = [(cf_time, amount) for cf_date, cf_time, amount in cashflows if cf_date > call_date]
+            cf_times = np.array([cf_time for cf_time, _ in remaining])
+            cf_amounts = np.array([amount for _, amount in remaining]) * (100.0 / self.face_value)
+            cf_discounts = np.array([curve.discount(cf_time) for cf_time in cf_times])
+
+            forward = curve.forwardRate(t, t, Continuous, NoFrequency).rate()
+            alpha = forward + sigma ** 2 / (2.0 * a ** 2) * (1.0 - math.exp(-a * t)) ** 2
+            gamma = (1.0 - np.exp(-a * (cf_times - t))) / a
+            ln_a = (np.log(cf_discounts / curve.discount(t))
+                    + gamma * forward
+                    - sigma ** 2 / (4.0 * a) * (1.0 - math.exp(-2.0 * a * t)) * gamma ** 2)
+            terms[call_date] = (cf_amounts, gamma, alpha * gamma - ln_a)
+
+        return terms
 
     def summary(self) -> Dict[str, float]:
         """Returns a dictionary of all key bond analytics with safe evaluation"""
@@ -705,8 +652,8 @@ class PutableBondAnalytics(BondAnalyticsBase):
             'clean_price': self.clean_price,
             'dirty_price': self.dirty_price,
             'accrued_interest': self.accrued_interest,
-            'yield_to_maturity': self.yield_to_maturity,
-            'yield_to_put': self.yield_to_put,
+            'yield_to_maturity': self._cached_ytm,
+            'yield_to_put': self._cached_ytp,
             'yield_to_worst': self.yield_to_worst,
             'modified_duration': self.modified_duration,
             'macaulay_duration': self.macaulay_duration,
@@ -737,6 +684,9 @@ class PutableBondAnalytics(BondAnalyticsBase):
 
     def invalidate_cache(self):
         self._summary_cache = None
+        self._ytm_cache = None
+        self._ytp_cache = None
+        self._normalized_price_cache = None
 
     # Then, in methods that update key state, call invalidate_cache
     def update_yield_curve(self, rate: float) -> None:
@@ -757,4 +707,5 @@ class PutableBondAnalytics(BondAnalyticsBase):
         self._bond = None
         self._discount_curve = None
         self._rate_quote = None
+        self._put_schedule_cached = None
         self.invalidate_cache()
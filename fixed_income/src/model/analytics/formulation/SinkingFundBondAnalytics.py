@@ -4,14 +4,15 @@ from collections import defaultdict
 from datetime import date, datetime
 from typing import DefaultDict, Dict, List, Optional, Tuple
 
-from QuantLib import (AmortizingFixedRateBond, BondFunctions, Date, DateGeneration, Days,
-                      DiscountingBondEngine, Duration, FlatForward, Months, Period, QuoteHandle, Schedule,
+import numpy as np
+from QuantLib import (AmortizingFixedRateBond, BondFunctions, Date, Days,
+                      DiscountingBondEngine, Duration, FlatForward, QuoteHandle,
                       Settings,
                       Simple, SimpleQuote, YieldTermStructureHandle)
 
 from fixed_income.src.model.analytics.formulation import BondAnalyticsBase
 from fixed_income.src.model.bonds import SinkingFundBondModel
-from fixed_income.src.utils.helpers import replace_nan_with_none
+from fixed_income.src.utils.helpers import replace_nan_with_none, safe_analytic
 from fixed_income.src.utils.quantlib_mapper import from_ql_date, to_ql_date, to_ql_frequency
 
 
@@ -23,6 +24,7 @@ class SinkingFundBondAnalytics(BondAnalyticsBase):
             raise ValueError("Must provide a SinkingFundBondModel instance")
 
         self._summary_cache = None
+        self._normalized_price_cache = None
 
         self._bond: Optional[AmortizingFixedRateBond] = None
         self._discount_curve: Optional[YieldTermStructureHandle] = None
@@ -102,13 +104,17 @@ class SinkingFundBondAnalytics(BondAnalyticsBase):
 
     def _get_normalized_market_price(self) -> float:
         """Returns market price normalized to 100 face value."""
+        if self._normalized_price_cache is not None:
+            return self._normalized_price_cache
+
         market_price = getattr(self, 'market_price', None)
         if market_price is None:
             logging.warning("Market price not set, using clean price as fallback.")
             market_price = self.clean_price()
         if self.face_value == 0:
             raise ZeroDivisionError("Face value cannot be zero when normalizing price.")
-        return (market_price / self.face_value) * 100
+        self._normalized_price_cache = (market_price / self.face_value) * 100
+        return self._normalized_price_cache
 
     # Yield curves must be anchored to the EVALUATION DATE
     def _build_yield_curve(self, initial_rate: float = 0.05) -> Tuple[YieldTermStructureHandle, SimpleQuote]:
@@ -124,18 +130,6 @@ class SinkingFundBondAnalytics(BondAnalyticsBase):
         curve.enableExtrapolation()  # Allow extrapolation beyond curve dates
         return YieldTermStructureHandle(curve), flat_rate
 
-    def _build_coupon_schedule(self):
-        return Schedule(
-            self.issue_date,
-            self.maturity_date,
-            Period(int(12 / self.coupon_frequency), Months),
-            self.calendar,
-            self.business_day_convention,
-            self.business_day_convention,
-            DateGeneration.Backward,
-            False
-        )
-
     def _build_notionals_schedule(self) -> DefaultDict[Date, float]:
         if self.sinking_schedule is None:
             raise ValueError("Sinking fund schedule is missing.")
@@ -250,19 +244,24 @@ class SinkingFundBondAnalytics(BondAnalyticsBase):
         try:
             bond = self.build_quantlib_bond()
 
-            cashflows_by_date = defaultdict(float)
+            # QuantLib yields cashflows in date order, so same-date entries are adjacent
+            result = []
 
             for cf in bond.cashflows():
-                if not cf.hasOccurred():
-                    cf_date = from_ql_date(cf.date())
-                    cf_amount = cf.amount()
-                    if not isinstance(cf_amount, (float, int)):
-                        raise ValueError(f"Invalid cashflow amount {cf_amount} for date {cf_date}")
-                    # optionally skip past cashflows
-                    cashflows_by_date[from_ql_date(cf.date())] += cf.amount()
-
-            # Return as sorted list of (Date, Amount) tuples
-            return sorted(cashflows_by_date.items(), key=lambda x: x[0])
+                if cf.hasOccurred():
+                    continue
+
+                cf_date = from_ql_date(cf.date())
+                cf_amount = cf.amount()
+                if not isinstance(cf_amount, (float, int)):
+                    raise ValueError(f"Invalid cashflow amount {cf_amount} for date {cf_date}")
+
+                if result and result[-1][0] == cf_date:
+                    result[-1] = (cf_date, result[-1][1] + cf_amount)
+                else:
+                    result.append((cf_date, cf_amount))
+
+            return result
         except Exception as e:
             logging.error(f"Failed to get cashflows: {str(e)}")
             return []
@@ -283,145 +282,118 @@ class SinkingFundBondAnalytics(BondAnalyticsBase):
     #
     #     return sorted(cashflows, key=lambda x: x[0])
 
+    @safe_analytic("Clean price")
     def clean_price(self) -> float:
         """Returns clean price normalized to face value of 1000"""
-        try:
-            ql_price = self.build_quantlib_bond().cleanPrice()  # QL returns price per 100
-            return ql_price * (self.face_value / 100.0)
-        except Exception as e:
-            logging.error(f"Clean price calculation failed: {str(e)}")
-            return float('nan')
+        ql_price = self.build_quantlib_bond().cleanPrice()  # QL returns price per 100
+        return ql_price * (self.face_value / 100.0)
 
+    @safe_analytic("Dirty price")
     def dirty_price(self) -> float:
         """Returns dirty price normalized to face value of 1000"""
-        try:
-            ql_price = self.build_quantlib_bond().dirtyPrice()  # QL returns price per 100
-            return ql_price * (self.face_value / 100.0)
-        except Exception as e:
-            logging.error(f"Dirty price calculation failed: {str(e)}")
-            return float('nan')
+        ql_price = self.build_quantlib_bond().dirtyPrice()  # QL returns price per 100
+        return ql_price * (self.face_value / 100.0)
 
+    @safe_analytic("Accrued interest")
     def accrued_interest(self) -> float:
         """Returns accrued interest normalized to face value of 1000"""
-        try:
-            ql_accrued = self.build_quantlib_bond().accruedAmount()  # QL returns per 100
-            return ql_accrued * (self.face_value / 100.0)
-        except Exception as e:
-            logging.error(f"Accrued interest calculation failed: {str(e)}")
-            return float('nan')
+        ql_accrued = self.build_quantlib_bond().accruedAmount()  # QL returns per 100
+        return ql_accrued * (self.face_value / 100.0)
 
+    @safe_analytic("YTM")
     def yield_to_maturity(self) -> float:
-        try:
-            normalized_price = self._get_normalized_market_price()
-            return self.build_quantlib_bond().bondYield(
-                normalized_price,
-                self.day_count_convention,
-                self.compounding,
-                self.frequency,
-                self.settlement_date
-            )
-        except Exception as e:
-            logging.error(f"YTM calculation failed: {str(e)}")
-            return float('nan')
+        normalized_price = self._get_normalized_market_price()
+        return self.build_quantlib_bond().bondYield(
+            normalized_price,
+            self.day_count_convention,
+            self.compounding,
+            self.frequency,
+            self.settlement_date
+        )
 
     def yield_to_worst(self) -> float:
         """
         Returns Yield to Worst (YTW).
         For non-callable zero-coupon bonds, YTW = YTM.
         """
-        return self.yield_to_maturity()
+        return self._cached_ytm()
 
+    @safe_analytic("Modified duration")
     def modified_duration(self) -> float:
-        try:
-            ytm = self.yield_to_maturity()
-            if math.isnan(ytm):
-                return float('nan')
-            return BondFunctions.duration(
-                self.build_quantlib_bond(),
-                ytm,
-                self.day_count_convention,
-                self.compounding,
-                self.frequency,
-                Duration.Modified,
-                self.settlement_date
-            )
-        except Exception as e:
-            logging.error(f"Modified duration calculation failed: {str(e)}")
+        ytm = self._cached_ytm()
+        if math.isnan(ytm):
             return float('nan')
+        return BondFunctions.duration(
+            self.build_quantlib_bond(),
+            ytm,
+            self.day_count_convention,
+            self.compounding,
+            self.frequency,
+            Duration.Modified,
+            self.settlement_date
+        )
 
+    @safe_analytic("Macaulay duration")
     def macaulay_duration(self) -> float:
-        try:
-            ytm = self.yield_to_maturity()
-            if math.isnan(ytm):
-                return float('nan')
-            return BondFunctions.duration(
-                self.build_quantlib_bond(),
-                ytm,
-                self.day_count_convention,
-                self.compounding,
-                self.frequency,
-                Duration.Macaulay,
-                self.settlement_date
-            )
-        except Exception as e:
-            logging.error(f"Macaulay duration calculation failed: {str(e)}")
+        ytm = self._cached_ytm()
+        if math.isnan(ytm):
             return float('nan')
+        return BondFunctions.duration(
+            self.build_quantlib_bond(),
+            ytm,
+            self.day_count_convention,
+            self.compounding,
+            self.frequency,
+            Duration.Macaulay,
+            self.settlement_date
+        )
 
+    @safe_analytic("Simple duration")
     def simple_duration(self) -> float:
-        try:
-            ytm = self.yield_to_maturity()
-            if math.isnan(ytm):
-                return float('nan')
-            return BondFunctions.duration(
-                self.build_quantlib_bond(),
-                ytm,
-                self.day_count_convention,
-                Simple,
-                self.frequency,
-                Duration.Simple,
-                self.settlement_date
-            )
-        except Exception as e:
-            logging.error(f"Simple duration calculation failed: {str(e)}")
+        ytm = self._cached_ytm()
+        if math.isnan(ytm):
             return float('nan')
+        return BondFunctions.duration(
+            self.build_quantlib_bond(),
+            ytm,
+            self.day_count_convention,
+            Simple,
+            self.frequency,
+            Duration.Simple,
+            self.settlement_date
+        )
 
+    @safe_analytic("Convexity")
     def convexity(self) -> float:
-        try:
-            ytm = self.yield_to_maturity()
-            if math.isnan(ytm):
-                return float('nan')
-            return BondFunctions.convexity(
-                self.build_quantlib_bond(),
-                ytm,
-                self.day_count_convention,
-                self.compounding,
-                self.frequency,
-                self.settlement_date
-            )
-        except Exception as e:
-            logging.error(f"Convexity calculation failed: {str(e)}")
+        ytm = self._cached_ytm()
+        if math.isnan(ytm):
             return float('nan')
+        return BondFunctions.convexity(
+            self.build_quantlib_bond(),
+            ytm,
+            self.day_count_convention,
+            self.compounding,
+            self.frequency,
+            self.settlement_date
+        )
 
+    @safe_analytic("DV01")
     def dv01(self, bump_size: float = 0.0001) -> float:
-        try:
-            ytm = self.yield_to_maturity()
-            if math.isnan(ytm):
-                return float('nan')
+        ytm = self._cached_ytm()
+        if math.isnan(ytm):
+            return float('nan')
 
-            bond = self.build_quantlib_bond()
-            price_up = BondFunctions.cleanPrice(
-                bond, ytm + bump_size, self.day_count_convention, self.compounding,
-                self.frequency, self.settlement_date
-            )
-            price_down = BondFunctions.cleanPrice(
-                bond, ytm - bump_size, self.day_count_convention, self.compounding,
-                self.frequency, self.settlement_date
-            )
+        bond = self.build_quantlib_bond()
+        price_up = BondFunctions.cleanPrice(
+            bond, ytm + bump_size, self.day_count_convention, self.compounding,
+            self.frequency, self.settlement_date
+        )
+        price_down = BondFunctions.cleanPrice(
+            bond, ytm - bump_size, self.day_count_convention, self.compounding,
+            self.frequency, self.settlement_date
+        )
 
-            return (price_down - price_up) / (2 * bump_size)
-        except Exception as e:
-            logging.error(f"DV01 calculation failed: {str(e)}")
-            return float('nan')
+        return (price_down - price_up) / (2 * bump_size)
 
     def get_discount_curve(self, start=None, end=None, points=20) -> Dict[str, float]:
         try:
@@ -443,29 +415,18 @@ class SinkingFundBondAnalytics(BondAnalyticsBase):
             # Calculate the total period in years according to day count convention
             total_years = day_counter.yearFraction(ql_start, ql_end)
 
-            # Calculate step size in years
-            step_years = total_years / (points - 1)
-
-            result = {}
-            current = ql_start
-
-            for i in range(points):
-                if i == points - 1:  # Ensure we always include the end date
-                    current = ql_end
+            # Evenly spaced grid in year fractions; each date is adjusted once rather than chained
+            # through calendar.advance, and the end date is always included
+            sample_dates = [
+                min(calendar.adjust(ql_start + int(round(t * 365)), self.business_day_convention), ql_end)
+                for t in np.linspace(0.0, total_years, points)[:-1]
+            ]
+            sample_dates.append(ql_end)
 
-                rate = curve.zeroRate(current, day_counter, compounding, frequency).rate()
-                result[from_ql_date(current)] = rate
-
-                # Advance using calendar and business day convention
-                if i < points - 2:  # Don't advance after the second-to-last point
-                    current = calendar.advance(
-                        current,
-                        Period(int(round(step_years * 365)), Days),
-                        self.business_day_convention
-                    )
-                    current = min(current, ql_end)  # Don't go past end date
-
-            return result
+            return {
+                from_ql_date(current): curve.zeroRate(current, day_counter, compounding, frequency).rate()
+                for current in sample_dates
+            }
 
         except Exception as e:
             logging.error(f"Discount curve generation failed: {str(e)}", exc_info=True)
@@ -479,7 +440,7 @@ class SinkingFundBondAnalytics(BondAnalyticsBase):
             'clean_price': self.clean_price,
             'dirty_price': self.dirty_price,
             'accrued_interest': self.accrued_interest,
-            'yield_to_maturity': self.yield_to_maturity,
+            'yield_to_maturity': self._cached_ytm,
             'yield_to_worst': self.yield_to_worst,
             'modified_duration': self.modified_duration,
             'macaulay_duration': self.macaulay_duration,
@@ -510,6 +471,8 @@ class SinkingFundBondAnalytics(BondAnalyticsBase):
 
     def invalidate_cache(self):
         self._summary_cache = None
+        self._ytm_cache = None
+        self._normalized_price_cache = None
 
     # Then, in methods that update key state, call invalidate_cache
     def update_yield_curve(self, rate: float) -> None:
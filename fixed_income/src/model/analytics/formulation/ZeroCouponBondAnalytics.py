@@ -1,15 +1,17 @@
 import logging
 import math
-from collections import defaultdict
 from datetime import date
 from typing import Dict, List, Optional, Tuple
 
+import numpy as np
 from QuantLib import (BondFunctions, Days, DiscountingBondEngine, Duration, FlatForward,
-                      Period, QuoteHandle, Settings, Simple, SimpleQuote, YieldTermStructureHandle, ZeroCouponBond)
+                      QuoteHandle, Settings, Simple, SimpleQuote, YieldTermStructureHandle, ZeroCouponBond)
 
+from fixed_income.src.model.analytics._kernels import COMPOUNDED, CONTINUOUS, SIMPLE, _zcb_convexity, _zcb_discount, \
+    _zcb_modified_duration, _zcb_yield
 from fixed_income.src.model.analytics.formulation import BondAnalyticsBase
 from fixed_income.src.model.bonds import ZeroCouponBondModel
-from fixed_income.src.utils.helpers import replace_nan_with_none
+from fixed_income.src.utils.helpers import replace_nan_with_none, safe_analytic
 from fixed_income.src.utils.quantlib_mapper import from_ql_date, to_ql_date
 
 
@@ -21,11 +23,14 @@ class ZeroCouponBondAnalytics(BondAnalyticsBase):
             raise ValueError("Must provide a ZeroCouponBondModel instance")
 
         self._summary_cache = None
+        self._normalized_price_cache = None
 
         self._bond: Optional[ZeroCouponBond] = None
         self._discount_curve: Optional[YieldTermStructureHandle] = None
         self._rate_quote: Optional[SimpleQuote] = None
 
+        self.accrues_interest_flag = bond.accrues_interest_flag
+
         # Adjust dates to business days
         self._adjust_dates()
 
@@ -73,13 +78,17 @@ class ZeroCouponBondAnalytics(BondAnalyticsBase):
 
     def _get_normalized_market_price(self) -> float:
         """Returns market price normalized to 100 face value."""
+        if self._normalized_price_cache is not None:
+            return self._normalized_price_cache
+
         market_price = getattr(self, 'market_price', None)
         if market_price is None:
             logging.warning("Market price not set, using clean price as fallback.")
             market_price = self.clean_price()
         if self.face_value == 0:
             raise ZeroDivisionError("Face value cannot be zero when normalizing price.")
-        return (market_price / self.face_value) * 100
+        self._normalized_price_cache = (market_price / self.face_value) * 100
+        return self._normalized_price_cache
 
     # Yield curves must be anchored to the EVALUATION DATE
     def _build_yield_curve(self, initial_rate: float = 0.05) -> Tuple[YieldTermStructureHandle, SimpleQuote]:
@@ -115,164 +124,192 @@ class ZeroCouponBondAnalytics(BondAnalyticsBase):
 
         return self._bond
 
+    def _closed_form_horizon(self) -> Optional[float]:
+        """
+        Years from settlement to redemption when the yield analytics have a closed form, otherwise None.
+
+        The bond is a single redemption, so under simple, continuous or periodic compounding its yield,
+        durations, convexity and DV01 follow directly from that horizon without a QuantLib engine.
+        """
+        if self.compounding not in (SIMPLE, CONTINUOUS) and not (
+                self.compounding == COMPOUNDED and 0 < self.frequency <= 365):
+            return None
+        t = self.day_count_convention.yearFraction(self.settlement_date, self.maturity_date)
+        return t if t > 0 else None
+
     def cashflows(self) -> List[Tuple[date, float]]:
         try:
             bond = self.build_quantlib_bond()
 
-            cashflows_by_date = defaultdict(float)
+            # QuantLib yields cashflows in date order, so same-date entries are adjacent
+            result = []
 
             for cf in bond.cashflows():
-                if not cf.hasOccurred():
-                    cf_date = from_ql_date(cf.date())
-                    cf_amount = cf.amount()
-                    if not isinstance(cf_amount, (float, int)):
-                        raise ValueError(f"Invalid cashflow amount {cf_amount} for date {cf_date}")
+                if cf.hasOccurred():
+                    continue
+
+                cf_date = from_ql_date(cf.date())
+                cf_amount = cf.amount()
+                if not isinstance(cf_amount, (float, int)):
+                    raise ValueError(f"Invalid cashflow amount {cf_amount} for date {cf_date}")
 
-                    if cf_amount == 0:
-                        continue
+                if cf_amount == 0:
+                    continue
 
-                    cashflows_by_date[from_ql_date(cf.date())] += cf_amount
+                if result and result[-1][0] == cf_date:
+                    result[-1] = (cf_date, result[-1][1] + cf_amount)
+                else:
+                    result.append((cf_date, cf_amount))
 
-            return sorted(cashflows_by_date.items(), key=lambda x: x[0])
+            return result
         except Exception as e:
             logging.error(f"Failed to get cashflows: {str(e)}")
             return []
 
+    @safe_analytic("Clean price")
     def clean_price(self) -> float:
         """Returns clean price normalized to face value of 1000"""
-        try:
-            ql_price = self.build_quantlib_bond().cleanPrice()  # QL returns price per 100
-            return ql_price * (self.face_value / 100.0)
-        except Exception as e:
-            logging.error(f"Clean price calculation failed: {str(e)}")
-            return float('nan')
+        if self.settlement_date < self.maturity_date:
+            # No accrual on a zero, so the price is the redemption discounted from maturity back to settlement
+            if self._discount_curve is None:
+                self.build_quantlib_bond()
+            curve = self._discount_curve.currentLink()
+            return self.face_value * curve.discount(self.maturity_date) / curve.discount(self.settlement_date)
 
+        ql_price = self.build_quantlib_bond().cleanPrice()  # QL returns price per 100
+        return ql_price * (self.face_value / 100.0)
+
+    @safe_analytic("Dirty price")
     def dirty_price(self) -> float:
         """Returns dirty price normalized to face value of 1000"""
-        try:
-            ql_price = self.build_quantlib_bond().dirtyPrice()  # QL returns price per 100
-            return ql_price * (self.face_value / 100.0)
-        except Exception as e:
-            logging.error(f"Dirty price calculation failed: {str(e)}")
-            return float('nan')
+        if not self.accrues_interest_flag:
+            return self.clean_price()  # Nothing accrues, so dirty and clean coincide
 
+        ql_price = self.build_quantlib_bond().dirtyPrice()  # QL returns price per 100
+        return ql_price * (self.face_value / 100.0)
+
+    @safe_analytic("Accrued interest")
     def accrued_interest(self) -> float:
         """Returns accrued interest normalized to face value of 1000"""
-        try:
-            ql_accrued = self.build_quantlib_bond().accruedAmount()  # QL returns per 100
-            return ql_accrued * (self.face_value / 100.0)
-        except Exception as e:
-            logging.error(f"Accrued interest calculation failed: {str(e)}")
-            return float('nan')
+        if not self.accrues_interest_flag:
+            return 0.0
+
+        ql_accrued = self.build_quantlib_bond().accruedAmount()  # QL returns per 100
+        return ql_accrued * (self.face_value / 100.0)
 
+    @safe_analytic("YTM")
     def yield_to_maturity(self) -> float:
-        try:
-            normalized_price = self._get_normalized_market_price()
-            return self.build_quantlib_bond().bondYield(
-                normalized_price,
-                self.day_count_convention,
-                self.compounding,
-                self.frequency,
-                self.settlement_date
-            )
-        except Exception as e:
-            logging.error(f"YTM calculation failed: {str(e)}")
-            return float('nan')
+        normalized_price = self._get_normalized_market_price()
+        t = self._closed_form_horizon()
+        if t is not None:
+            return _zcb_yield(normalized_price, t, self.compounding, self.frequency)
+
+        return self.build_quantlib_bond().bondYield(
+            normalized_price,
+            self.day_count_convention,
+            self.compounding,
+            self.frequency,
+            self.settlement_date
+        )
 
     def yield_to_worst(self) -> float:
-        return self.yield_to_maturity()
+        return self._cached_ytm()
 
+    @safe_analytic("Modified duration")
     def modified_duration(self) -> float:
-        try:
-            ytm = self.yield_to_maturity()
-            if math.isnan(ytm):
-                return float('nan')
-            return BondFunctions.duration(
-                self.build_quantlib_bond(),
-                ytm,
-                self.day_count_convention,
-                self.compounding,
-                self.frequency,
-                Duration.Modified,
-                self.settlement_date
-            )
-        except Exception as e:
-            logging.error(f"Modified duration calculation failed: {str(e)}")
+        ytm = self._cached_ytm()
+        if math.isnan(ytm):
             return float('nan')
+        t = self._closed_form_horizon()
+        if t is not None:
+            return _zcb_modified_duration(ytm, t, self.compounding, self.frequency)
+        return BondFunctions.duration(
+            self.build_quantlib_bond(),
+            ytm,
+            self.day_count_convention,
+            self.compounding,
+            self.frequency,
+            Duration.Modified,
+            self.settlement_date
+        )
 
+    @safe_analytic("Macaulay duration")
     def macaulay_duration(self) -> float:
-        try:
-            ytm = self.yield_to_maturity()
-            if math.isnan(ytm):
-                return float('nan')
-            return BondFunctions.duration(
-                self.build_quantlib_bond(),
-                ytm,
-                self.day_count_convention,
-                self.compounding,
-                self.frequency,
-                Duration.Macaulay,
-                self.settlement_date
-            )
-        except Exception as e:
-            logging.error(f"Macaulay duration calculation failed: {str(e)}")
+        ytm = self._cached_ytm()
+        if math.isnan(ytm):
             return float('nan')
+        t = self._closed_form_horizon()
+        if t is not None and self.compounding == COMPOUNDED:
+            # The time to the only cashflow; QuantLib rejects other compounding here, so they fall through
+            return t
+        return BondFunctions.duration(
+            self.build_quantlib_bond(),
+            ytm,
+            self.day_count_convention,
+            self.compounding,
+            self.frequency,
+            Duration.Macaulay,
+            self.settlement_date
+        )
 
+    @safe_analytic("Simple duration")
     def simple_duration(self) -> float:
-        try:
-            ytm = self.yield_to_maturity()
-            if math.isnan(ytm):
-                return float('nan')
-            return BondFunctions.duration(
-                self.build_quantlib_bond(),
-                ytm,
-                self.day_count_convention,
-                Simple,
-                self.frequency,
-                Duration.Simple,
-                self.settlement_date
-            )
-        except Exception as e:
-            logging.error(f"Simple duration calculation failed: {str(e)}")
+        ytm = self._cached_ytm()
+        if math.isnan(ytm):
             return float('nan')
+        t = self._closed_form_horizon()
+        if t is not None:
+            return t
+        return BondFunctions.duration(
+            self.build_quantlib_bond(),
+            ytm,
+            self.day_count_convention,
+            Simple,
+            self.frequency,
+            Duration.Simple,
+            self.settlement_date
+        )
 
+    @safe_analytic("Convexity")
     def convexity(self) -> float:
-        try:
-            ytm = self.yield_to_maturity()
-            if math.isnan(ytm):
-                return float('nan')
-            return BondFunctions.convexity(
-                self.build_quantlib_bond(),
-                ytm,
-                self.day_count_convention,
-                self.compounding,
-                self.frequency,
-                self.settlement_date
-            )
-        except Exception as e:
-            logging.error(f"Convexity calculation failed: {str(e)}")
+        ytm = self._cached_ytm()
+        if math.isnan(ytm):
             return float('nan')
+        t = self._closed_form_horizon()
+        if t is not None:
+            return _zcb_convexity(ytm, t, self.compounding, self.frequency)
+        return BondFunctions.convexity(
+            self.build_quantlib_bond(),
+            ytm,
+            self.day_count_convention,
+            self.compounding,
+            self.frequency,
+            self.settlement_date
+        )
 
+    @safe_analytic("DV01")
     def dv01(self, bump_size: float = 0.0001) -> float:
-        try:
-            ytm = self.yield_to_maturity()
-            if math.isnan(ytm):
-                return float('nan')
-
-            bond = self.build_quantlib_bond()
-            price_up = BondFunctions.cleanPrice(
-                bond, ytm + bump_size, self.day_count_convention, self.compounding,
-                self.frequency, self.settlement_date
-            )
-            price_down = BondFunctions.cleanPrice(
-                bond, ytm - bump_size, self.day_count_convention, self.compounding,
-                self.frequency, self.settlement_date
-            )
+        ytm = self._cached_ytm()
+        if math.isnan(ytm):
+            return float('nan')
 
+        t = self._closed_form_horizon()
+        if t is not None:
+            price_up = 100.0 * _zcb_discount(ytm + bump_size, t, self.compounding, self.frequency)
+            price_down = 100.0 * _zcb_discount(ytm - bump_size, t, self.compounding, self.frequency)
             return (price_down - price_up) / (2 * bump_size)
-        except Exception as e:
-            logging.error(f"DV01 calculation failed: {str(e)}")
-            return float('nan')
+
+        bond = self.build_quantlib_bond()
+        price_up = BondFunctions.cleanPrice(
+            bond, ytm + bump_size, self.day_count_convention, self.compounding,
+            self.frequency, self.settlement_date
+        )
+        price_down = BondFunctions.cleanPrice(
+            bond, ytm - bump_size, self.day_count_convention, self.compounding,
+            self.frequency, self.settlement_date
+        )
+
+        return (price_down - price_up) / (2 * bump_size)
 
     def get_discount_curve(self, start=None, end=None, points=20) -> Dict[str, float]:
         try:
@@ -294,29 +331,18 @@ class ZeroCouponBondAnalytics(BondAnalyticsBase):
             # Calculate the total period in years according to day count convention
             total_years = day_counter.yearFraction(ql_start, ql_end)
 
-            # Calculate step size in years
-            step_years = total_years / (points - 1)
-
-            result = {}
-            current = ql_start
+            # Evenly spaced grid in year fractions; each date is adjusted once rather than chained
+            # through calendar.advance, and the end date is always included
+            sample_dates = [
+                min(calendar.adjust(ql_start + int(round(t * 365)), self.business_day_convention), ql_end)
+                for t in np.linspace(0.0, total_years, points)[:-1]
+            ]
+            sample_dates.append(ql_end)
 
-            for i in range(points):
-                if i == points - 1:  # Ensure we always include the end date
-                    current = ql_end
-
-                rate = curve.zeroRate(current, day_counter, compounding, frequency).rate()
-                result[from_ql_date(current)] = rate
-
-                # Advance using calendar and business day convention
-                if i < points - 2:  # Don't advance after the second-to-last point
-                    current = calendar.advance(
-                        current,
-                        Period(int(round(step_years * 365)), Days),
-                        self.business_day_convention
-                    )
-                    current = min(current, ql_end)  # Don't go past end date
-
-            return result
+            return {
+                from_ql_date(current): curve.zeroRate(current, day_counter, compounding, frequency).rate()
+                for current in sample_dates
+            }
 
         except Exception as e:
             logging.error(f"Discount curve generation failed: {str(e)}", exc_info=True)
@@ -330,7 +356,7 @@ class ZeroCouponBondAnalytics(BondAnalyticsBase):
             'clean_price': self.clean_price,
             'dirty_price': self.dirty_price,
             'accrued_interest': self.accrued_interest,
-            'yield_to_maturity': self.yield_to_maturity,
+            'yield_to_maturity': self._cached_ytm,
             'yield_to_worst': self.yield_to_worst,
             'modified_duration': self.modified_duration,
             'macaulay_duration': self.macaulay_duration,
@@ -361,6 +387,8 @@ class ZeroCouponBondAnalytics(BondAnalyticsBase):
 
     def invalidate_cache(self):
         self._summary_cache = None
+        self._ytm_cache = None
+        self._normalized_price_cache = None
 
     # Then, in methods that update key state, call invalidate_cache
     def update_yield_curve(self, rate: float) -> None:
@@ -1,3 +1,5 @@
+# Loading the kernels prewarms them, so JIT compilation (or the on-disk cache load) happens once at import
+from .. import _kernels  # noqa: F401
 from .BondAnalyticsBase import BondAnalyticsBase
 from .CallableBondAnalytics import CallableBondAnalytics
 from .FixedRateBondAnalytics import FixedRateBondAnalytics
@@ -0,0 +1,86 @@
+import math
+import unittest
+from datetime import date
+
+from fixed_income.src.model.analytics.BondAnalyticsFactory import bond_analytics_factory
+from fixed_income.src.model.analytics.BondBatchAnalytics import fixed_rate_batch_analytics
+from fixed_income.src.model.bonds import FixedRateBondModel
+from fixed_income.src.model.enums import BondTypeEnum, BusinessDayConventionEnum, CalendarEnum, CompoundingEnum, \
+    DayCountConventionEnum, FrequencyEnum
+from fixed_income.src.model.enums.CurrencyEnum import CurrencyEnum
+
+
+class BondBatchAnalyticsTest(unittest.TestCase):
+    """Batch fixed-rate analytics checked against the schedule-exact FixedRateBondAnalytics"""
+
+    @classmethod
+    def setUpClass(cls):
+        """Common test data for all tests"""
+        cls.standard_params = {
+            "symbol": "BATCH_BOND",
+            "bond_type": BondTypeEnum.FIXED_COUPON,
+            "currency": CurrencyEnum.USD,
+            "issue_date": date(2023, 1, 1),
+            "maturity_date": date(2028, 1, 1),  # 5-year bond
+            "evaluation_date": date(2023, 6, 1),
+            "face_value": 1000.0,
+            "market_price": 1050.0,
+            "day_count_convention": DayCountConventionEnum.THIRTY_360_US,
+            "settlement_days": 2,
+            "calendar": CalendarEnum.TARGET,
+            "business_day_convention": BusinessDayConventionEnum.FOLLOWING,
+            "compounding": CompoundingEnum.COMPOUNDED,
+            "frequency": FrequencyEnum.ANNUAL,
+            "coupon_rate": 0.05,  # 5%
+            "coupon_frequency": FrequencyEnum.SEMIANNUAL,
+            "redemption_value": 100.0
+        }
+
+    def _create_bond_variant(self, **overrides):
+        """Helper to create bond variants with overridden parameters"""
+        params = {**self.standard_params, **overrides}
+        return FixedRateBondModel(**params)
+
+    def test_matches_single_bond_analytics(self):
+        bonds = [
+            self._create_bond_variant(market_price=market_price, coupon_frequency=coupon_frequency)
+            for market_price in (900.0, 1000.0, 1050.0, 1200.0)
+            for coupon_frequency in (FrequencyEnum.ANNUAL, FrequencyEnum.SEMIANNUAL, FrequencyEnum.QUARTERLY)
+        ]
+        batch = fixed_rate_batch_analytics(bonds)
+
+        for i, bond in enumerate(bonds):
+            analytics = bond_analytics_factory(bond)
+            with self.subTest(market_price=bond.market_price, coupon_frequency=bond.coupon_frequency):
+                # Coupons sit on a regular grid back from maturity, so the batch only approximates the schedule
+                self.assertAlmostEqual(batch["yield_to_maturity"][i], analytics.yield_to_maturity(), delta=5e-4)
+                self.assertAlmostEqual(batch["modified_duration"][i], analytics.modified_duration(), delta=0.05)
+                # Repricing at the solved yield recovers the quoted price exactly
+                self.assertAlmostEqual(batch["clean_price"][i], bond.market_price, places=6)
+
+    def test_deep_premium_yield_stays_real(self):
+        # Newton's first step from the coupon overshoots below -100% per period here
+        bond = self._create_bond_variant(market_price=100_000.0)
+        batch = fixed_rate_batch_analytics([bond])
+
+        self.assertTrue(math.isfinite(batch["yield_to_maturity"][0]))
+        self.assertAlmostEqual(batch["clean_price"][0], bond.market_price, delta=1e-6 * bond.market_price)
+
+    def test_unsupported_bonds_are_nan(self):
+        bonds = {
+            "no market price": self._create_bond_variant(market_price=None),
+            "continuous yield": self._create_bond_variant(compounding=CompoundingEnum.CONTINUOUS),
+        }
+        for coupon_frequency in (FrequencyEnum.NO_FREQUENCY, FrequencyEnum.ONCE, FrequencyEnum.OTHER_FREQUENCY):
+            bonds[f"{coupon_frequency.value} coupons"] = self._create_bond_variant(coupon_frequency=coupon_frequency)
+
+        batch = fixed_rate_batch_analytics(list(bonds.values()))
+
+        for i, case in enumerate(bonds):
+            with self.subTest(case=case):
+                for metric, values in batch.items():
+                    self.assertTrue(math.isnan(values[i]), metric)
+
+
+if __name__ == '__main__':
+    unittest.main()
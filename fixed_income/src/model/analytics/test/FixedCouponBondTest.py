@@ -2,6 +2,8 @@ import math
 import unittest
 from datetime import date, timedelta
 
+from QuantLib import Settings
+
 from fixed_income.src.model.analytics.BondAnalyticsFactory import bond_analytics_factory
 from fixed_income.src.model.bonds import BondBase, FixedRateBondModel
 from fixed_income.src.model.enums import BondTypeEnum, BusinessDayConventionEnum, CalendarEnum, CompoundingEnum, \
@@ -35,10 +37,13 @@ class TestFixedCouponBondAnalytics(unittest.TestCase):
             "redemption_value": 100.0
         }
 
+        # Shared, read-only fixture; tests that need a different or mutated bond build a variant
+        cls.bond = FixedRateBondModel(**cls.standard_params)
+        cls.analytics = bond_analytics_factory(cls.bond)
+
     def setUp(self):
-        """Create fresh bond for each test"""
-        self.bond = FixedRateBondModel(**self.standard_params)
-        self.analytics = bond_analytics_factory(self.bond)
+        # QuantLib's evaluation date is global and other tests move it; pin it back to the shared fixture's date
+        Settings.instance().evaluationDate = self.analytics.evaluation_date
 
     def _create_bond_variant(self, **overrides):
         """Helper to create bond variants with overridden parameters"""
@@ -86,6 +91,20 @@ class TestFixedCouponBondAnalytics(unittest.TestCase):
         discount_ytm = bond_analytics_factory(discount_bond).yield_to_maturity()
         self.assertGreater(discount_ytm, ytm)
 
+    def test_yield_matches_quantlib_for_each_compounding(self):
+        for compounding in CompoundingEnum:
+            with self.subTest(compounding=compounding):
+                analytics = bond_analytics_factory(self._create_bond_variant(compounding=compounding))
+                normalized_price = self.standard_params["market_price"] / self.standard_params["face_value"] * 100
+                expected = analytics.build_quantlib_bond().bondYield(
+                    normalized_price,
+                    analytics.day_count_convention,
+                    analytics.compounding,
+                    analytics.frequency,
+                    analytics.settlement_date
+                )
+                self.assertAlmostEqual(analytics.yield_to_maturity(), expected, places=7)
+
     def test_duration_convexity(self):
         md = self.analytics.modified_duration()
         macd = self.analytics.macaulay_duration()
@@ -153,10 +172,23 @@ class TestFixedCouponBondAnalytics(unittest.TestCase):
 
     # --- Additional Suggested Tests ---
     def test_day_count_conventions(self):
+        # One template bond with only its convention rebound; the analytics are rebuilt for each convention
+        bond = self._create_bond_variant()
         for convention in DayCountConventionEnum:
-            bond = self._create_bond_variant(day_count_convention=convention)
-            analytics = bond_analytics_factory(bond)
-            self.assertFalse(math.isnan(analytics.accrued_interest()))
+            with self.subTest(day_count_convention=convention):
+                bond.day_count_convention = convention
+                analytics = bond_analytics_factory(bond)
+                self.assertFalse(math.isnan(analytics.accrued_interest()))
+
+    def test_factory_rebuilds_after_bond_update(self):
+        bond = self._create_bond_variant()
+        analytics = bond_analytics_factory(bond)
+        self.assertIs(bond_analytics_factory(bond), analytics)
+
+        bond.coupon_rate = 0.07
+        updated = bond_analytics_factory(bond)
+        self.assertIsNot(updated, analytics)
+        self.assertGreater(updated.accrued_interest(), analytics.accrued_interest())
 
     def test_holiday_handling(self):
         # Test bond maturing on holiday
@@ -192,9 +224,9 @@ class TestFixedCouponBondAnalytics(unittest.TestCase):
         original_ytm = self.analytics.yield_to_maturity()
 
         # Simulate yield increase
-        up_bond = self._create_bond_variant(market_price=1000)
-        new_price = bond_analytics_factory(up_bond).clean_price()
-        new_ytm = bond_analytics_factory(up_bond).yield_to_maturity()
+        up_analytics = self.analytics.with_market_price(1000)
+        new_price = up_analytics.clean_price()
+        new_ytm = up_analytics.yield_to_maturity()
 
         self.assertGreater(new_ytm, original_ytm)
         self.assertEqual(new_price, original_price)
@@ -0,0 +1,119 @@
+import math
+import unittest
+
+import numpy as np
+
+from fixed_income.src.model.analytics import _kernels
+
+
+def _backends(kernel):
+    """The kernel's plain Python function, plus the compiled kernel when numba is installed"""
+    backends = {'python': getattr(kernel, 'py_func', kernel)}
+    if _kernels.NUMBA_AVAILABLE:
+        backends['numba'] = kernel
+    return backends
+
+
+class KernelsTest(unittest.TestCase):
+    """Analytics kernels checked on the pure-Python path, and on the numba path when it is available"""
+
+    def test_zcb_discount(self):
+        y, t = 0.045, 7.25
+        expected = {
+            _kernels.SIMPLE: 1.0 / (1.0 + y * t),
+            _kernels.COMPOUNDED: (1.0 + y / 2) ** (-2 * t),
+            _kernels.CONTINUOUS: math.exp(-y * t),
+        }
+        for compounding, discount in expected.items():
+            for backend, run in _backends(_kernels._zcb_discount).items():
+                with self.subTest(compounding=compounding, backend=backend):
+                    self.assertAlmostEqual(run(y, t, compounding, 2), discount, places=12)
+
+    def test_zcb_yield_and_sensitivities_match_the_discount_factor(self):
+        y, t, bump = 0.045, 7.25, 1e-5
+        discount = _backends(_kernels._zcb_discount)['python']
+        for compounding in (_kernels.SIMPLE, _kernels.COMPOUNDED, _kernels.CONTINUOUS):
+            df, df_up, df_down = (discount(y + shift, t, compounding, 2) for shift in (0.0, bump, -bump))
+            # Each closed form against the yield it inverts or a finite difference of the discount factor
+            cases = {
+                'yield': (_kernels._zcb_yield, 100.0 * df, y),
+                'duration': (_kernels._zcb_modified_duration, y, (df_down - df_up) / (2 * bump * df)),
+                'convexity': (_kernels._zcb_convexity, y, (df_up - 2 * df + df_down) / (bump * bump * df)),
+            }
+            for name, (kernel, first_arg, expected) in cases.items():
+                for backend, run in _backends(kernel).items():
+                    with self.subTest(compounding=compounding, kernel=name, backend=backend):
+                        self.assertAlmostEqual(run(first_arg, t, compounding, 2), expected,
+                                               delta=1e-5 * max(1.0, expected))
+
+    def test_cashflow_yield_recovers_yield(self):
+        times = np.arange(1, 11) / 2.0
+        amounts = np.full(10, 2.5)
+        amounts[-1] += 100.0
+        discount = _backends(_kernels._zcb_discount)['python']
+        prices = {
+            # Simple yields discount period by period, each half-year coupon period by 1 / (1 + y/2)
+            _kernels.SIMPLE: sum(a * (1.0 + 0.04 * 0.5) ** -(k + 1) for k, a in enumerate(amounts)),
+            _kernels.COMPOUNDED: sum(a * discount(0.04, t, _kernels.COMPOUNDED, 2) for t, a in zip(times, amounts)),
+            _kernels.CONTINUOUS: sum(a * discount(0.04, t, _kernels.CONTINUOUS, 2) for t, a in zip(times, amounts)),
+        }
+        for compounding, dirty_price in prices.items():
+            for backend, run in _backends(_kernels._cashflow_yield).items():
+                with self.subTest(compounding=compounding, backend=backend):
+                    self.assertAlmostEqual(run(times, amounts, dirty_price, 0.05, compounding, 2), 0.04, places=10)
+
+    def test_cashflow_yield_returns_nan_without_a_root(self):
+        # A zero price has no finite yield, so Newton's method runs off without converging
+        for backend, run in _backends(_kernels._cashflow_yield).items():
+            with self.subTest(backend=backend):
+                self.assertTrue(math.isnan(run(np.array([1.0]), np.array([100.0]), 0.0, 0.05,
+                                               _kernels.COMPOUNDED, 1)))
+
+    def test_yield_fixed_batch_round_trips_and_rejects_irregular_frequencies(self):
+        # Semiannual coupons on 100 face over 4.5 years, at par, at a deep premium that makes Newton's first step
+        # overshoot below -100% per period, and with QuantLib's Once, NoFrequency and OtherFrequency coupons
+        coupon_frequency = np.array([2.0, 2.0, 0.0, -1.0, 999.0])
+        clean_price = np.array([100.0, 10_000.0, 100.0, 100.0, 100.0])
+        n = len(clean_price)
+        face, coupon, maturity, yield_frequency = np.full(n, 100.0), np.full(n, 0.05), np.full(n, 4.5), np.ones(n)
+
+        for backend, run in _backends(_kernels._yield_fixed_batch).items():
+            with self.subTest(backend=backend):
+                ytm = np.empty(n)
+                run(face, coupon, coupon_frequency, maturity, clean_price, yield_frequency, ytm)
+                self.assertTrue(np.isnan(ytm[2:]).all())
+
+                repriced, duration, convexity = np.empty(n), np.empty(n), np.empty(n)
+                _kernels._price_fixed_batch(face, coupon, coupon_frequency, maturity, ytm, yield_frequency,
+                                            repriced, duration, convexity)
+                np.testing.assert_allclose(repriced[:2], clean_price[:2], rtol=1e-9)
+
+    def test_first_call_dates_matches_vectorized_scan(self):
+        rng = np.random.default_rng(7)
+        num_paths, num_calls, num_cashflows = 200, 3, 6
+        short_rates = rng.uniform(0.0, 0.1, (num_paths, num_calls))
+        weights = np.triu(rng.uniform(0.0, 30.0, (num_calls, num_cashflows)))
+        b = rng.uniform(0.1, 4.0, (num_calls, num_cashflows))
+        call_prices = np.array([85.0, 68.0, 52.0])
+
+        # The einsum scan CallableBondAnalytics uses when numba is missing
+        bond_values = np.einsum('ij,pij->pi', weights, np.exp(-b[None, :, :] * short_rates[:, :, None]))
+        called = bond_values >= call_prices[None, :]
+        expected = np.where(called.any(axis=1), called.argmax(axis=1), -1)
+
+        for backend, run in _backends(_kernels._first_call_dates).items():
+            with self.subTest(backend=backend):
+                np.testing.assert_array_equal(run(short_rates, weights, b, call_prices), expected)
+
+    def test_bond_value_hw(self):
+        cf_amounts = np.array([5.0, 5.0, 105.0])
+        gamma = np.array([0.5, 1.2, 2.0])
+        lam = np.array([0.01, 0.03, 0.06])
+        expected = sum(a * math.exp(-0.02 * g - l) for a, g, l in zip(cf_amounts, gamma, lam))
+        for backend, run in _backends(_kernels._bond_value_hw).items():
+            with self.subTest(backend=backend):
+                self.assertAlmostEqual(run(0.02, cf_amounts, gamma, lam), expected, places=10)
+
+
+if __name__ == '__main__':
+    unittest.main()
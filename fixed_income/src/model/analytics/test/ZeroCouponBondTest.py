@@ -1,7 +1,14 @@
 import math
+import os
+import time
 import unittest
 from datetime import date
 
+import numpy as np
+from QuantLib import Actual365Fixed, Annual, BondFunctions, Compounded, Date, Duration, NullCalendar, Period, \
+    Settings, Years, ZeroCouponBond
+
+from fixed_income.src.model.analytics import _kernels
 from fixed_income.src.model.analytics.BondAnalyticsFactory import bond_analytics_factory
 from fixed_income.src.model.bonds import BondBase, ZeroCouponBondModel
 from fixed_income.src.model.enums import BondTypeEnum, BusinessDayConventionEnum, CalendarEnum, CompoundingEnum, \
@@ -33,10 +40,13 @@ class ZeroCouponBondTest(unittest.TestCase):
             "accrues_interest_flag": False
         }
 
+        # Shared, read-only fixture; tests that need a different or mutated bond build a variant
+        cls.bond = ZeroCouponBondModel(**cls.base_params)
+        cls.analytics = bond_analytics_factory(cls.bond)
+
     def setUp(self):
-        """Create fresh bond for each test"""
-        self.bond = ZeroCouponBondModel(**self.base_params)
-        self.analytics = bond_analytics_factory(self.bond)
+        # QuantLib's evaluation date is global and other tests move it; pin it back to the shared fixture's date
+        Settings.instance().evaluationDate = self.analytics.evaluation_date
 
     def _create_bond_variant(self, **overrides):
         """Helper to create bond variants with overridden parameters"""
@@ -74,6 +84,10 @@ class ZeroCouponBondTest(unittest.TestCase):
         self.assertAlmostEqual(clean, dirty, places=10)  # Should be equal for ZCB
         self.assertTrue(0 < clean < 100)  # Discount bond range
 
+    def test_no_accrued_interest(self):
+        self.assertEqual(self.analytics.accrued_interest(), 0.0)
+        self.assertEqual(self.analytics.dirty_price(), self.analytics.clean_price())
+
     def test_yield_properties(self):
         ytm = self.analytics.yield_to_maturity()
         ytw = self.analytics.yield_to_worst()
@@ -138,19 +152,21 @@ class ZeroCouponBondTest(unittest.TestCase):
         self.assertTrue(ytm < 0)
 
     def test_update_evaluation_date(self):
-        original_price = self.analytics.clean_price()
+        # Mutates its analytics, so it must not touch the shared class fixture
+        analytics = bond_analytics_factory(self._create_bond_variant())
+        original_price = analytics.clean_price()
 
         # Move evaluation date forward (closer to maturity)
         new_date = date(2023, 3, 1)  # 1 month later
-        self.analytics.update_evaluation_date(new_date)
+        analytics.update_evaluation_date(new_date)
 
         # Price should be HIGHER because we're closer to maturity
         # (same yield, less time discounting)
-        new_price = self.analytics.clean_price()
+        new_price = analytics.clean_price()
         self.assertGreater(new_price, original_price)
 
         # Duration should be shorter
-        new_duration = self.analytics.macaulay_duration()
+        new_duration = analytics.macaulay_duration()
         original_duration = (self.base_params["maturity_date"] -
                              self.base_params["evaluation_date"]).days / 365.0
         self.assertLess(new_duration, original_duration)
@@ -172,10 +188,13 @@ class ZeroCouponBondTest(unittest.TestCase):
 
     # --- Additional Suggested Tests ---
     def test_day_count_conventions(self):
+        # One template bond with only its convention rebound; the analytics are rebuilt for each convention
+        bond = self._create_bond_variant()
         for convention in DayCountConventionEnum:
-            bond = self._create_bond_variant(day_count_convention=convention)
-            analytics = bond_analytics_factory(bond)
-            self.assertFalse(math.isnan(analytics.yield_to_maturity()))
+            with self.subTest(day_count_convention=convention):
+                bond.day_count_convention = convention
+                analytics = bond_analytics_factory(bond)
+                self.assertFalse(math.isnan(analytics.yield_to_maturity()))
 
     def test_extreme_price_sensitivity(self):
         # Get current metrics
@@ -186,12 +205,63 @@ class ZeroCouponBondTest(unittest.TestCase):
         t = (self.bond.maturity_date - self.bond.evaluation_date).days / 365.0
         bumped_price = self.bond.face_value / ((1 + ytm + 0.0001) ** t)
 
-        bumped_bond = self._create_bond_variant(market_price=bumped_price)
-        bumped_analytics = bond_analytics_factory(bumped_bond)
+        bumped_analytics = self.analytics.with_market_price(bumped_price)
 
         bumped_ytm = bumped_analytics.yield_to_maturity()
         self.assertAlmostEqual(bumped_ytm, ytm + 0.0001, delta=0.00001)
 
+    @staticmethod
+    def benchmark_paths(num_bonds: int = 10_000) -> None:
+        """
+        Time modified duration + convexity over a synthetic zero-coupon portfolio on each backend and print ns/bond.
+
+        Run with RUN_BENCH=1 set to execute this file as a script instead of the test suite.
+        """
+        rng = np.random.default_rng(42)
+        yields = rng.uniform(0.0, 0.1, num_bonds)
+        years = rng.integers(1, 31, num_bonds)
+        compounded = _kernels.COMPOUNDED
+
+        settlement = Date(1, 2, 2023)
+        day_counter = Actual365Fixed()
+        ql_bonds = {n: ZeroCouponBond(0, NullCalendar(), 100.0, settlement + Period(int(n), Years)) for n in set(years)}
+        horizons = np.array([day_counter.yearFraction(settlement, ql_bonds[n].maturityDate()) for n in years])
+
+        def quantlib():
+            for y, n in zip(yields, years):
+                bond = ql_bonds[n]
+                BondFunctions.duration(bond, y, day_counter, Compounded, Annual, Duration.Modified, settlement)
+                BondFunctions.convexity(bond, y, day_counter, Compounded, Annual, settlement)
+
+        def pure_python():
+            duration = getattr(_kernels._zcb_modified_duration, 'py_func', _kernels._zcb_modified_duration)
+            convexity = getattr(_kernels._zcb_convexity, 'py_func', _kernels._zcb_convexity)
+            for y, t in zip(yields.tolist(), horizons.tolist()):
+                duration(y, t, compounded, 1)
+                convexity(y, t, compounded, 1)
+
+        def numpy_vectorized():
+            horizons / (1.0 + yields)
+            horizons * (horizons + 1.0) / (1.0 + yields) ** 2
+
+        def numba_jit():
+            for y, t in zip(yields.tolist(), horizons.tolist()):
+                _kernels._zcb_modified_duration(y, t, compounded, 1)
+                _kernels._zcb_convexity(y, t, compounded, 1)
+
+        backends = {'quantlib': quantlib, 'pure_python': pure_python, 'numpy': numpy_vectorized}
+        if _kernels.NUMBA_AVAILABLE:
+            backends['numba'] = numba_jit
+
+        for name, run in backends.items():
+            start = time.perf_counter_ns()
+            run()
+            elapsed = time.perf_counter_ns() - start
+            print(f"{name:>12}: {elapsed / num_bonds:10.1f} ns/bond")
+
 
 if __name__ == '__main__':
-    unittest.main()
+    if os.environ.get('RUN_BENCH'):
+        ZeroCouponBondTest.benchmark_paths()
+    else:
+        unittest.main()
@@ -11,7 +11,7 @@ class BondIdentifierSnapshot(Base, AbstractIdentifierSnapshot):
 
     __tablename__ = 'bond_identifier_snapshot'
     __table_args__ = (
-        Index('idx_bond_snapshot_identifiers', 'identifiers'),
+        Index('idx_bond_snapshot_identifiers', 'identifiers', postgresql_using='gin'),
         Index('idx_bond_snapshot_primary', 'primary_identifier_type', 'primary_identifier_value'),
     )
 
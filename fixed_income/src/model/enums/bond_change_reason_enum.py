@@ -3,7 +3,7 @@ from enum import Enum
 from Identifier_management.enums.base_change_reason_enum import BaseChangeReasonEnum
 
 
-class BondChangeReasonEnum(Enum):
+class BondChangeReasonEnum(str, Enum):
     """Complete enum with base reasons + bond-specific reasons"""
 
     # Include all base reasons
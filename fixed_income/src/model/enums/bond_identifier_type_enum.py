@@ -1,7 +1,7 @@
 from enum import Enum
 
 
-class BondIdentifierTypeEnum(Enum, str):
+class BondIdentifierTypeEnum(str, Enum):
     """Bond-specific identifier types"""
 
     # Standard identifiers (reuse from base)
@@ -1,25 +1,85 @@
 # fixed_income_service/services/bond_identifier_service.py
-from typing import Dict, List, Optional
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from sqlalchemy.orm import Session, sessionmaker
 
 from Identifier_management.generic_identifier_service_factory import GenericIdentifierServiceFactory
-from fixed_income.src.database import get_db
+from fixed_income.src.config import settings
+from fixed_income.src.database import SessionLocal
 from fixed_income.src.model.bonds import BondBase
 from fixed_income.src.model.bonds.bond_identifer_snapshot import BondIdentifierSnapshot
 from fixed_income.src.model.bonds.bond_identifier_change_request import BondIdentifierChangeRequest
 from fixed_income.src.model.bonds.bond_identifier_history import BondIdentifierHistory
 from fixed_income.src.model.enums.bond_change_reason_enum import BondChangeReasonEnum
 from fixed_income.src.model.enums.bond_identifier_type_enum import BondIdentifierTypeEnum
+from fixed_income.src.utils.ttl_cache import MISSING, TTLCache
+
+# Valid rating symbols per agency, built once at import
+_MOODY_RATINGS = frozenset({
+    'AAA', 'AA1', 'AA2', 'AA3', 'A1', 'A2', 'A3',
+    'BAA1', 'BAA2', 'BAA3', 'BA1', 'BA2', 'BA3',
+    'B1', 'B2', 'B3', 'CAA1', 'CAA2', 'CAA3', 'CA', 'C',
+})
+
+_SP_FITCH_RATINGS = frozenset({
+    'AAA', 'AA+', 'AA', 'AA-', 'A+', 'A', 'A-',
+    'BBB+', 'BBB', 'BBB-', 'BB+', 'BB', 'BB-',
+    'B+', 'B', 'B-', 'CCC+', 'CCC', 'CCC-', 'CC', 'C', 'D',
+})
+
+_RATINGS_BY_AGENCY = {
+    "MOODY": _MOODY_RATINGS,
+    "SP": _SP_FITCH_RATINGS,
+    "FITCH": _SP_FITCH_RATINGS,
+}
+
+_AGENCY_TO_RATING_TYPE = {
+    "MOODY": BondIdentifierTypeEnum.RATING_MOODY,
+    "SP": BondIdentifierTypeEnum.RATING_SP,
+    "FITCH": BondIdentifierTypeEnum.RATING_FITCH,
+}
+
+# Row fields accepted by bulk_add_bond_identifiers_many and the identifier each one populates
+_BULK_IDENTIFIER_FIELDS = {
+    "isin": BondIdentifierTypeEnum.ISIN,
+    "cusip": BondIdentifierTypeEnum.CUSIP,
+    "rating_moody": BondIdentifierTypeEnum.RATING_MOODY,
+    "rating_sp": BondIdentifierTypeEnum.RATING_SP,
+}
 
 
 class BondIdentifierService:
     """Service for managing bond identifiers using the generic framework"""
 
-    def __init__(self):
-        self.session = get_db()
-
-        # Create the generic identifier manager
-        self.identifier_manager = GenericIdentifierServiceFactory.create_identifier_manager(
-            session=self.session,
+    def __init__(self, session_factory: sessionmaker = SessionLocal):
+        # Sessions come from the pooled factory per call, so no connection is held for the service's lifetime
+        self._Session = session_factory
+
+        # Current identifier values keyed by (bond_id, identifier type); kept per process, so each worker warms its
+        # own copy and changes made through another worker show up once the TTL lapses
+        self._current_identifier_cache = TTLCache(settings.IDENTIFIER_CACHE_MAXSIZE, settings.IDENTIFIER_CACHE_TTL)
+
+    @contextmanager
+    def _session(self) -> Iterator[Session]:
+        """Session for a single service call, committed on success and always returned to the pool"""
+        # Loaded objects stay readable after the session closes, since callers get them back
+        session = self._Session(expire_on_commit=False)
+        try:
+            yield session
+            session.commit()
+        except Exception:
+            session.rollback()
+            raise
+        finally:
+            session.close()
+
+    @staticmethod
+    def _identifier_manager(session: Session):
+        """Generic identifier manager bound to the given session"""
+        return GenericIdentifierServiceFactory.create_identifier_manager(
+            session=session,
             history_model=BondIdentifierHistory,
             snapshot_model=BondIdentifierSnapshot,
             change_request_model=BondIdentifierChangeRequest,
@@ -32,106 +92,132 @@ class BondIdentifierService:
     # BOND-SPECIFIC CONVENIENCE METHODS
     # ==========================================
 
+    def _cached_current(self, bond_id: int, identifier_type: BondIdentifierTypeEnum) -> Optional[str]:
+        """Current identifier value, served from the TTL cache when present"""
+        key = (bond_id, identifier_type)
+        value = self._current_identifier_cache.get(key)
+        if value is MISSING:
+            with self._session() as session:
+                value = self._identifier_manager(session).get_current_identifier(bond_id, identifier_type)
+            self._current_identifier_cache.set(key, value)
+        return value
+
+    def _invalidate_current(self, bond_id: int, identifier_type: str):
+        """Drop a cached current identifier value after it changes"""
+        # Members are str-valued, so the raw type string from a history record hashes to the same key
+        self._current_identifier_cache.pop((bond_id, identifier_type))
+
     def get_current_isin(self, bond_id: int) -> Optional[str]:
         """Get current ISIN for a bond"""
-        return self.identifier_manager.get_current_identifier(bond_id, BondIdentifierTypeEnum.ISIN)
+        return self._cached_current(bond_id, BondIdentifierTypeEnum.ISIN)
 
     def get_current_cusip(self, bond_id: int) -> Optional[str]:
         """Get current CUSIP for a bond"""
-        return self.identifier_manager.get_current_identifier(bond_id, BondIdentifierTypeEnum.CUSIP)
+        return self._cached_current(bond_id, BondIdentifierTypeEnum.CUSIP)
 
     def get_current_rating(self, bond_id: int, agency: str = "MOODY") -> Optional[str]:
         """Get current rating for a bond from specific agency"""
-        rating_type = getattr(BondIdentifierTypeEnum, f"RATING_{agency.upper()}", None)
+        rating_type = _AGENCY_TO_RATING_TYPE.get(agency.upper())
         if rating_type:
-            return self.identifier_manager.get_current_identifier(bond_id, rating_type)
+            return self._cached_current(bond_id, rating_type)
         return None
 
     def find_bond_by_isin(self, isin: str) -> Optional[BondBase]:
         """Find bond by ISIN"""
-        return self.identifier_manager.find_entity_by_identifier(BondIdentifierTypeEnum.ISIN, isin)
+        with self._session() as session:
+            return self._identifier_manager(session).find_entity_by_identifier(BondIdentifierTypeEnum.ISIN, isin)
 
     def find_bond_by_cusip(self, cusip: str) -> Optional[BondBase]:
         """Find bond by CUSIP"""
-        return self.identifier_manager.find_entity_by_identifier(BondIdentifierTypeEnum.CUSIP, cusip)
+        with self._session() as session:
+            return self._identifier_manager(session).find_entity_by_identifier(BondIdentifierTypeEnum.CUSIP, cusip)
+
+    def find_bonds_by_identifiers(self,
+                                  pairs: List[Tuple[BondIdentifierTypeEnum, str]]) -> Dict[Tuple, Optional[BondBase]]:
+        """Find bonds for many identifiers at once, e.g. a trade's ISIN and CUSIP, keyed by each requested pair"""
+        with self._session() as session:
+            return self._identifier_manager(session).find_entities_by_identifiers(pairs)
 
     def get_bonds_by_rating(self, agency: str, rating: str) -> List[BondBase]:
         """Find all bonds with specific rating"""
-        rating_type = getattr(BondIdentifierTypeEnum, f"RATING_{agency.upper()}", None)
+        rating_type = _AGENCY_TO_RATING_TYPE.get(agency.upper())
         if not rating_type:
             return []
 
-        # Search in snapshots
-        snapshots = self.session.query(BondIdentifierSnapshot).all()
-        matching_bonds = []
-
-        for snapshot in snapshots:
-            if snapshot.identifiers and rating_type.value in snapshot.identifiers:
-                if snapshot.identifiers[rating_type.value]['value'] == rating:
-                    matching_bonds.append(snapshot.bond)
-
-        return matching_bonds
+        # JSONB containment is answered from the GIN index on identifiers; only bond columns are selected
+        with self._session() as session:
+            return (
+                session.query(BondBase)
+                .join(BondBase.current_identifiers)
+                .filter(BondIdentifierSnapshot.identifiers.contains({rating_type: {'value': rating}}))
+                .all()
+            )
 
     def request_rating_change(self, bond_id: int, agency: str, new_rating: str,
                               requested_by: str, rating_rationale: str = None):
         """Request a rating change for a bond"""
-        rating_type = getattr(BondIdentifierTypeEnum, f"RATING_{agency.upper()}")
-
-        change_request = self.identifier_manager.request_identifier_change(
-            entity_id=bond_id,
-            identifier_type=rating_type,
-            new_value=new_rating,
-            reason=BondChangeReasonEnum.RATING_CHANGE,
-            requested_by=requested_by,
-            description=f"{agency} rating change to {new_rating}. Rationale: {rating_rationale}",
-            requires_rating_review=True  # Bond-specific field
-        )
+        rating_type = _AGENCY_TO_RATING_TYPE.get(agency.upper())
+        if rating_type is None:
+            raise ValueError(f"Unknown rating agency: {agency}")
 
-        return change_request
+        with self._session() as session:
+            return self._identifier_manager(session).request_identifier_change(
+                entity_id=bond_id,
+                identifier_type=rating_type,
+                new_value=new_rating,
+                reason=BondChangeReasonEnum.RATING_CHANGE,
+                requested_by=requested_by,
+                description=f"{agency} rating change to {new_rating}. Rationale: {rating_rationale}",
+                requires_rating_review=True  # Bond-specific field
+            )
 
     def bulk_add_bond_identifiers(self, bond_id: int, isin: str = None, cusip: str = None,
                                   rating_moody: str = None, rating_sp: str = None,
                                   created_by: str = "system", source: str = None):
         """Add multiple identifiers to a bond at once"""
-        identifiers = {}
-
-        if isin:
-            identifiers[BondIdentifierTypeEnum.ISIN] = isin
-        if cusip:
-            identifiers[BondIdentifierTypeEnum.CUSIP] = cusip
-        if rating_moody:
-            identifiers[BondIdentifierTypeEnum.RATING_MOODY] = rating_moody
-        if rating_sp:
-            identifiers[BondIdentifierTypeEnum.RATING_SP] = rating_sp
-
-        if identifiers:
-            return self.identifier_manager.bulk_add_identifiers(
-                entity_id=bond_id,
-                identifiers=identifiers,
-                created_by=created_by,
-                source=source,
-                reason=BondChangeReasonEnum.INITIAL_ASSIGNMENT
-            )
+        return self.bulk_add_bond_identifiers_many(
+            [{'bond_id': bond_id, 'isin': isin, 'cusip': cusip, 'rating_moody': rating_moody, 'rating_sp': rating_sp}],
+            created_by=created_by, source=source
+        )
+
+    def bulk_add_bond_identifiers_many(self, rows: List[Dict[str, str]], created_by: str = "system",
+                                       source: str = None):
+        """
+        Add identifiers to many bonds in a single transaction.
+
+        Args:
+            rows: One dict per bond with a bond_id and any of isin, cusip, rating_moody and rating_sp
+            created_by: User recorded as creator of the identifiers
+            source: Optional data source of the identifiers
+        """
+        identifiers_by_bond = {}
+        for row in rows:
+            identifiers = {identifier_type: row[field] for field, identifier_type in _BULK_IDENTIFIER_FIELDS.items()
+                           if row.get(field)}
+            if identifiers:
+                identifiers_by_bond.setdefault(row['bond_id'], {}).update(identifiers)
+
+        if identifiers_by_bond:
+            with self._session() as session:
+                result = self._identifier_manager(session).bulk_add_identifiers_many(
+                    identifiers_by_entity=identifiers_by_bond,
+                    created_by=created_by,
+                    source=source,
+                    reason=BondChangeReasonEnum.INITIAL_ASSIGNMENT
+                )
+            for bond_id, identifiers in identifiers_by_bond.items():
+                for identifier_type in identifiers:
+                    self._invalidate_current(bond_id, identifier_type)
+            return result
         return None
 
     def validate_rating_format(self, rating: str, agency: str) -> bool:
         """Validate rating format for specific agency"""
-        agency = agency.upper()
-        rating = rating.upper()
+        valid_ratings = _RATINGS_BY_AGENCY.get(agency.upper())
+        if valid_ratings is None:
+            return True  # Unknown agency, assume valid
 
-        if agency == "MOODY":
-            valid_ratings = ['AAA', 'AA1', 'AA2', 'AA3', 'A1', 'A2', 'A3',
-                             'BAA1', 'BAA2', 'BAA3', 'BA1', 'BA2', 'BA3',
-                             'B1', 'B2', 'B3', 'CAA1', 'CAA2', 'CAA3', 'CA', 'C']
-            return rating in valid_ratings
-
-        elif agency in ["SP", "FITCH"]:
-            valid_ratings = ['AAA', 'AA+', 'AA', 'AA-', 'A+', 'A', 'A-',
-                             'BBB+', 'BBB', 'BBB-', 'BB+', 'BB', 'BB-',
-                             'B+', 'B', 'B-', 'CCC+', 'CCC', 'CCC-', 'CC', 'C', 'D']
-            return rating in valid_ratings
-
-        return True  # Unknown agency, assume valid
+        return rating.upper() in valid_ratings
 
     # ==========================================
     # DELEGATE ALL OTHER METHODS TO GENERIC MANAGER
@@ -139,41 +225,54 @@ class BondIdentifierService:
 
     def get_all_current_identifiers(self, bond_id: int) -> Dict[str, str]:
         """Get all current identifiers for a bond"""
-        return self.identifier_manager.get_all_current_identifiers(bond_id)
+        with self._session() as session:
+            return self._identifier_manager(session).get_all_current_identifiers(bond_id)
 
     def get_identifier_history(self, bond_id: int, identifier_type: BondIdentifierTypeEnum) -> List:
         """Get identifier history"""
-        return self.identifier_manager.get_identifier_history(bond_id, identifier_type)
+        with self._session() as session:
+            return self._identifier_manager(session).get_identifier_history(bond_id, identifier_type)
 
     def approve_change_request(self, change_request_id, approved_by: str):
         """Approve identifier change request"""
-        return self.identifier_manager.approve_identifier_change(change_request_id, approved_by)
+        with self._session() as session:
+            new_record = self._identifier_manager(session).approve_identifier_change(change_request_id, approved_by)
+        self._invalidate_current(new_record.bond_id, new_record.identifier_type)
+        return new_record
 
     def reject_change_request(self, change_request_id, rejected_by: str, reason: str = None):
         """Reject identifier change request"""
-        return self.identifier_manager.reject_identifier_change(change_request_id, rejected_by, reason)
+        with self._session() as session:
+            return self._identifier_manager(session).reject_identifier_change(change_request_id, rejected_by, reason)
 
     def get_pending_change_requests(self, bond_id: int = None):
         """Get pending change requests"""
-        return self.identifier_manager.get_pending_change_requests(bond_id)
+        with self._session() as session:
+            return self._identifier_manager(session).get_pending_change_requests(bond_id)
 
     def rollback_identifier(self, bond_id: int, identifier_type: BondIdentifierTypeEnum,
                             target_version: int, reason: str, performed_by: str):
         """Rollback identifier to specific version"""
-        return self.identifier_manager.rollback_identifier(
-            bond_id, identifier_type, target_version, reason, performed_by
-        )
+        with self._session() as session:
+            success = self._identifier_manager(session).rollback_identifier(
+                bond_id, identifier_type, target_version, reason, performed_by
+            )
+        self._invalidate_current(bond_id, identifier_type)
+        return success
 
     def search_identifiers(self, search_term: str, identifier_types: List[BondIdentifierTypeEnum] = None):
         """Search for identifiers"""
-        return self.identifier_manager.search_identifiers(search_term, identifier_types)
+        with self._session() as session:
+            return self._identifier_manager(session).search_identifiers(search_term, identifier_types)
 
     def get_identifier_statistics(self):
         """Get system statistics"""
-        return self.identifier_manager.get_identifier_statistics()
+        with self._session() as session:
+            return self._identifier_manager(session).get_identifier_statistics()
 
 
 # Factory function
+@lru_cache(maxsize=1)
 def get_bond_identifier_service() -> BondIdentifierService:
-    """Factory function for dependency injection"""
+    """Factory function for dependency injection; the service holds no session, so one instance is shared"""
     return BondIdentifierService()
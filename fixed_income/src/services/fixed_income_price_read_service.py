@@ -1,16 +1,48 @@
+import asyncio
 import datetime
 import logging
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional
 
+import numpy as np
+from fastapi.concurrency import run_in_threadpool
+from pydantic import TypeAdapter
+from redis.asyncio import Redis
+from sqlalchemy.orm import Session
 from fixed_income.src.api.bond_schema.BondPriceSchema import BondPriceRequest, BondPriceResponse
 from fixed_income.src.model.bonds.BondPrice import BondPrice  # Assuming this model exists
 
+from fixed_income.src.config import settings
 from fixed_income.src.database.generic_database_service import GenericDatabaseService
+from fixed_income.src.model.bonds import BondBase
 from fixed_income.src.model.enums import BondTypeEnum
 from fixed_income.src.services.fixed_income_read_service import get_bond_read_service
+from fixed_income.src.utils.ttl_cache import MISSING, TTLCache
 
 logger = logging.getLogger(__name__)
 
+# Seconds a cached current price is served before going back to the database
+CURRENT_PRICE_TTL = 30
+# History windows that ended in the past no longer change, so they are kept far longer
+PRICE_HISTORY_TTL = 3600
+
+# One client (and connection pool) shared by every service instance in the process
+_price_cache = Redis.from_url(settings.REDIS_URL)
+_price_list_adapter = TypeAdapter(List[BondPriceResponse])
+
+# Per-process tier in front of Redis for the hottest current prices (memory -> Redis -> database)
+_hot_prices = TTLCache(settings.HOT_PRICE_CACHE_MAXSIZE, settings.HOT_PRICE_CACHE_TTL)
+# Current-price loads in flight, so concurrent misses on one key share a single Redis/database fetch
+_inflight_prices: Dict[str, asyncio.Future] = {}
+
+
+def _current_price_key(bond_id: int, bond_type: BondTypeEnum) -> str:
+    return f"current_price:{bond_type.value}:{bond_id}"
+
+
+def _price_history_key(bond_id: int, bond_type: BondTypeEnum, start_date, end_date, limit: int) -> str:
+    start = start_date.isoformat() if start_date else ""
+    return f"price_history:{bond_type.value}:{bond_id}:{start}:{end_date.isoformat()}:{limit}"
+
 
 class BondPriceReadOnlyService:
     """
@@ -21,14 +53,30 @@ class BondPriceReadOnlyService:
     Supports multiple bond types and pricing methodologies.
     """
 
-    def __init__(self):
+    def __init__(self, db: Session):
         self.db_service = GenericDatabaseService(
             model=BondPrice,
             create_schema=BondPriceRequest,
             response_schema=BondPriceResponse
         )
-        self.bond_read_service = get_bond_read_service()
-        # Future: self.price_cache = RedisPriceCache()
+        self.bond_read_service = get_bond_read_service(db)
+        self.price_cache = _price_cache
+
+    # === Cache Helpers ===
+    # Cache failures are logged and treated as misses, so Redis being unavailable only costs the database read
+
+    async def _cache_get(self, key: str) -> Optional[bytes]:
+        try:
+            return await self.price_cache.get(key)
+        except Exception as e:
+            logger.warning(f"Price cache read failed for {key}: {str(e)}")
+            return None
+
+    async def _cache_set(self, key: str, value: str, ttl: int):
+        try:
+            await self.price_cache.set(key, value, ex=ttl)
+        except Exception as e:
+            logger.warning(f"Price cache write failed for {key}: {str(e)}")
 
     # === Current Price Operations ===
 
@@ -36,33 +84,50 @@ class BondPriceReadOnlyService:
         """
         Get the most recent price for a single bond.
         """
-        try:
-            # Future: Check cache first
-            # cached = await self.price_cache.get(f"current_price:{bond_type.value}:{bond_id}")
-            # if cached: return BondPriceResponse.parse_raw(cached)
-
-            # Get latest price from database
-            prices = await self.db_service.get_by_column(
-                column_name="bond_id",
-                value=bond_id
-            )
-
-            # Filter by bond_type and get most recent
-            bond_type_prices = [p for p in prices if p.bond_type == bond_type.value]
-            if bond_type_prices:
-                # Sort by timestamp to get most recent
-                current_price = max(bond_type_prices, key=lambda x: x.timestamp)
-            else:
-                current_price = None
+        key = _current_price_key(bond_id, bond_type)
+        current_price = _hot_prices.get(key)
+        if current_price is not MISSING:
+            return current_price
 
-            # Future: Cache the result with short TTL
-            # if current_price:
-            #     await self.price_cache.setex(f"current_price:{bond_type.value}:{bond_id}", 30, current_price.json())
+        # Single flight: later callers for the same key wait on the first caller's load
+        inflight = _inflight_prices.get(key)
+        if inflight is not None:
+            return await asyncio.shield(inflight)
 
-            return current_price
+        inflight = _inflight_prices[key] = asyncio.get_running_loop().create_future()
+        current_price = None
+        try:
+            current_price = await self._load_current_price(key, bond_id, bond_type)
+            if current_price:
+                _hot_prices.set(key, current_price)
         except Exception as e:
             logger.error(f"Error getting current price for {bond_type.value} bond {bond_id}: {str(e)}")
-            return None
+        finally:
+            del _inflight_prices[key]
+            inflight.set_result(current_price)
+
+        return current_price
+
+    async def _load_current_price(self, key: str, bond_id: int, bond_type: BondTypeEnum) -> Optional[BondPriceResponse]:
+        """Most recent price from Redis, falling back to the database and caching what it finds"""
+        cached = await self._cache_get(key)
+        if cached:
+            return BondPriceResponse.model_validate_json(cached)
+
+        # Get latest price from database
+        prices = await run_in_threadpool(
+            self.db_service.query,
+            filters=[("bond_id", "=", bond_id), ("bond_type", "=", bond_type.value)],
+            order_by=[("timestamp", "desc")],
+            limit=1
+        )
+
+        current_price = prices[0] if prices else None
+
+        if current_price:
+            await self._cache_set(key, current_price.model_dump_json(), CURRENT_PRICE_TTL)
+
+        return current_price
 
     async def get_current_prices_bulk(self, bond_ids: List[int], bond_type: BondTypeEnum) -> Dict[
         int, BondPriceResponse]:
@@ -70,38 +135,83 @@ class BondPriceReadOnlyService:
         Get current prices for multiple bonds efficiently.
         """
         try:
-            # Future: Batch cache lookup
             current_prices = {}
+            for bond_id in dict.fromkeys(bond_ids):
+                hot = _hot_prices.get(_current_price_key(bond_id, bond_type))
+                if hot is not MISSING:
+                    current_prices[bond_id] = hot
+            bond_ids = [bond_id for bond_id in dict.fromkeys(bond_ids) if bond_id not in current_prices]
+            if not bond_ids:
+                return current_prices
+
+            # One MGET for the rest; only the misses go to the database
+            try:
+                cached = await self.price_cache.mget([_current_price_key(bond_id, bond_type) for bond_id in bond_ids])
+            except Exception as e:
+                logger.warning(f"Price cache bulk read failed for {bond_type.value}: {str(e)}")
+                cached = [None] * len(bond_ids)
+
+            for bond_id, value in zip(bond_ids, cached):
+                if value:
+                    current_prices[bond_id] = price = BondPriceResponse.model_validate_json(value)
+                    _hot_prices.set(_current_price_key(bond_id, bond_type), price)
+            missing_ids = [bond_id for bond_id in bond_ids if bond_id not in current_prices]
+            if not missing_ids:
+                return current_prices
+
+            # One query returns the newest price of every missing bond instead of a round-trip per bond
+            latest_prices = await run_in_threadpool(
+                self.db_service.get_latest_per_group,
+                group_by="bond_id",
+                latest_by="timestamp",
+                filters=[("bond_id", "in", missing_ids), ("bond_type", "=", bond_type.value)]
+            )
 
-            for bond_id in bond_ids:
-                price = await self.get_current_price(bond_id, bond_type)
-                if price:
-                    current_prices[bond_id] = price
-
+            await self._remember_current_prices(latest_prices, bond_type)
+            for price in latest_prices:
+                current_prices[price.bond_id] = price
             return current_prices
         except Exception as e:
             logger.error(f"Error in bulk current price retrieval for {bond_type.value}: {str(e)}")
             return {}
 
+    async def _remember_current_prices(self, prices: Iterable[BondPriceResponse], bond_type: BondTypeEnum):
+        """Write current prices just read from the database to Redis in one pipeline and to the hot tier"""
+        prices = list(prices)
+        if not prices:
+            return
+
+        try:
+            async with self.price_cache.pipeline(transaction=False) as pipe:
+                for price in prices:
+                    pipe.set(_current_price_key(price.bond_id, bond_type), price.model_dump_json(),
+                             ex=CURRENT_PRICE_TTL)
+                await pipe.execute()
+        except Exception as e:
+            logger.warning(f"Price cache bulk write failed for {bond_type.value}: {str(e)}")
+
+        for price in prices:
+            _hot_prices.set(_current_price_key(price.bond_id, bond_type), price)
+
     async def get_current_prices_by_symbols(self, symbols: List[str], bond_type: BondTypeEnum) -> Dict[
         str, BondPriceResponse]:
         """
         Get current prices by bond symbols.
         """
         try:
-            # First get bond IDs for symbols
-            bonds = await self.bond_read_service.get_bonds_by_symbols_bulk(symbols, bond_type)
-            symbol_to_bond = {bond.symbol: bond for bond in bonds}
-
-            result = {}
-            for symbol in symbols:
-                if symbol in symbol_to_bond:
-                    bond = symbol_to_bond[symbol]
-                    price = await self.get_current_price(bond.id, bond_type)
-                    if price:
-                        result[symbol] = price
-
-            return result
+            # Symbols are resolved to bonds and their newest prices in one join instead of a bond lookup first
+            prices_by_symbol = await run_in_threadpool(
+                self.db_service.get_latest_per_related,
+                related_model=BondBase,
+                foreign_key="bond_id",
+                related_by="symbol",
+                related_values=list(dict.fromkeys(symbols)),
+                latest_by="timestamp",
+                filters=[("bond_type", "=", bond_type.value)]
+            )
+
+            await self._remember_current_prices(prices_by_symbol.values(), bond_type)
+            return {symbol: prices_by_symbol[symbol] for symbol in symbols if symbol in prices_by_symbol}
         except Exception as e:
             logger.error(f"Error getting current prices by symbols for {bond_type.value}: {str(e)}")
             return {}
@@ -120,26 +230,33 @@ class BondPriceReadOnlyService:
         Get historical prices for a bond within date range.
         """
         try:
-            # Get all prices for the bond
-            all_prices = await self.db_service.get_by_column("bond_id", bond_id)
-
-            # Filter by bond type and date range
-            filtered_prices = []
-            for price in all_prices:
-                if price.bond_type != bond_type.value:
-                    continue
-
-                if start_date and price.timestamp < start_date:
-                    continue
-
-                if end_date and price.timestamp > end_date:
-                    continue
+            # Only windows that closed in the past are cached; open-ended ones still gain new prices
+            key = None
+            if end_date and end_date < datetime.datetime.now(end_date.tzinfo):
+                key = _price_history_key(bond_id, bond_type, start_date, end_date, limit)
+                cached = await self._cache_get(key)
+                if cached:
+                    return _price_list_adapter.validate_json(cached)
+
+            filters = [("bond_id", "=", bond_id), ("bond_type", "=", bond_type.value)]
+
+            if start_date:
+                filters.append(("timestamp", ">=", start_date))
+            if end_date:
+                filters.append(("timestamp", "<=", end_date))
+
+            # Most recent first, filtered and limited in the database
+            prices = await run_in_threadpool(
+                self.db_service.query,
+                filters=filters,
+                order_by=[("timestamp", "desc")],
+                limit=limit
+            )
 
-                filtered_prices.append(price)
+            if key:
+                await self._cache_set(key, _price_list_adapter.dump_json(prices).decode(), PRICE_HISTORY_TTL)
 
-            # Sort by timestamp (most recent first) and apply limit
-            filtered_prices.sort(key=lambda x: x.timestamp, reverse=True)
-            return filtered_prices[:limit]
+            return prices
 
         except Exception as e:
             logger.error(f"Error getting price history for {bond_type.value} bond {bond_id}: {str(e)}")
@@ -189,16 +306,16 @@ class BondPriceReadOnlyService:
             if not prices:
                 return {}
 
-            price_values = [float(price.price) for price in prices]
+            price_values = np.fromiter((price.price for price in prices), dtype=np.float64, count=len(prices))
 
             return {
                 "bond_id": bond_id,
                 "bond_type": bond_type.value,
                 "period_days": days,
-                "high": max(price_values),
-                "low": min(price_values),
-                "current": price_values[0],  # Most recent (first in desc order)
-                "average": sum(price_values) / len(price_values),
+                "high": float(price_values.max()),
+                "low": float(price_values.min()),
+                "current": float(price_values[0]),  # Most recent (first in desc order)
+                "average": float(price_values.mean()),
                 "data_points": len(price_values),
                 "start_date": start_date.isoformat(),
                 "end_date": datetime.datetime.now().isoformat()
@@ -229,9 +346,21 @@ class BondPriceReadOnlyService:
                 "periods": {}
             }
 
-            for days in periods:
-                past_date = datetime.datetime.now() - datetime.timedelta(days=days)
-                past_price = await self.get_price_at_date(bond_id, bond_type, past_date)
+            now = datetime.datetime.now()
+            past_dates = {days: now - datetime.timedelta(days=days) for days in periods}
+
+            # Every period's past price comes back from one as-of query
+            past_prices = await run_in_threadpool(
+                self.db_service.get_latest_as_of,
+                group_by="bond_id",
+                group_values=[bond_id],
+                latest_by="timestamp",
+                as_of_values=list(past_dates.values()),
+                filters=[("bond_type", "=", bond_type.value)]
+            )
+
+            for days, past_date in past_dates.items():
+                past_price = past_prices.get((bond_id, past_date))
 
                 if past_price:
                     change = float(current_price.price) - float(past_price.price)
@@ -264,13 +393,25 @@ class BondPriceReadOnlyService:
 
             comparison_data = {}
 
+            # Bonds, current prices and start prices each come from one query for all bonds
+            bonds = {bond.id: bond for bond in await self.bond_read_service.get_bonds_bulk(bond_ids, bond_type)}
+            current_prices = await self.get_current_prices_bulk(list(bonds), bond_type)
+            start_prices = await run_in_threadpool(
+                self.db_service.get_latest_as_of,
+                group_by="bond_id",
+                group_values=list(bonds),
+                latest_by="timestamp",
+                as_of_values=[start_date],
+                filters=[("bond_type", "=", bond_type.value)]
+            )
+
             for bond_id in bond_ids:
-                bond = await self.bond_read_service.get_bond_by_id(bond_id, bond_type)
+                bond = bonds.get(bond_id)
                 if not bond:
                     continue
 
-                current_price = await self.get_current_price(bond_id, bond_type)
-                start_price = await self.get_price_at_date(bond_id, bond_type, start_date)
+                current_price = current_prices.get(bond_id)
+                start_price = start_prices.get((bond_id, start_date))
 
                 if current_price and start_price:
                     change = float(current_price.price) - float(start_price.price)
@@ -319,32 +460,34 @@ class BondPriceReadOnlyService:
                 return {"status": "no_data", "bond_id": bond_id, "bond_type": bond_type.value}
 
             # Analyze data quality
-            price_values = [float(price.price) for price in prices]
+            price_values = np.fromiter((price.price for price in prices), dtype=np.float64, count=len(prices))
             timestamps = [price.timestamp for price in prices]
-
-            # Check for gaps
-            gaps = []
-            for i in range(1, len(timestamps)):
-                time_diff = timestamps[i - 1] - timestamps[i]  # Desc order
-                if time_diff.total_seconds() > 86400:  # More than 1 day gap
-                    gaps.append({
-                        "start": timestamps[i].isoformat(),
-                        "end": timestamps[i - 1].isoformat(),
-                        "duration_hours": time_diff.total_seconds() / 3600
-                    })
+            epoch_seconds = np.fromiter((ts.timestamp() for ts in timestamps), dtype=np.float64, count=len(prices))
+
+            # Check for gaps; history is in desc order, so each step back in time is the negated difference
+            gap_seconds = -np.diff(epoch_seconds)
+            gaps = [
+                {
+                    "start": timestamps[i + 1].isoformat(),
+                    "end": timestamps[i].isoformat(),
+                    "duration_hours": float(gap_seconds[i]) / 3600
+                }
+                for i in np.flatnonzero(gap_seconds > 86400)  # More than 1 day gap
+            ]
 
             # Check for anomalies (more conservative for bonds)
             anomalies = []
             if len(price_values) > 2:
-                avg_price = sum(price_values) / len(price_values)
-                for i, price in enumerate(price_values):
-                    deviation = abs(price - avg_price) / avg_price
-                    if deviation > 0.05:  # 5% deviation threshold for bonds
-                        anomalies.append({
-                            "timestamp": timestamps[i].isoformat(),
-                            "price": price,
-                            "deviation_percent": round(deviation * 100, 2)
-                        })
+                avg_price = price_values.mean()
+                deviations = np.abs(price_values - avg_price) / avg_price
+                anomalies = [
+                    {
+                        "timestamp": timestamps[i].isoformat(),
+                        "price": float(price_values[i]),
+                        "deviation_percent": round(float(deviations[i]) * 100, 2)
+                    }
+                    for i in np.flatnonzero(deviations > 0.05)  # 5% deviation threshold for bonds
+                ]
 
             return {
                 "bond_id": bond_id,
@@ -383,16 +526,29 @@ class BondPriceReadOnlyService:
             if not current_prices:
                 return {}
 
-            price_values = [float(price.price) for price in current_prices.values()]
+            price_values = np.fromiter((price.price for price in current_prices.values()), dtype=np.float64,
+                                       count=len(current_prices))
 
             # Calculate performance for 1 day
             performance_data = []
             yield_data = []
 
-            for bond_id in bond_ids:
-                perf = await self.get_price_performance(bond_id, bond_type, [1])
-                if perf.get("periods", {}).get("1d"):
-                    performance_data.append(perf["periods"]["1d"]["change_percent"])
+            # Prices one day back for every priced bond in one as-of query, rather than a performance call per bond
+            past_date = datetime.datetime.now() - datetime.timedelta(days=1)
+            past_prices = await run_in_threadpool(
+                self.db_service.get_latest_as_of,
+                group_by="bond_id",
+                group_values=list(current_prices),
+                latest_by="timestamp",
+                as_of_values=[past_date],
+                filters=[("bond_type", "=", bond_type.value)]
+            )
+
+            for bond_id, current_price in current_prices.items():
+                past_price = past_prices.get((bond_id, past_date))
+                if past_price:
+                    change = float(current_price.price) - float(past_price.price)
+                    performance_data.append(round((change / float(past_price.price)) * 100, 2))
 
             gainers = len([p for p in performance_data if p > 0])
             losers = len([p for p in performance_data if p < 0])
@@ -411,9 +567,9 @@ class BondPriceReadOnlyService:
                                                 2) if performance_data else 0
                 },
                 "price_stats": {
-                    "highest_price": max(price_values),
-                    "lowest_price": min(price_values),
-                    "average_price": round(sum(price_values) / len(price_values), 2)
+                    "highest_price": float(price_values.max()),
+                    "lowest_price": float(price_values.min()),
+                    "average_price": round(float(price_values.mean()), 2)
                 },
                 "yield_stats": {
                     "average_yield": round(sum(yield_data) / len(yield_data), 2) if yield_data else 0,
@@ -426,12 +582,19 @@ class BondPriceReadOnlyService:
             logger.error(f"Error generating {bond_type.value} bond market summary: {str(e)}")
             return {}
 
-    # === Future Cache Management ===
+    # === Cache Management ===
 
-    # async def invalidate_price_cache(self, bond_id: int, bond_type: BondTypeEnum):
-    #     """Invalidate price cache for specific bond"""
-    #     await self.price_cache.delete(f"current_price:{bond_type.value}:{bond_id}")
-    #     await self.price_cache.delete_pattern(f"price_history:{bond_type.value}:{bond_id}:*")
+    async def invalidate_price_cache(self, bond_id: int, bond_type: BondTypeEnum):
+        """Invalidate price cache for specific bond"""
+        # Only this process's in-memory tier can be cleared here; other workers' copies lapse within its short TTL
+        _hot_prices.pop(_current_price_key(bond_id, bond_type))
+        try:
+            keys = [_current_price_key(bond_id, bond_type)]
+            history_pattern = f"price_history:{bond_type.value}:{bond_id}:*"
+            keys += [key async for key in self.price_cache.scan_iter(match=history_pattern)]
+            await self.price_cache.delete(*keys)
+        except Exception as e:
+            logger.warning(f"Price cache invalidation failed for {bond_type.value} bond {bond_id}: {str(e)}")
 
     # async def warm_price_cache(self, bond_ids: List[int], bond_type: BondTypeEnum):
     #     """Pre-warm cache with current prices"""
@@ -441,6 +604,6 @@ class BondPriceReadOnlyService:
 
 
 # Factory function
-def get_bond_price_read_service() -> BondPriceReadOnlyService:
+def get_bond_price_read_service(db: Session) -> BondPriceReadOnlyService:
     """Factory function for dependency injection"""
-    return BondPriceReadOnlyService()
+    return BondPriceReadOnlyService(db)
@@ -4,6 +4,8 @@ from decimal import Decimal
 from typing import Dict, List, Optional, Tuple
 
 from fastapi import HTTPException, status
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy.orm import Session
 from fixed_income.src.api.bond_schema.BondPriceSchema import (
     BondPriceRequest,
     BondPriceResponse
@@ -28,15 +30,15 @@ class BondPriceWriteService:
     Includes validation and cache invalidation.
     """
 
-    def __init__(self):
+    def __init__(self, db: Session):
         self.db_service = GenericDatabaseService(
             model=BondPrice,
             create_schema=BondPriceRequest,
             response_schema=BondPriceResponse,
             update_schema=BondPriceRequest
         )
-        self.bond_read_service = get_bond_read_service()
-        self.price_read_service = get_bond_price_read_service()
+        self.bond_read_service = get_bond_read_service(db)
+        self.price_read_service = get_bond_price_read_service(db)
 
     # === Core Price Operations ===
 
@@ -85,7 +87,7 @@ class BondPriceWriteService:
                     source=source,
                     price_type=price_type
                 )
-                updated_price = await self.db_service.update(existing_price.id, price_data)
+                updated_price = await run_in_threadpool(self.db_service.update, existing_price.id, price_data)
                 logger.info(f"Updated existing price for {bond_type.value} bond {bond_id} at {timestamp}")
             else:
                 # Create new price record
@@ -97,11 +99,11 @@ class BondPriceWriteService:
                     source=source,
                     price_type=price_type
                 )
-                updated_price = await self.db_service.create(price_data)
+                updated_price = await run_in_threadpool(self.db_service.create, price_data)
                 logger.info(f"Created new price for {bond_type.value} bond {bond_id}: {price}")
 
-            # Future: Invalidate caches
-            # await self.price_read_service.invalidate_price_cache(bond_id, bond_type)
+            # Invalidate caches
+            await self.price_read_service.invalidate_price_cache(bond_id, bond_type)
 
             # Update current price in bond table if this is the most recent
             await self._update_bond_current_price_if_latest(bond_id, bond_type, price, timestamp)
@@ -306,7 +308,10 @@ class BondPriceWriteService:
             price_requests.sort(key=lambda x: x.timestamp)
 
             # Bulk create (assuming no duplicates for historical import)
-            results = await self.db_service.bulk_create(price_requests)
+            results = await run_in_threadpool(self.db_service.bulk_create, price_requests)
+
+            # Invalidate caches; imported rows can land inside already cached history windows
+            await self.price_read_service.invalidate_price_cache(bond_id, bond_type)
 
             # Update current price if latest timestamp is most recent
             latest_price = price_requests[-1]
@@ -370,13 +375,13 @@ class BondPriceWriteService:
             deleted_count = 0
             for price in prices_to_delete:
                 try:
-                    await self.db_service.delete(price.id)
+                    await run_in_threadpool(self.db_service.delete, price.id)
                     deleted_count += 1
                 except Exception as e:
                     logger.error(f"Failed to delete price {price.id}: {str(e)}")
 
-            # Future: Invalidate caches
-            # await self.price_read_service.invalidate_price_cache(bond_id, bond_type)
+            # Invalidate caches
+            await self.price_read_service.invalidate_price_cache(bond_id, bond_type)
 
             logger.info(f"Deleted {deleted_count} price records for {bond_type.value} bond {bond_id}")
 
@@ -415,7 +420,7 @@ class BondPriceWriteService:
         """
         try:
             # Get existing price
-            existing_price = await self.db_service.get_by_id(price_id)
+            existing_price = await run_in_threadpool(self.db_service.get_by_id, price_id)
             if not existing_price:
                 raise HTTPException(
                     status_code=status.HTTP_404_NOT_FOUND,
@@ -442,10 +447,12 @@ class BondPriceWriteService:
             )
 
             # Update the price
-            corrected_price_record = await self.db_service.update(price_id, correction_data)
+            corrected_price_record = await run_in_threadpool(self.db_service.update, price_id, correction_data)
 
-            # Future: Invalidate caches
-            # await self.price_read_service.invalidate_price_cache(existing_price.bond_id, BondTypeEnum(existing_price.bond_type))
+            # Invalidate caches
+            await self.price_read_service.invalidate_price_cache(
+                existing_price.bond_id, BondTypeEnum(existing_price.bond_type)
+            )
 
             # Log correction
             logger.info(
@@ -748,6 +755,6 @@ class BondPriceWriteService:
 
 
 # Factory function
-def get_bond_price_write_service() -> BondPriceWriteService:
+def get_bond_price_write_service(db: Session) -> BondPriceWriteService:
     """Factory function for dependency injection"""
-    return BondPriceWriteService()
+    return BondPriceWriteService(db)
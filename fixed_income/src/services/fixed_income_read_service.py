@@ -2,6 +2,9 @@ import datetime
 import logging
 from typing import Any, Dict, List, Optional
 
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy.orm import Session
+
 from fixed_income.src.database.bond_database_service import BondDatabaseService
 from fixed_income.src.model.bonds.BondBase import BondBase
 from fixed_income.src.model.enums import BondTypeEnum
@@ -9,6 +12,28 @@ from fixed_income.src.utils.model_mappers import bond_model_factory, bond_schema
 
 logger = logging.getLogger(__name__)
 
+# BondDatabaseService takes the session per call, so one instance per bond type is shared
+# across requests instead of rebuilding its model introspection and adapters every time.
+_DB_SERVICES: Dict[BondTypeEnum, BondDatabaseService] = {}
+
+
+def get_bond_db_service(bond_type: BondTypeEnum) -> BondDatabaseService:
+    """Get or create the shared database service for a specific bond type"""
+    db_service = _DB_SERVICES.get(bond_type)
+    if db_service is None:
+        model_class = bond_model_factory(bond_type.value)
+        request_schema, response_schema = bond_schema_factory(bond_type.value)
+
+        db_service = _DB_SERVICES.setdefault(bond_type, BondDatabaseService(
+            bond_base_model=BondBase,
+            model=model_class,
+            create_schema=request_schema,
+            response_schema=response_schema,
+            update_schema=request_schema
+        ))
+
+    return db_service
+
 
 class BondReadOnlyService:
     """
@@ -19,24 +44,13 @@ class BondReadOnlyService:
     Optimized for high-performance lookups and bulk operations.
     """
 
-    def __init__(self):
-        self._db_services = {}  # Cache for database services by bond type
+    def __init__(self, db: Session):
+        self.db = db  # Request-scoped session, closed by the get_db dependency
         # Future: self.cache = RedisCache() or MemcachedCache()
 
     def _get_db_service(self, bond_type: BondTypeEnum) -> BondDatabaseService:
-        """Get or create database service for specific bond type"""
-        if bond_type not in self._db_services:
-            model_class = bond_model_factory(bond_type.value)
-            schemas = bond_schema_factory(bond_type.value)
-
-            self._db_services[bond_type] = BondDatabaseService(
-                bond_base_model=BondBase,
-                model=model_class,
-                create_schema=schemas['request'],
-                response_schema=schemas['response']
-            )
-
-        return self._db_services[bond_type]
+        """Get the shared database service for specific bond type"""
+        return get_bond_db_service(bond_type)
 
     # === Core Read Operations ===
 
@@ -50,7 +64,7 @@ class BondReadOnlyService:
             # if cached: return ResponseSchema.parse_raw(cached)
 
             db_service = self._get_db_service(bond_type)
-            bond = await db_service.get_by_id(bond_id)
+            bond = await run_in_threadpool(db_service.get_by_id, self.db, bond_id)
 
             # Future: Cache the result
             # if bond: await self.cache.setex(f"bond:{bond_type.value}:{bond_id}", 3600, bond.json())
@@ -70,7 +84,7 @@ class BondReadOnlyService:
             # if cached: return ResponseSchema.parse_raw(cached)
 
             db_service = self._get_db_service(bond_type)
-            bonds = await db_service.get_by_column("symbol", symbol)
+            bonds = await run_in_threadpool(db_service.get_by_column, self.db, "symbol", symbol)
             bond = bonds[0] if bonds else None
 
             # Future: Cache the result
@@ -88,7 +102,7 @@ class BondReadOnlyService:
         try:
             # Future: Check cache for each ID first, only query missing ones
             db_service = self._get_db_service(bond_type)
-            return await db_service.get_by_ids(bond_ids)
+            return await run_in_threadpool(db_service.get_by_ids, self.db, bond_ids)
         except Exception as e:
             logger.error(f"Error in bulk {bond_type.value} bond retrieval: {str(e)}")
             return []
@@ -99,7 +113,7 @@ class BondReadOnlyService:
         """
         try:
             db_service = self._get_db_service(bond_type)
-            return await db_service.get_by_column("symbol", symbols)
+            return await run_in_threadpool(db_service.get_by_column_values, self.db, "symbol", symbols)
         except Exception as e:
             logger.error(f"Error in bulk symbol retrieval for {bond_type.value}: {str(e)}")
             return []
@@ -115,7 +129,7 @@ class BondReadOnlyService:
         """
         try:
             db_service = self._get_db_service(bond_type)
-            return await db_service.get_all(order_by=order_by, desc=desc)
+            return await run_in_threadpool(db_service.get_all, self.db, order_by=order_by, desc=desc)
         except Exception as e:
             logger.error(f"Error getting all {bond_type.value} bonds: {str(e)}")
             return []
@@ -129,7 +143,7 @@ class BondReadOnlyService:
         try:
             # Future: Cache active bond list with shorter TTL
             db_service = self._get_db_service(bond_type)
-            return await db_service.get_by_column("is_active", True)
+            return await run_in_threadpool(db_service.get_by_column, self.db, "is_active", True)
         except Exception as e:
             logger.error(f"Error getting active {bond_type.value} bonds: {str(e)}")
             return []
@@ -140,7 +154,7 @@ class BondReadOnlyService:
         """
         try:
             db_service = self._get_db_service(bond_type)
-            return await db_service.get_by_column("issuer", issuer)
+            return await run_in_threadpool(db_service.get_by_column, self.db, "issuer", issuer)
         except Exception as e:
             logger.error(f"Error getting {bond_type.value} bonds by issuer {issuer}: {str(e)}")
             return []
@@ -151,7 +165,7 @@ class BondReadOnlyService:
         """
         try:
             db_service = self._get_db_service(bond_type)
-            return await db_service.get_by_column("currency", currency)
+            return await run_in_threadpool(db_service.get_by_column, self.db, "currency", currency)
         except Exception as e:
             logger.error(f"Error getting {bond_type.value} bonds by currency {currency}: {str(e)}")
             return []
@@ -172,7 +186,9 @@ class BondReadOnlyService:
                 SELECT * FROM {bond_type.value.lower()}_bonds 
                 WHERE maturity_date BETWEEN :start_date AND :end_date
             """
-            results = await db_service.execute_raw_query(
+            results = await run_in_threadpool(
+                db_service.execute_raw_query,
+                self.db,
                 query,
                 {"start_date": start_date, "end_date": end_date}
             )
@@ -191,7 +207,7 @@ class BondReadOnlyService:
         try:
             search_columns = ["symbol", "issuer", "description"]
             db_service = self._get_db_service(bond_type)
-            return await db_service.search(search_term, search_columns)
+            return await run_in_threadpool(db_service.search, self.db, search_term, search_columns)
         except Exception as e:
             logger.error(f"Error searching {bond_type.value} bonds with term '{search_term}': {str(e)}")
             return []
@@ -205,7 +221,7 @@ class BondReadOnlyService:
         try:
             # Future: Check cache first for faster validation
             db_service = self._get_db_service(bond_type)
-            return await db_service.exists(bond_id)
+            return await run_in_threadpool(db_service.exists, self.db, bond_id)
         except Exception as e:
             logger.error(f"Error validating {bond_type.value} bond {bond_id}: {str(e)}")
             return False
@@ -251,13 +267,14 @@ class BondReadOnlyService:
 
     # === Statistics and Analytics ===
 
-    async def count_bonds(self, bond_type: BondTypeEnum, **filters) -> int:
+    async def count_bonds(self, bond_type: BondTypeEnum, estimate: bool = False, **filters) -> int:
         """
         Count bonds with optional filters for a specific bond type.
+        Unfiltered counts can use the planner's estimate when exactness is not needed.
         """
         try:
             db_service = self._get_db_service(bond_type)
-            return await db_service.count(**filters)
+            return await run_in_threadpool(db_service.count, self.db, estimate=estimate, **filters)
         except Exception as e:
             logger.error(f"Error counting {bond_type.value} bonds: {str(e)}")
             return 0
@@ -378,6 +395,6 @@ class BondReadOnlyService:
 
 
 # Factory function
-def get_bond_read_service() -> BondReadOnlyService:
+def get_bond_read_service(db: Session) -> BondReadOnlyService:
     """Factory function for dependency injection"""
-    return BondReadOnlyService()
+    return BondReadOnlyService(db)
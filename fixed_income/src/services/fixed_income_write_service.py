@@ -2,12 +2,14 @@ import logging
 from typing import Any, Dict, List, Tuple
 
 from fastapi import HTTPException, status
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy.orm import Session
 
 from fixed_income.src.database.bond_database_service import BondDatabaseService
-from fixed_income.src.model.bonds.BondBase import BondBase
 from fixed_income.src.model.enums import BondTypeEnum
-from fixed_income.src.services.fixed_income_read_service import BondReadOnlyService, get_bond_read_service
-from fixed_income.src.utils.model_mappers import bond_model_factory, bond_schema_factory
+from fixed_income.src.services.fixed_income_read_service import BondReadOnlyService, get_bond_db_service, \
+    get_bond_read_service
+from fixed_income.src.utils.model_mappers import bond_schema_factory
 
 logger = logging.getLogger(__name__)
 
@@ -21,25 +23,13 @@ class BondWriteService:
     Includes cache invalidation hooks for future caching implementation.
     """
 
-    def __init__(self):
-        self._db_services = {}  # Cache for database services by bond type
-        self.read_service: BondReadOnlyService = get_bond_read_service()
+    def __init__(self, db: Session):
+        self.db = db  # Request-scoped session, closed by the get_db dependency
+        self.read_service: BondReadOnlyService = get_bond_read_service(db)
 
     def _get_db_service(self, bond_type: BondTypeEnum) -> BondDatabaseService:
-        """Get or create database service for specific bond type"""
-        if bond_type not in self._db_services:
-            model_class = bond_model_factory(bond_type.value)
-            schemas = bond_schema_factory(bond_type.value)
-
-            self._db_services[bond_type] = BondDatabaseService(
-                bond_base_model=BondBase,
-                model=model_class,
-                create_schema=schemas['request'],
-                response_schema=schemas['response'],
-                update_schema=schemas['request']
-            )
-
-        return self._db_services[bond_type]
+        """Get the shared database service for specific bond type"""
+        return get_bond_db_service(bond_type)
 
     # === Core Write Operations ===
 
@@ -63,7 +53,7 @@ class BondWriteService:
 
             # Create bond
             db_service = self._get_db_service(bond_type)
-            bond_response = await db_service.create(bond_data)
+            bond_response = await run_in_threadpool(db_service.create, self.db, bond_data)
 
             # Future: Invalidate relevant caches
             # await self.read_service.invalidate_cache(bond_response.id, bond_type)
@@ -112,7 +102,7 @@ class BondWriteService:
 
             # Update bond
             db_service = self._get_db_service(bond_type)
-            updated_bond = await db_service.update(bond_id, bond_data)
+            updated_bond = await run_in_threadpool(db_service.update, self.db, bond_id, bond_data)
 
             # Future: Invalidate caches
             # await self.read_service.invalidate_cache(bond_id, bond_type)
@@ -164,7 +154,7 @@ class BondWriteService:
 
             # Partial update
             db_service = self._get_db_service(bond_type)
-            updated_bond = await db_service.partial_update(bond_id, bond_data)
+            updated_bond = await run_in_threadpool(db_service.partial_update, self.db, bond_id, bond_data)
 
             # Future: Invalidate caches
             # await self.read_service.invalidate_cache(bond_id, bond_type)
@@ -203,7 +193,7 @@ class BondWriteService:
 
             # Delete bond
             db_service = self._get_db_service(bond_type)
-            success = await db_service.delete(bond_id)
+            success = await run_in_threadpool(db_service.delete, self.db, bond_id)
 
             if success:
                 # Future: Invalidate caches
@@ -254,7 +244,7 @@ class BondWriteService:
 
             # Bulk create
             db_service = self._get_db_service(bond_type)
-            results = await db_service.bulk_create(validated_requests)
+            results = await run_in_threadpool(db_service.bulk_create, self.db, validated_requests)
 
             # Future: Invalidate relevant caches
             # for bond in results:
@@ -341,8 +331,7 @@ class BondWriteService:
                 )
 
             # Create price update - need to get the appropriate request schema
-            schemas = bond_schema_factory(bond_type.value)
-            request_schema = schemas['request']
+            request_schema, _ = bond_schema_factory(bond_type.value)
 
             # Create minimal update with just price change
             # This assumes the request schema has a current_price field
@@ -411,8 +400,7 @@ class BondWriteService:
                 )
 
             # Create update with is_active = True
-            schemas = bond_schema_factory(bond_type.value)
-            request_schema = schemas['request']
+            request_schema, _ = bond_schema_factory(bond_type.value)
 
             update_data = {}
             for field_name, field_info in request_schema.__fields__.items():
@@ -452,8 +440,7 @@ class BondWriteService:
                 )
 
             # Create update with is_active = False
-            schemas = bond_schema_factory(bond_type.value)
-            request_schema = schemas['request']
+            request_schema, _ = bond_schema_factory(bond_type.value)
 
             update_data = {}
             for field_name, field_info in request_schema.__fields__.items():
@@ -479,23 +466,16 @@ class BondWriteService:
 
     async def bulk_create_mixed_bonds(
             self,
-            bond_requests: List[Tuple[BondTypeEnum, Any]],  # List of (bond_type, bond_data) tuples
+            bond_requests: Dict[BondTypeEnum, List[Any]],  # Bond data grouped by bond type
             user_token: str = None
     ) -> Dict[str, List[Any]]:
         """
-        Create multiple bonds of different types in bulk.
+        Create multiple bonds of different types in bulk, one batch per bond type.
         """
         results = {}
 
-        # Group requests by bond type
-        grouped_requests = {}
-        for bond_type, bond_data in bond_requests:
-            if bond_type not in grouped_requests:
-                grouped_requests[bond_type] = []
-            grouped_requests[bond_type].append(bond_data)
-
         # Process each bond type separately
-        for bond_type, requests in grouped_requests.items():
+        for bond_type, requests in bond_requests.items():
             try:
                 type_results = await self.bulk_create_bonds(requests, bond_type, user_token)
                 results[bond_type.value] = type_results
@@ -513,6 +493,6 @@ class BondWriteService:
 
 
 # Factory function
-def get_bond_write_service() -> BondWriteService:
+def get_bond_write_service(db: Session) -> BondWriteService:
     """Factory function for dependency injection"""
-    return BondWriteService()
+    return BondWriteService(db)
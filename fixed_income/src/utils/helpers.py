@@ -1,4 +1,5 @@
 import math
+from functools import wraps
 
 
 def replace_nan_with_none(d):
@@ -63,3 +64,28 @@ def to_string(data: Dict[str, Any]) -> str:
     except Exception as e:
         logging.error(f"Failed to serialize summary data: {str(e)}")
         return json.dumps({"error": "Could not serialize summary data"})
+
+
+def safe_analytic(label: str):
+    """
+    Decorate an analytics method so that any failure is logged and reported as NaN.
+
+    Args:
+        label: Name of the metric used in the log message (e.g. "Convexity")
+
+    Returns:
+        Decorator wrapping the method in a single try/except
+    """
+
+    def decorator(fn):
+        @wraps(fn)
+        def wrapper(*args, **kwargs):
+            try:
+                return fn(*args, **kwargs)
+            except Exception as e:
+                logging.error(f"{label} calculation failed: {str(e)}")
+                return float('nan')
+
+        return wrapper
+
+    return decorator
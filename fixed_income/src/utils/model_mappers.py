@@ -8,52 +8,39 @@ from fixed_income.src.model.bonds import CallableBondModel, FixedRateBondModel,
     SinkingFundBondModel, ZeroCouponBondModel
 
 
+# Built once at import: bond_type -> (request schema, response schema)
+_SCHEMA_MAPPING = {
+    'FIXED_COUPON': (FixedRateBondRequest, FixedRateBondResponse),
+    'ZERO_COUPON': (ZeroCouponBondRequest, ZeroCouponBondResponse),
+    'CALLABLE': (CallableBondRequest, CallableBondResponse),
+    'PUTABLE': (PutableBondRequest, PutableBondResponse),
+    'FLOATING': (FloatingRateBondRequest, FloatingRateBondResponse),
+    'SINKING_FUND': (SinkingFundBondRequest, SinkingFundBondResponse)
+}
+
+_MODEL_MAPPING = {
+    'FIXED_COUPON': FixedRateBondModel,
+    'ZERO_COUPON': ZeroCouponBondModel,
+    'CALLABLE': CallableBondModel,
+    'PUTABLE': PutableBondModel,
+    'FLOATING': FloatingRateBondModel,
+    'SINKING_FUND': SinkingFundBondModel
+}
+
+SUPPORTED_BOND_TYPES = frozenset(_SCHEMA_MAPPING)
+
+
 def bond_schema_factory(bond_type: str):
-    """Factory function to get the appropriate schema classes for a bond type"""
-    schema_mapping = {
-        'FIXED_COUPON': {
-            'request': FixedRateBondRequest,
-            'response': FixedRateBondResponse
-        },
-        'ZERO_COUPON': {
-            'request': ZeroCouponBondRequest,
-            'response': ZeroCouponBondResponse
-        },
-        'CALLABLE': {
-            'request': CallableBondRequest,
-            'response': CallableBondResponse
-        },
-        'PUTABLE': {
-            'request': PutableBondRequest,
-            'response': PutableBondResponse
-        },
-        'FLOATING': {
-            'request': FloatingRateBondRequest,
-            'response': FloatingRateBondResponse
-        },
-        'SINKING_FUND': {
-            'request': SinkingFundBondRequest,
-            'response': SinkingFundBondResponse
-        }
-    }
-
-    if bond_type not in schema_mapping:
+    """Factory function to get the (request, response) schema classes for a bond type"""
+    schemas = _SCHEMA_MAPPING.get(bond_type)
+    if schemas is None:
         raise ValueError(f"Unsupported bond_type: {bond_type}")
-
-    return schema_mapping[bond_type]
+    return schemas
 
 
 def bond_model_factory(bond_type: str):
     """Factory function to get the appropriate bond model class"""
-    mapping = {
-        'FIXED_COUPON': FixedRateBondModel,
-        'ZERO_COUPON': ZeroCouponBondModel,
-        'CALLABLE': CallableBondModel,
-        'PUTABLE': PutableBondModel,
-        'FLOATING': FloatingRateBondModel,
-        'SINKING_FUND': SinkingFundBondModel
-    }
-    try:
-        return mapping[bond_type]
-    except KeyError:
+    model_class = _MODEL_MAPPING.get(bond_type)
+    if model_class is None:
         raise ValueError(f"Unsupported bond_type: {bond_type}")
+    return model_class
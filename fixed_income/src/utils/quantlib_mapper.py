@@ -1,6 +1,7 @@
 from datetime import date
+from typing import Dict
 
-from QuantLib import Actual360, Actual365Fixed, ActualActual, Business252, Date, DayCounter, Following, \
+from QuantLib import Actual360, Actual365Fixed, ActualActual, Business252, Calendar, Date, DayCounter, Following, \
     HalfMonthModifiedFollowing, ModifiedFollowing, ModifiedPreceding, Nearest, Period, Preceding, Thirty360, \
     Unadjusted, _QuantLib
 from QuantLib import Argentina, Australia, Brazil, Canada, China, France, Germany, HongKong, India, Indonesia, Israel, \
@@ -13,6 +14,84 @@ from fixed_income.src.model.enums.CompoundingEnum import CompoundingEnum
 from fixed_income.src.model.enums.DayCountConventionEnum import DayCountConventionEnum
 from fixed_income.src.model.enums.FrequencyEnum import FrequencyEnum
 
+# Enum -> QuantLib constant tables, built once at import and read by every analytics construction
+_COMPOUNDING_MAPPING = {
+    CompoundingEnum.SIMPLE: 0,
+    CompoundingEnum.COMPOUNDED: 1,
+    CompoundingEnum.CONTINUOUS: 2,
+    CompoundingEnum.SIMPLE_THEN_COMPOUNDED: 3,
+    CompoundingEnum.COMPOUNDED_THEN_SIMPLE: 4,
+}
+
+_FREQUENCY_MAPPING = {
+    FrequencyEnum.NO_FREQUENCY: _QuantLib.NoFrequency,
+    FrequencyEnum.ONCE: _QuantLib.Once,
+    FrequencyEnum.ANNUAL: _QuantLib.Annual,
+    FrequencyEnum.SEMIANNUAL: _QuantLib.Semiannual,
+    FrequencyEnum.QUARTERLY: _QuantLib.Quarterly,
+    FrequencyEnum.MONTHLY: _QuantLib.Monthly,
+    FrequencyEnum.WEEKLY: _QuantLib.Weekly,
+    FrequencyEnum.DAILY: _QuantLib.Daily,
+    FrequencyEnum.OTHER_FREQUENCY: _QuantLib.OtherFrequency,
+}
+
+_BUSINESS_DAY_CONVENTION_MAPPING = {
+    BusinessDayConventionEnum.FOLLOWING: Following,
+    BusinessDayConventionEnum.MODIFIED_FOLLOWING: ModifiedFollowing,
+    BusinessDayConventionEnum.PRECEDING: Preceding,
+    BusinessDayConventionEnum.MODIFIED_PRECEDING: ModifiedPreceding,
+    BusinessDayConventionEnum.UNADJUSTED: Unadjusted,
+    BusinessDayConventionEnum.HALF_MONTH_MODIFIED_FOLLOWING: HalfMonthModifiedFollowing,
+    BusinessDayConventionEnum.NEAREST: Nearest,
+}
+
+# QuantLib calendars and day counters are immutable, so one instance per enum value is shared by all
+# bonds. Each is constructed on first use only.
+_CALENDAR_FACTORIES = {
+    CalendarEnum.TARGET: TARGET,
+    CalendarEnum.NULL_CALENDAR: NullCalendar,
+
+    # United States
+    CalendarEnum.US_SETTLEMENT: lambda: UnitedStates(UnitedStates.Settlement),
+    CalendarEnum.US_GOVERNMENT_BOND: lambda: UnitedStates(UnitedStates.GovernmentBond),
+    CalendarEnum.US_NYSE: lambda: UnitedStates(UnitedStates.NYSE),
+    CalendarEnum.US_FEDERAL_RESERVE: lambda: UnitedStates(UnitedStates.FederalReserve),
+
+    # United Kingdom
+    CalendarEnum.UK_EXCHANGE: lambda: UnitedKingdom(UnitedKingdom.Exchange),
+    CalendarEnum.UK_SETTLEMENT: lambda: UnitedKingdom(UnitedKingdom.Settlement),
+    CalendarEnum.UK_METALS: lambda: UnitedKingdom(UnitedKingdom.Metals),
+
+    # Germany
+    CalendarEnum.GERMANY_FRANKFURT_STOCK_EXCHANGE: lambda: Germany(Germany.FrankfurtStockExchange),
+    CalendarEnum.GERMANY_EUREX: lambda: Germany(Germany.Eurex),
+    CalendarEnum.GERMANY_SETTLEMENT: lambda: Germany(Germany.Settlement),
+
+    # Others (single variant)
+    CalendarEnum.JAPAN: Japan,
+    CalendarEnum.FRANCE: France,
+    CalendarEnum.SWITZERLAND: Switzerland,
+    CalendarEnum.CANADA: Canada,
+    CalendarEnum.MEXICO: Mexico,
+    CalendarEnum.CHINA: China,
+    CalendarEnum.HONG_KONG: HongKong,
+    CalendarEnum.SINGAPORE: Singapore,
+    CalendarEnum.SOUTH_KOREA: SouthKorea,
+    CalendarEnum.INDIA: India,
+    CalendarEnum.INDONESIA: Indonesia,
+    CalendarEnum.THAILAND: Thailand,
+    CalendarEnum.AUSTRALIA: Australia,
+    CalendarEnum.NEW_ZEALAND: NewZealand,
+    CalendarEnum.SAUDI_ARABIA: SaudiArabia,
+    CalendarEnum.ISRAEL: Israel,
+    CalendarEnum.BRAZIL: Brazil,
+    CalendarEnum.ARGENTINA: Argentina,
+    CalendarEnum.SOUTH_AFRICA: SouthAfrica,
+}
+
+_CALENDAR_CACHE: Dict[CalendarEnum, Calendar] = {}
+_DAY_COUNT_CACHE: Dict[DayCountConventionEnum, DayCounter] = {}
+
 
 def to_ql_date(d: date | Date) -> Date:
     if isinstance(d, Date):
@@ -27,6 +106,13 @@ def from_ql_date(d: Date | date) -> date:
 
 
 def to_ql_day_count(convention: DayCountConventionEnum) -> DayCounter:
+    day_counter = _DAY_COUNT_CACHE.get(convention)
+    if day_counter is None:
+        day_counter = _DAY_COUNT_CACHE.setdefault(convention, _build_day_count(convention))
+    return day_counter
+
+
+def _build_day_count(convention: DayCountConventionEnum) -> DayCounter:
     if convention == DayCountConventionEnum.ACTUAL_ACTUAL:
         return ActualActual(ActualActual.ISDA)
     elif convention in (DayCountConventionEnum.ACTUAL_360, DayCountConventionEnum.ACT360):
@@ -46,91 +132,25 @@ def to_ql_day_count(convention: DayCountConventionEnum) -> DayCounter:
 
 
 def to_ql_compounding(compounding_enum: CompoundingEnum) -> int:
-    mapping = {
-        CompoundingEnum.SIMPLE: 0,
-        CompoundingEnum.COMPOUNDED: 1,
-        CompoundingEnum.CONTINUOUS: 2,
-        CompoundingEnum.SIMPLE_THEN_COMPOUNDED: 3,
-        CompoundingEnum.COMPOUNDED_THEN_SIMPLE: 4,
-    }
-    return mapping[compounding_enum]
+    return _COMPOUNDING_MAPPING[compounding_enum]
 
 
 def to_ql_frequency(freq_enum: FrequencyEnum) -> Period:
-    mapping = {
-        FrequencyEnum.NO_FREQUENCY: _QuantLib.NoFrequency,
-        FrequencyEnum.ONCE: _QuantLib.Once,
-        FrequencyEnum.ANNUAL: _QuantLib.Annual,
-        FrequencyEnum.SEMIANNUAL: _QuantLib.Semiannual,
-        FrequencyEnum.QUARTERLY: _QuantLib.Quarterly,
-        FrequencyEnum.MONTHLY: _QuantLib.Monthly,
-        FrequencyEnum.WEEKLY: _QuantLib.Weekly,
-        FrequencyEnum.DAILY: _QuantLib.Daily,
-        FrequencyEnum.OTHER_FREQUENCY: _QuantLib.OtherFrequency,
-    }
-    return mapping[freq_enum]
+    return _FREQUENCY_MAPPING[freq_enum]
 
 
 def to_ql_calendar(calendar_enum: CalendarEnum):
-    mapping = {
-        CalendarEnum.TARGET: TARGET(),
-        CalendarEnum.NULL_CALENDAR: NullCalendar(),
-
-        # United States
-        CalendarEnum.US_SETTLEMENT: UnitedStates(UnitedStates.Settlement),
-        CalendarEnum.US_GOVERNMENT_BOND: UnitedStates(UnitedStates.GovernmentBond),
-        CalendarEnum.US_NYSE: UnitedStates(UnitedStates.NYSE),
-        CalendarEnum.US_FEDERAL_RESERVE: UnitedStates(UnitedStates.FederalReserve),
-
-        # United Kingdom
-        CalendarEnum.UK_EXCHANGE: UnitedKingdom(UnitedKingdom.Exchange),
-        CalendarEnum.UK_SETTLEMENT: UnitedKingdom(UnitedKingdom.Settlement),
-        CalendarEnum.UK_METALS: UnitedKingdom(UnitedKingdom.Metals),
-
-        # Germany
-        CalendarEnum.GERMANY_FRANKFURT_STOCK_EXCHANGE: Germany(Germany.FrankfurtStockExchange),
-        CalendarEnum.GERMANY_EUREX: Germany(Germany.Eurex),
-        CalendarEnum.GERMANY_SETTLEMENT: Germany(Germany.Settlement),
-
-        # Others (single variant)
-        CalendarEnum.JAPAN: Japan(),
-        CalendarEnum.FRANCE: France(),
-        CalendarEnum.SWITZERLAND: Switzerland(),
-        CalendarEnum.CANADA: Canada(),
-        CalendarEnum.MEXICO: Mexico(),
-        CalendarEnum.CHINA: China(),
-        CalendarEnum.HONG_KONG: HongKong(),
-        CalendarEnum.SINGAPORE: Singapore(),
-        CalendarEnum.SOUTH_KOREA: SouthKorea(),
-        CalendarEnum.INDIA: India(),
-        CalendarEnum.INDONESIA: Indonesia(),
-        CalendarEnum.THAILAND: Thailand(),
-        CalendarEnum.AUSTRALIA: Australia(),
-        CalendarEnum.NEW_ZEALAND: NewZealand(),
-        CalendarEnum.SAUDI_ARABIA: SaudiArabia(),
-        CalendarEnum.ISRAEL: Israel(),
-        CalendarEnum.BRAZIL: Brazil(),
-        CalendarEnum.ARGENTINA: Argentina(),
-        CalendarEnum.SOUTH_AFRICA: SouthAfrica(),
-    }
-
-    try:
-        return mapping[calendar_enum]
-    except KeyError:
-        raise ValueError(f"Unsupported CalendarEnum: {calendar_enum}")
+    calendar = _CALENDAR_CACHE.get(calendar_enum)
+    if calendar is None:
+        factory = _CALENDAR_FACTORIES.get(calendar_enum)
+        if factory is None:
+            raise ValueError(f"Unsupported CalendarEnum: {calendar_enum}")
+        calendar = _CALENDAR_CACHE.setdefault(calendar_enum, factory())
+    return calendar
 
 
 def to_ql_business_day_convention(convention_enum: BusinessDayConventionEnum):
-    mapping = {
-        BusinessDayConventionEnum.FOLLOWING: Following,
-        BusinessDayConventionEnum.MODIFIED_FOLLOWING: ModifiedFollowing,
-        BusinessDayConventionEnum.PRECEDING: Preceding,
-        BusinessDayConventionEnum.MODIFIED_PRECEDING: ModifiedPreceding,
-        BusinessDayConventionEnum.UNADJUSTED: Unadjusted,
-        BusinessDayConventionEnum.HALF_MONTH_MODIFIED_FOLLOWING: HalfMonthModifiedFollowing,
-        BusinessDayConventionEnum.NEAREST: Nearest,
-    }
-    try:
-        return mapping[convention_enum]
-    except KeyError:
+    convention = _BUSINESS_DAY_CONVENTION_MAPPING.get(convention_enum)
+    if convention is None:
         raise ValueError(f"Unsupported CalendarEnum: {convention_enum}")
+    return convention
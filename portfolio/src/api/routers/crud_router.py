@@ -222,7 +222,7 @@ class PortfolioGenericRouter(Generic[ModelType, CreateSchemaType, ResponseSchema
                 detail=f"{self.model.__name__} not found.",
             )
         try:
-            update_data = updated_item.model_dump(exclude_unset=True, exclude_defaults=True)
+            update_data = updated_item.model_dump(exclude_unset=True)
             for key, value in update_data.items():
                 setattr(item, key, value)
             db.commit()